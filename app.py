@@ -11,37 +11,88 @@ st.set_page_config(
     layout="wide"
 )
 
-import json
-import pandas as pd
-import plotly.express as px
+import time
 import traceback
-from utils.resume_analyzer import ResumeAnalyzer
-from utils.resume_builder import ResumeBuilder
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data, 
+    get_database_connection, save_resume_data, 
     init_database, verify_admin, log_admin_action
 )
 from config.job_roles import JOB_ROLES
 from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
-from dashboard.dashboard import DashboardManager
-import requests
-from streamlit_lottie import st_lottie # type: ignore
-import plotly.graph_objects as go
 import base64
 import io
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from feedback.feedback import FeedbackManager
 from ui_components import (
     apply_modern_styles, hero_section, feature_card, about_section, 
     page_header, render_analytics_section, render_activity_section, 
     render_suggestions_section
 )
 from datetime import datetime
-from jobs.job_search import render_job_search
-from PIL import Image
-import nltk
+
+# Heavy modules (pandas, plotly, python-docx, PDF extraction, requests) are
+# imported inside the pages that use them so a cold start only pays for the
+# page being shown. benchmarks/startup_budget.py keeps it that way.
+
+# Number of recent rerun timings kept for the admin sidebar
+RERUN_TIMING_WINDOW = 50
+
+# Seconds between reruns while an upload waits in the analysis queue
+JOB_POLL_INTERVAL = 1
+
+
+@st.cache_resource
+def get_resume_analyzer():
+    """Create the ResumeAnalyzer once per server process"""
+    from utils.resume_analyzer import ResumeAnalyzer
+    return ResumeAnalyzer()
+
+
+@st.cache_resource
+def get_resume_builder():
+    """Create the ResumeBuilder once per server process"""
+    from utils.resume_builder import ResumeBuilder
+    return ResumeBuilder()
+
+
+@st.cache_resource
+def get_dashboard_manager():
+    """Create the DashboardManager once per server process"""
+    from dashboard.dashboard import DashboardManager
+    return DashboardManager()
+
+
+@st.cache_resource
+def start_analysis_workers():
+    """Start this server's background analysis workers once per process"""
+    from utils.analysis_worker import start_background_workers
+    return start_background_workers()
+
+
+@st.cache_resource
+def setup_database():
+    """Create tables and run migrations once per server process"""
+    init_database()
+    return True
+
+
+@st.cache_data
+def load_css(path):
+    """Read a stylesheet once instead of on every rerun"""
+    with open(path) as f:
+        return f.read()
+
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def fetch_lottie(url):
+    """Download a Lottie animation, cached so reruns don't hit the network"""
+    import requests
+    try:
+        r = requests.get(url, timeout=5)
+    except Exception as e:
+        print(f"Error loading Lottie animation: {str(e)}")
+        return None
+    if r.status_code != 200:
+        return None
+    return r.json()
 
 class ResumeApp:
     def __init__(self):
@@ -85,11 +136,6 @@ class ResumeApp:
             "ℹ️ ABOUT": self.render_about
         }
         
-        # Initialize dashboard manager
-        self.dashboard_manager = DashboardManager()
-        
-        self.analyzer = ResumeAnalyzer()
-        self.builder = ResumeBuilder()
         self.job_roles = JOB_ROLES
         
         # Initialize session state
@@ -99,11 +145,10 @@ class ResumeApp:
             st.session_state.selected_role = None
         
         # Initialize database
-        init_database()
+        setup_database()
         
         # Load external CSS
-        with open('style/style.css') as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        st.markdown(f'<style>{load_css("style/style.css")}</style>', unsafe_allow_html=True)
         
         # Load Google Fonts
         st.markdown("""
@@ -111,12 +156,29 @@ class ResumeApp:
             <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
         """, unsafe_allow_html=True)
 
+    @property
+    def analyzer(self):
+        return get_resume_analyzer()
+
+    @property
+    def builder(self):
+        return get_resume_builder()
+
+    @property
+    def dashboard_manager(self):
+        return get_dashboard_manager()
+
     def load_lottie_url(self, url: str):
         """Load Lottie animation from URL"""
-        r = requests.get(url)
-        if r.status_code != 200:
-            return None
-        return r.json()
+        return fetch_lottie(url)
+
+    def record_rerun_time(self, started):
+        """Keep the last few rerun durations for the admin sidebar"""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timings = st.session_state.setdefault('rerun_timings', [])
+        timings.append(elapsed_ms)
+        del timings[:-RERUN_TIMING_WINDOW]
+        return elapsed_ms
 
     def apply_global_styles(self):
         st.markdown("""
@@ -830,6 +892,8 @@ class ResumeApp:
         """
         
         try:
+            import pandas as pd
+            
             # Read data into DataFrame
             df = pd.read_sql_query(query, conn)
             
@@ -842,8 +906,6 @@ class ResumeApp:
         except Exception as e:
             print(f"Error exporting to Excel: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     def render_dashboard(self):
         """Render the dashboard page"""
@@ -871,10 +933,8 @@ class ResumeApp:
         if uploaded_file is not None:
             try:
                 # Extract text from resume
-                if uploaded_file.type == "application/pdf":
-                    resume_text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                else:
-                    resume_text = self.analyzer.extract_text_from_docx(uploaded_file)
+                from utils.text_extraction import get_text_extractor
+                resume_text = get_text_extractor().extract_text(uploaded_file)
                 
                 # Store resume data
                 st.session_state.resume_data = {
@@ -1594,6 +1654,78 @@ With my passion for software development and machine learning, I built this plat
             </div>
         """, unsafe_allow_html=True)
     
+    def analyze_uploaded_resume(self, uploaded_file, selected_category, selected_role, role_info, job_description=None):
+        """Return the analysis of an uploaded resume, or None while it is still queued.
+
+        Uploads are analyzed and saved by background workers draining the
+        analysis job queue; this run only enqueues the upload and polls for
+        its result, rerunning the page until the job finishes.
+        """
+        from utils.analysis_cache import get_analysis_cache
+        from utils.incremental_analysis import AnalysisState
+        from utils.job_queue import enqueue, get_job, queue_position
+        from utils.text_extraction import sniff_format
+        cache = get_analysis_cache()
+        payload = uploaded_file.getvalue()
+        cache_key = cache.make_key(
+            payload, selected_category, selected_role,
+            job_description=job_description
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # Same file, same target role: nothing to extract, analyze or save again
+            return cached['analysis']
+        
+        start_analysis_workers()
+        jobs = st.session_state.setdefault('analysis_jobs', {})
+        if cache_key not in jobs:
+            # The file's own magic bytes decide its format, not the browser's MIME type
+            try:
+                file_type = sniff_format(payload)
+            except ValueError as e:
+                st.error(str(e))
+                return None
+            job_requirements = dict(role_info, job_description=job_description) if job_description else role_info
+            try:
+                # The user's previous AnalysisState lets the worker rescan
+                # only the lines and sections that changed
+                jobs[cache_key] = enqueue(
+                    cache_key, payload, file_type,
+                    {'category': selected_category, 'role': selected_role, 'job_requirements': job_requirements},
+                    st.session_state.get('analysis_state') or AnalysisState()
+                )
+            except Exception as e:
+                st.error(f"Error queueing file for analysis: {str(e)}")
+                return None
+        
+        job = get_job(jobs[cache_key])
+        if job is None or job['status'] == 'failed':
+            jobs.pop(cache_key, None)
+            st.error(f"Error analyzing file: {job['error'] if job else 'the analysis job was lost'}")
+            return None
+        
+        if job['status'] == 'done':
+            jobs.pop(cache_key, None)
+            state = job['state']
+            if state is not None:
+                st.session_state.analysis_state = state
+                if state.reused_sections:
+                    st.caption(f"♻️ Reused analysis of unchanged sections: {', '.join(sorted(state.reused_sections))}")
+            cached = cache.get(cache_key)
+            if cached is None:
+                st.error("Error loading the finished analysis")
+                return None
+            if cached['resume_id'] is not None:
+                st.success("Resume data saved successfully!")
+            return cached['analysis']
+        
+        if job['status'] == 'queued' and job['attempts'] == 0:
+            st.info(f"⏳ Your resume is in the queue ({queue_position(job['id'])} ahead of it)")
+        else:
+            st.info("⏳ Analyzing your resume...")
+        time.sleep(JOB_POLL_INTERVAL)
+        st.rerun()
+
     def render_analyzer(self):
         """Render the resume analyzer page"""
         apply_modern_styles()
@@ -1694,67 +1826,23 @@ With my passion for software development and machine learning, I built this plat
         </div>
         """, unsafe_allow_html=True)
         
+        # Optional job description to compare against
+        job_description = st.text_area(
+            "Job Description (optional)",
+            placeholder="Paste a job posting to see how closely your resume matches it...",
+            height=150
+        ).strip()
+        
         # File Upload
         uploaded_file = st.file_uploader("Upload your resume", type=['pdf', 'docx'])
         
         if uploaded_file:
             with st.spinner("Analyzing your document..."):
-                # Get file content
-                text = ""
-                try:
-                    if uploaded_file.type == "application/pdf":
-                        text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                    elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                        text = self.analyzer.extract_text_from_docx(uploaded_file)
-                    else:
-                        text = uploaded_file.getvalue().decode()
-                except Exception as e:
-                    st.error(f"Error reading file: {str(e)}")
+                analysis = self.analyze_uploaded_resume(
+                    uploaded_file, selected_category, selected_role, role_info, job_description or None
+                )
+                if analysis is None:
                     return
-
-                
-                # Analyze the document
-                analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
-                
-                # Save resume data to database
-                resume_data = {
-                    'personal_info': {
-                        'name': analysis.get('name', ''),
-                        'email': analysis.get('email', ''),
-                        'phone': analysis.get('phone', ''),
-                        'linkedin': analysis.get('linkedin', ''),
-                        'github': analysis.get('github', ''),
-                        'portfolio': analysis.get('portfolio', '')
-                    },
-                    'summary': analysis.get('summary', ''),
-                    'target_role': selected_role,
-                    'target_category': selected_category,
-                    'education': analysis.get('education', []),
-                    'experience': analysis.get('experience', []),
-                    'projects': analysis.get('projects', []),
-                    'skills': analysis.get('skills', []),
-                    'template': ''
-                }
-                
-                # Save to database
-                try:
-                    resume_id = save_resume_data(resume_data)
-                    
-                    # Save analysis data
-                    analysis_data = {
-                        'resume_id': resume_id,
-                        'ats_score': analysis['ats_score'],
-                        'keyword_match_score': analysis['keyword_match']['score'],
-                        'format_score': analysis['format_score'],
-                        'section_score': analysis['section_score'],
-                        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                        'recommendations': ','.join(analysis['suggestions'])
-                    }
-                    save_analysis_data(resume_id, analysis_data)
-                    st.success("Resume data saved successfully!")
-                except Exception as e:
-                    st.error(f"Error saving to database: {str(e)}")
-                    print(f"Database error: {e}")
                 
                 # Show results based on document type
                 if analysis.get('document_type') != 'resume':
@@ -1840,12 +1928,44 @@ With my passion for software development and machine learning, I built this plat
                     
                     st.metric("Keyword Match", f"{int(analysis.get('keyword_match', {}).get('score', 0))}%")
                     
+                    if analysis['keyword_match'].get('inferred_skills'):
+                        st.markdown("#### Covered by Related Skills:")
+                        for skill in analysis['keyword_match']['inferred_skills']:
+                            st.markdown(f"- {skill} (partial credit)")
+                    
                     if analysis['keyword_match']['missing_skills']:
                         st.markdown("#### Missing Skills:")
                         for skill in analysis['keyword_match']['missing_skills']:
                             st.markdown(f"- {skill}")
                     
+                    if analysis.get('jd_match'):
+                        st.metric("Job Description Match", f"{analysis['jd_match']['score']:.0f}%")
+                        if analysis['jd_match']['missing_terms']:
+                            st.markdown("#### Terms from the job description to consider:")
+                            st.markdown(', '.join(analysis['jd_match']['missing_terms']))
+                    
                     st.markdown("</div>", unsafe_allow_html=True)
+                    
+                    # Best Matching Roles Card
+                    if analysis.get('role_matches'):
+                        st.markdown("""
+                        <div style="
+                            background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
+                            border: 1px solid rgba(99, 102, 241, 0.2);
+                            border-radius: 24px;
+                            padding: 2rem;
+                            margin: 1rem 0;
+                            backdrop-filter: blur(10px);
+                            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.2);
+                        ">
+                            <h2>🎯 Best Matching Roles</h2>
+                        """, unsafe_allow_html=True)
+                        
+                        for match in analysis['role_matches']:
+                            st.markdown(f"**{match['role']}** · {match['category']}")
+                            st.progress(int(match['score']) / 100, text=f"{match['score']:.0f}% skills match")
+                        
+                        st.markdown("</div>", unsafe_allow_html=True)
                 
                 with col2:
                     # Format Score Card
@@ -1864,6 +1984,8 @@ With my passion for software development and machine learning, I built this plat
                     
                     st.metric("Format Score", f"{int(analysis.get('format_score', 0))}%")
                     st.metric("Section Score", f"{int(analysis.get('section_score', 0))}%")
+                    if analysis.get('experience_years'):
+                        st.metric("Total Experience", f"{analysis['experience_years']:g} years")
                     
                     st.markdown("</div>", unsafe_allow_html=True)
                     
@@ -2259,6 +2381,7 @@ With my passion for software development and machine learning, I built this plat
         """, unsafe_allow_html=True)
 
         # Initialize feedback manager
+        from feedback.feedback import FeedbackManager
         feedback_manager = FeedbackManager()
         
         # Create tabs for form and statistics
@@ -2339,11 +2462,16 @@ With my passion for software development and machine learning, I built this plat
 
     def main(self):
         """Main application entry point"""
+        from streamlit_lottie import st_lottie # type: ignore
+        
+        started = time.perf_counter()
         self.apply_global_styles()
         
         # Admin login/logout in sidebar
         with st.sidebar:
-            st_lottie(self.load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json"), height=200, key="sidebar_animation")
+            animation = self.load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json")
+            if animation:
+                st_lottie(animation, height=200, key="sidebar_animation")
             st.title("AI-Powered Resume Intelligence System")
             st.markdown("---")
             
@@ -2373,6 +2501,14 @@ With my passion for software development and machine learning, I built this plat
         else:
             # Default to home page if invalid page
             self.render_home()
+        
+        elapsed_ms = self.record_rerun_time(started)
+        if st.session_state.is_admin:
+            timings = sorted(st.session_state.rerun_timings)
+            st.sidebar.caption(
+                f"⏱ Rerun {elapsed_ms:.0f} ms · median {timings[len(timings) // 2]:.0f} ms "
+                f"over {len(timings)} reruns"
+            )
     
 if __name__ == "__main__":
     app = ResumeApp()
@@ -0,0 +1,223 @@
+"""
+Seeded generator of synthetic resumes for the benchmarks.
+
+Every resume starts as ResumeBuilder input data, so the same resume can be
+rendered as plain text, as a DOCX through ResumeBuilder's templates, or as
+a plain single-font PDF. The same seed always yields the same corpus.
+
+Usage: python -m benchmarks.corpus OUT_DIR [--count 20] [--seed 0] [--length 3]
+       [--sections summary experience projects education skills] [--formats txt docx pdf]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+
+from config.skills import SKILLS
+
+SECTIONS = ('summary', 'experience', 'projects', 'education', 'skills')
+TEMPLATES = ('Modern', 'Professional', 'Minimal', 'Creative')
+
+FIRST_NAMES = ['Aarav', 'Maya', 'Liam', 'Sofia', 'Noah', 'Priya', 'Ethan', 'Chloe', 'Arjun', 'Zara', 'Lucas', 'Mei']
+LAST_NAMES = ['Sharma', 'Nguyen', 'Garcia', 'Okafor', 'Schmidt', 'Patel', 'Kim', 'Rossi', 'Haddad', 'Silva']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech', 'Hooli', 'Vandelay']
+POSITIONS = ['Software Engineer', 'Data Scientist', 'Backend Developer', 'Frontend Developer', 'DevOps Engineer',
+             'Product Analyst', 'Machine Learning Engineer', 'QA Engineer', 'Full Stack Developer']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University']
+DEGREES = ['Bachelor of Science', 'Bachelor of Technology', 'Master of Science', 'Master of Engineering']
+FIELDS = ['Computer Science', 'Information Technology', 'Electrical Engineering', 'Statistics']
+VERBS = ['Developed', 'Designed', 'Led', 'Implemented', 'Optimized', 'Automated', 'Migrated', 'Built', 'Improved']
+OBJECTS = ['a data pipeline', 'REST APIs', 'the CI/CD workflow', 'a reporting dashboard', 'the search service',
+           'an internal admin tool', 'the payment integration', 'monitoring and alerting', 'a recommendation model']
+RESULTS = ['reducing latency by {n}%', 'serving {n}k daily users', 'cutting costs by {n}%',
+           'improving test coverage to {n}%', 'saving {n} hours per week']
+SOFT_SKILLS = ['Communication', 'Leadership', 'Teamwork', 'Problem Solving', 'Mentoring', 'Time Management']
+LANGUAGES = ['English', 'Hindi', 'Spanish', 'German', 'French', 'Mandarin']
+SKILL_NAMES = sorted(SKILLS)
+
+
+def _bullet(rng):
+    result = rng.choice(RESULTS).format(n=rng.randint(10, 90))
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILL_NAMES)}, {result}"
+
+
+def generate_resume_data(rng, length=3, sections=SECTIONS):
+    """Return ResumeBuilder input for one random resume.
+
+    length scales the number of jobs, projects and bullets; sections picks
+    which optional sections are included.
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    skills = rng.sample(SKILL_NAMES, min(len(SKILL_NAMES), 4 + 2 * length))
+    year = 2024
+    experience = []
+    for _ in range(length if 'experience' in sections else 0):
+        start = year - rng.randint(1, 4)
+        experience.append({
+            'position': rng.choice(POSITIONS),
+            'company': rng.choice(COMPANIES),
+            'start_date': str(start),
+            'end_date': 'Present' if year == 2024 else str(year),
+            'description': f"Worked on {rng.choice(OBJECTS)} for a team of {rng.randint(3, 12)} engineers.",
+            'responsibilities': [_bullet(rng) for _ in range(2 + length)],
+            'achievements': [_bullet(rng)]
+        })
+        year = start
+    return {
+        'template': rng.choice(TEMPLATES),
+        'personal_info': {
+            'full_name': f"{first} {last}",
+            'title': rng.choice(POSITIONS),
+            'email': f"{first.lower()}.{last.lower()}@example.com",
+            'phone': f"555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            'location': 'Springfield',
+            'linkedin': f"linkedin.com/in/{first.lower()}{last.lower()}",
+            'portfolio': f"{first.lower()}{last.lower()}.dev"
+        },
+        'summary': ' '.join(_bullet(rng) + '.' for _ in range(2)) if 'summary' in sections else '',
+        'experience': experience,
+        'projects': [
+            {
+                'name': f"{rng.choice(['Project', 'Open source', 'Side project'])} {index + 1}",
+                'technologies': ', '.join(rng.sample(skills, 3)),
+                'description': _bullet(rng),
+                'responsibilities': [_bullet(rng) for _ in range(2)],
+                'achievements': [],
+                'link': ''
+            }
+            for index in range(max(1, length // 2) if 'projects' in sections else 0)
+        ],
+        'education': [
+            {
+                'school': rng.choice(SCHOOLS),
+                'degree': rng.choice(DEGREES),
+                'field': rng.choice(FIELDS),
+                'graduation_date': str(year - 1),
+                'gpa': f"{rng.uniform(3.0, 4.0):.1f}",
+                'achievements': []
+            }
+        ] if 'education' in sections else [],
+        'skills': {
+            'technical': skills[:len(skills) // 2],
+            'tools': skills[len(skills) // 2:],
+            'soft': rng.sample(SOFT_SKILLS, 3),
+            'languages': rng.sample(LANGUAGES, 2)
+        } if 'skills' in sections else {}
+    }
+
+
+def resume_text(data):
+    """Render resume data as plain text with the usual section headings"""
+    info = data['personal_info']
+    lines = [info['full_name'], info['title'], f"{info['email']} | {info['phone']} | {info['linkedin']}", '']
+    if data['summary']:
+        lines += ['PROFESSIONAL SUMMARY', data['summary'], '']
+    if data['experience']:
+        lines.append('WORK EXPERIENCE')
+        for exp in data['experience']:
+            lines.append(f"{exp['position']} at {exp['company']} ({exp['start_date']} - {exp['end_date']})")
+            lines.append(exp['description'])
+            lines += [f"- {item}" for item in exp['responsibilities'] + exp['achievements']]
+        lines.append('')
+    if data['projects']:
+        lines.append('PROJECTS')
+        for project in data['projects']:
+            lines.append(f"{project['name']} | {project['technologies']}")
+            lines += [f"- {item}" for item in [project['description']] + project['responsibilities']]
+        lines.append('')
+    if data['education']:
+        lines.append('EDUCATION')
+        for edu in data['education']:
+            lines.append(f"{edu['degree']} in {edu['field']}, {edu['school']} ({edu['graduation_date']})")
+            lines.append(f"GPA: {edu['gpa']}")
+        lines.append('')
+    if data['skills']:
+        lines.append('SKILLS')
+        lines += [f"{category.title()}: {', '.join(items)}" for category, items in data['skills'].items()]
+    return '\n'.join(lines)
+
+
+def resume_docx(data):
+    """Render resume data through its ResumeBuilder template and return the DOCX bytes"""
+    from utils.resume_builder import ResumeBuilder
+    # ResumeBuilder logs every step to stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ResumeBuilder().generate_resume(data).getvalue()
+
+
+def _pdf_escape(line):
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def resume_pdf(text, lines_per_page=50):
+    """Render text as a minimal Helvetica PDF, lines_per_page lines per page"""
+    lines = text.split('\n') or ['']
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    page_count = len(pages)
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and its content stream per page
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        ('<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            ' '.join(f'{4 + 2 * i} 0 R' for i in range(page_count)), page_count
+        )).encode('ascii'),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>'
+    ]
+    for index, page in enumerate(pages):
+        content = ['BT', '/F1 10 Tf', '12 TL', '50 780 Td']
+        content += [f'({_pdf_escape(line)}) Tj T*' for line in page]
+        content.append('ET')
+        stream = '\n'.join(content).encode('latin-1')
+        objects.append((
+            '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * index} 0 R >>'
+        ).encode('ascii'))
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def generate_corpus(count, seed=0, length=3, sections=SECTIONS):
+    """Return count resume data dicts, identical for the same arguments"""
+    rng = random.Random(seed)
+    return [generate_resume_data(rng, length, sections) for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus")
+    parser.add_argument('out_dir', help="Directory to write the resumes to")
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--length', type=int, default=3, help="Jobs per resume; also scales bullets and projects")
+    parser.add_argument('--sections', nargs='+', choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument('--formats', nargs='+', choices=('txt', 'docx', 'pdf'), default=['txt', 'docx', 'pdf'])
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for index, data in enumerate(generate_corpus(args.count, args.seed, args.length, args.sections)):
+        text = resume_text(data)
+        rendered = {
+            'txt': lambda: text.encode('utf-8'),
+            'docx': lambda: resume_docx(data),
+            'pdf': lambda: resume_pdf(text)
+        }
+        for fmt in args.formats:
+            with open(os.path.join(args.out_dir, f"resume_{index:04d}.{fmt}"), 'wb') as f:
+                f.write(rendered[fmt]())
+    print(f"Wrote {args.count} resumes to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
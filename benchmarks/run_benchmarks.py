@@ -0,0 +1,196 @@
+"""
+Throughput and memory benchmarks for the analysis pipeline.
+
+Runs every stage over a synthetic corpus from benchmarks.corpus and reports
+the median and p95 time per document, documents per second and the peak
+memory allocated by a single document. Results are compared against a JSON
+baseline, and the run fails when a stage got slower or hungrier than the
+baseline by more than the threshold.
+
+Usage: python -m benchmarks.run_benchmarks [--count 20] [--length 3] [--repeat 3]
+       [--stages analyze_resume ...] [--baseline benchmarks/baseline.json]
+       [--save-baseline] [--threshold 0.25]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.corpus import generate_corpus, resume_docx, resume_pdf, resume_text
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+STAGES = (
+    'extract_pdf', 'extract_docx', 'analyze_resume', 'analytics_analyze', 'analytics_analyze_many',
+    'nlp_single', 'nlp_pipe', 'generate_resume'
+)
+
+# Metrics compared against the baseline; larger is worse for all of them
+COMPARED_METRICS = ('median_ms', 'peak_kb')
+
+
+def _target_role():
+    from config.job_roles import JOB_ROLES
+    return next(iter(next(iter(JOB_ROLES.values())).values()))
+
+
+def build_stages(corpus, names):
+    """Return {stage: (function, inputs, docs_per_input)} for the requested stages that can run here.
+
+    Batched stages take a whole batch of documents as one input.
+    """
+    from utils.resume_analyzer import ResumeAnalyzer
+    analyzer = ResumeAnalyzer()
+    texts = [resume_text(data) for data in corpus]
+    stages = {}
+
+    if 'extract_pdf' in names:
+        stages['extract_pdf'] = (analyzer.extract_text_from_pdf, [resume_pdf(text) for text in texts], 1)
+    if 'extract_docx' in names:
+        docx_files = [resume_docx(data) for data in corpus]
+        stages['extract_docx'] = (lambda data: analyzer.extract_text_from_docx(io.BytesIO(data)), docx_files, 1)
+    if 'analyze_resume' in names:
+        role = _target_role()
+        stages['analyze_resume'] = (lambda text: analyzer.analyze_resume({'raw_text': text}, role), texts, 1)
+    spacy_stages = [name for name in names if name.startswith(('analytics_', 'nlp_'))]
+    if spacy_stages:
+        try:
+            from resume_analytics.analyzer import ResumeAnalyzer as AnalyticsAnalyzer
+            from resume_analytics.nlp import get_nlp, BATCH_SIZE
+            nlp = get_nlp()
+            analytics = AnalyticsAnalyzer(nlp)
+            # The same texts one nlp() call at a time, then in nlp.pipe batches
+            if 'analytics_analyze' in names:
+                stages['analytics_analyze'] = (analytics.analyze_resume, texts, 1)
+            if 'analytics_analyze_many' in names:
+                stages['analytics_analyze_many'] = (analytics.analyze_many, [texts], len(texts))
+            if 'nlp_single' in names:
+                stages['nlp_single'] = (nlp, texts, 1)
+            if 'nlp_pipe' in names:
+                stages['nlp_pipe'] = (lambda batch: list(nlp.pipe(batch, batch_size=BATCH_SIZE)), [texts], len(texts))
+        except Exception as e:
+            print(f"Skipping {', '.join(spacy_stages)}: {str(e)}")
+    if 'generate_resume' in names:
+        from utils.resume_builder import ResumeBuilder
+        builder = ResumeBuilder()
+
+        def generate(data):
+            # ResumeBuilder logs every step to stdout
+            with contextlib.redirect_stdout(io.StringIO()):
+                return builder.generate_resume(data)
+        stages['generate_resume'] = (generate, corpus, 1)
+    return stages
+
+
+def measure(function, inputs, repeat, docs_per_input=1):
+    """Time function over every input repeat times, then measure its peak memory.
+
+    Times are reported per document, so batched stages whose inputs hold
+    docs_per_input documents compare with unbatched ones; the peak memory
+    is that of one input, the whole batch for batched stages.
+    """
+    function(inputs[0])  # Warm caches and lazy imports
+
+    # Best of the repeats per document, which filters out scheduler noise
+    timings = [float('inf')] * len(inputs)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for index, item in enumerate(inputs):
+            call_started = time.perf_counter()
+            function(item)
+            timings[index] = min(timings[index], (time.perf_counter() - call_started) * 1000 / docs_per_input)
+    elapsed = time.perf_counter() - started
+
+    # Separate pass: tracing allocations slows everything down
+    peak = 0
+    tracemalloc.start()
+    try:
+        for item in inputs:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            function(item)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'docs_per_sec': round(len(inputs) * docs_per_input * repeat / elapsed, 1),
+        'median_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        'peak_kb': round(peak / 1024, 1)
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return a message for every metric that regressed past the threshold"""
+    regressions = []
+    for stage, metrics in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous:
+            continue
+        for metric in COMPARED_METRICS:
+            if previous.get(metric) and metrics[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    f"{stage} {metric}: {metrics[metric]} vs baseline {previous[metric]} "
+                    f"(+{(metrics[metric] / previous[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the analysis pipeline on a synthetic corpus")
+    parser.add_argument('--count', type=int, default=20, help="Resumes in the corpus")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--length', type=int, default=3, help="Jobs per resume; also scales bullets and projects")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed passes over the corpus")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="Write these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown or memory growth over the baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    corpus = generate_corpus(args.count, args.seed, args.length)
+    results = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'corpus': {'count': args.count, 'seed': args.seed, 'length': args.length},
+        'stages': {}
+    }
+    stages = build_stages(corpus, args.stages)
+    print(f"{'stage':<24}{'docs/s':>10}{'median ms':>12}{'p95 ms':>10}{'peak KB':>10}")
+    for stage, (function, inputs, docs_per_input) in stages.items():
+        metrics = results['stages'][stage] = measure(function, inputs, args.repeat, docs_per_input)
+        print(f"{stage:<24}{metrics['docs_per_sec']:>10}{metrics['median_ms']:>12}"
+              f"{metrics['p95_ms']:>10}{metrics['peak_kb']:>10}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('corpus') != results['corpus']:
+        print(f"Baseline corpus {baseline.get('corpus')} differs from this run's {results['corpus']}")
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"FAIL: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Benchmark the single-pass section segmenter against the old per-extractor scans.
+
+Usage: python -m benchmarks.segmenter_benchmark
+"""
+import timeit
+
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.section_segmenter import SECTION_KEYWORDS
+
+PAGE = """JOHN DOE
+john.doe@example.com | 555-123-4567 | linkedin.com/in/johndoe
+
+PROFESSIONAL SUMMARY
+Backend engineer with a focus on data pipelines, APIs and distributed systems.
+
+WORK EXPERIENCE
+Senior Software Engineer, Acme Corp (2019 - Present)
+• Developed a streaming ingestion service handling 2M events per day
+• Led a team of five engineers and improved deployment frequency
+
+Software Engineer, Globex (2016 - 2019)
+- Implemented REST APIs in Python and Django
+- Designed PostgreSQL schemas and reporting jobs
+
+PROJECTS
+Resume Analyzer - NLP pipeline for parsing and scoring resumes
+Budget Tracker - React and Node.js personal finance application
+
+EDUCATION
+B.Tech in Computer Science, State University (2012 - 2016)
+CGPA: 8.7
+
+TECHNICAL SKILLS
+Python, Java, SQL, Docker, Kubernetes, AWS, React, Git
+"""
+
+
+def legacy_extract(analyzer, text, keywords):
+    """Reference copy of the per-section scan every extract_* method used to run"""
+    entries = []
+    in_section = False
+    current_entry = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if any(keyword.lower() in line.lower() for keyword in keywords):
+            if not any(keyword.lower() == line.lower() for keyword in keywords):
+                current_entry.append(line)
+            in_section = True
+            continue
+        if in_section:
+            if line and any(keyword.lower() in line.lower() for keyword in analyzer.document_types['resume']):
+                if not any(key.lower() in line.lower() for key in keywords):
+                    in_section = False
+                    if current_entry:
+                        entries.append(' '.join(current_entry))
+                        current_entry = []
+                    continue
+            if line:
+                current_entry.append(line)
+            elif current_entry:
+                entries.append(' '.join(current_entry))
+                current_entry = []
+    if current_entry:
+        entries.append(' '.join(current_entry))
+    return entries
+
+
+def legacy_all_sections(analyzer, text):
+    return {section: legacy_extract(analyzer, text, keywords)
+            for section, keywords in SECTION_KEYWORDS.items()}
+
+
+def main(repeat=20):
+    analyzer = ResumeAnalyzer()
+    for pages in (2, 20):
+        text = PAGE * pages
+        assert legacy_all_sections(analyzer, text) == analyzer.segment_sections(text)
+
+        legacy = min(timeit.repeat(lambda: legacy_all_sections(analyzer, text), number=1, repeat=repeat))
+        single = min(timeit.repeat(lambda: analyzer.segment_sections(text), number=1, repeat=repeat))
+        print(f"{pages:>3} pages: legacy {legacy * 1000:8.2f} ms | "
+              f"single-pass {single * 1000:8.2f} ms | speedup {legacy / single:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Cold-start and rerun budget for app.py.
+
+Imports app.py under `python -X importtime` in a fresh interpreter and fails
+when startup pulls in a module that should only load on demand, or when
+app.py's own import time (excluding Streamlit itself) exceeds the budget.
+With --reruns it also drives the app through streamlit.testing and reports
+the first-run and warm-rerun times.
+
+Usage: python -m benchmarks.startup_budget [--budget-ms 400] [--runs 3] [--reruns 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Read by app.py relative to the working directory
+ASSET_DIRS = ('style', 'assets')
+
+# Loaded by the pages that need them, never at startup
+LAZY_MODULES = (
+    'pandas', 'plotly', 'docx', 'PIL', 'nltk', 'requests', 'streamlit_lottie',
+    'PyPDF2', 'sklearn', 'spacy', 'sqlalchemy', 'openpyxl',
+)
+
+
+def parse_importtime(stderr):
+    """Return [(depth, module, self_us, cumulative_us)] from -X importtime output"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def imported_outside(entries, owner):
+    """Module names imported at startup other than by owner's own imports"""
+    # importtime prints a module after everything it imported, one level deeper
+    modules = set()
+    owned_depth = None
+    for index in range(len(entries) - 1, -1, -1):
+        depth, name = entries[index][:2]
+        if owned_depth is not None and depth <= owned_depth:
+            owned_depth = None
+        if name == owner:
+            owned_depth = depth
+        elif owned_depth is None:
+            modules.add(name)
+    return modules
+
+
+def measure_import(module='app'):
+    """Import module in a fresh interpreter and return its importtime table"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_reruns(reruns):
+    """Return (first_run_ms, [rerun_ms, ...]) using Streamlit's app test harness"""
+    from streamlit.testing.v1 import AppTest
+
+    # Run from a scratch directory so the databases the app creates next to
+    # its working directory never land in the repository
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='startup_budget_') as workdir:
+        for name in ASSET_DIRS:
+            os.symlink(os.path.join(ROOT, name), os.path.join(workdir, name))
+        os.chdir(workdir)
+        try:
+            app = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=60)
+            started = time.perf_counter()
+            app.run()
+            first_ms = (time.perf_counter() - started) * 1000
+
+            timings = []
+            for _ in range(reruns):
+                started = time.perf_counter()
+                app.run()
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            os.chdir(previous_cwd)
+    return first_ms, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check app.py startup against its budget")
+    parser.add_argument('--budget-ms', type=float, default=400.0,
+                        help="Max import time of app.py excluding streamlit")
+    parser.add_argument('--runs', type=int, default=3, help="Fresh interpreters to sample (best is used)")
+    parser.add_argument('--reruns', type=int, default=0, help="Also time this many warm reruns")
+    parser.add_argument('--top', type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args(argv)
+
+    samples = [measure_import() for _ in range(max(args.runs, 1))]
+    entries = min(samples, key=lambda e: max(entry[3] for entry in e))
+    cumulative = {name: cumulative_us for _, name, _, cumulative_us in entries}
+
+    app_us = cumulative.get('app', 0)
+    streamlit_us = cumulative.get('streamlit', 0)
+    own_ms = (app_us - streamlit_us) / 1000
+
+    print(f"app.py import: {app_us / 1000:.1f} ms total, "
+          f"{streamlit_us / 1000:.1f} ms streamlit, {own_ms:.1f} ms app")
+    print("Slowest imports (cumulative):")
+    # Direct imports of app.py, which is what a regression would show up in
+    slowest = sorted(
+        ((cumulative_us, name) for depth, name, _, cumulative_us in entries if depth == 1),
+        reverse=True
+    )
+    for cumulative_us, name in slowest[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    # Streamlit's own dependencies are out of our hands
+    imported = imported_outside(entries, 'streamlit')
+    eager = sorted({name.split('.')[0] for name in imported} & set(LAZY_MODULES))
+    if eager:
+        failures.append(f"imported at startup but should be lazy: {', '.join(eager)}")
+    if own_ms > args.budget_ms:
+        failures.append(f"app import took {own_ms:.1f} ms, budget is {args.budget_ms:.1f} ms")
+
+    if args.reruns:
+        first_ms, timings = measure_reruns(args.reruns)
+        print(f"First run: {first_ms:.1f} ms")
+        print(f"Warm rerun: median {statistics.median(timings):.1f} ms, max {max(timings):.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
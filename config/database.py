@@ -1,10 +1,13 @@
-import sqlite3
+import ast
 from datetime import datetime
+from config.db_pool import get_pool
+from config.migrations import run_migrations
+from config.metrics import record_resume, record_analysis, rebuild_daily_metrics, check_daily_metrics
+from utils.skill_registry import get_skill_registry
 
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
-    return conn
+    """Return this thread's pooled database connection (do not close it)"""
+    return get_pool().connect()
 
 def init_database():
     """Initialize database tables"""
@@ -72,6 +75,15 @@ def init_database():
     )
     ''')
     
+    # Create analysis_cache table
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS analysis_cache (
+        cache_key TEXT PRIMARY KEY,
+        payload TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    
     # Create admin table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS admin (
@@ -83,7 +95,93 @@ def init_database():
     ''')
     
     conn.commit()
-    conn.close()
+    
+    # Bring existing databases up to the current schema
+    run_migrations(conn)
+
+def categorize_skill(skill):
+    """Return the dashboard category for a normalized skill name"""
+    return get_skill_registry().category(skill)
+
+def normalize_skills(skills):
+    """Return unique canonical skill keys from a list, dict of lists or stored string"""
+    if isinstance(skills, str):
+        try:
+            skills = ast.literal_eval(skills)
+        except (ValueError, SyntaxError):
+            skills = skills.split(',')
+    if isinstance(skills, dict):
+        skills = [skill for values in skills.values() for skill in (values or [])]
+    
+    registry = get_skill_registry()
+    normalized = []
+    seen = set()
+    for skill in skills or []:
+        # "JS", "Javascript" and "javascript es6" all become "javascript"
+        name = registry.normalize(skill)
+        if name and name not in seen:
+            seen.add(name)
+            normalized.append(name)
+    return normalized
+
+def _insert_resume_skills(cursor, resume_id, skills):
+    """Insert one resume_skills row per normalized skill"""
+    cursor.executemany('''
+    INSERT INTO resume_skills (resume_id, skill_name, skill_category)
+    VALUES (?, ?, ?)
+    ''', [(resume_id, skill, categorize_skill(skill)) for skill in normalize_skills(skills)])
+
+def _insert_resume_data(cursor, data):
+    """Insert one resume_data row and return its id"""
+    personal_info = data.get('personal_info', {})
+    
+    cursor.execute('''
+    INSERT INTO resume_data (
+        name, email, phone, linkedin, github, portfolio,
+        summary, target_role, target_category, education, 
+        experience, projects, skills, template
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        str(data.get('education', [])),
+        str(data.get('experience', [])),
+        str(data.get('projects', [])),
+        str(data.get('skills', [])),
+        data.get('template', '')
+    ))
+    resume_id = cursor.lastrowid
+    _insert_resume_skills(cursor, resume_id, data.get('skills', []))
+    record_resume(cursor, resume_id)
+    return resume_id
+
+def _insert_analysis_data(cursor, resume_id, analysis):
+    """Insert one resume_analysis row and fold it into the daily rollup"""
+    ats_score = float(analysis.get('ats_score', 0))
+    keyword_score = float(analysis.get('keyword_match_score', 0))
+    cursor.execute('''
+    INSERT INTO resume_analysis (
+        resume_id, ats_score, keyword_match_score,
+        format_score, section_score, missing_skills,
+        recommendations
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        resume_id,
+        ats_score,
+        keyword_score,
+        float(analysis.get('format_score', 0)),
+        float(analysis.get('section_score', 0)),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', '')
+    ))
+    record_analysis(cursor, resume_id, ats_score, keyword_score)
 
 def save_resume_data(data):
     """Save resume data to database"""
@@ -91,39 +189,13 @@ def save_resume_data(data):
     cursor = conn.cursor()
     
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
-        
+        resume_id = _insert_resume_data(cursor, data)
         conn.commit()
-        return cursor.lastrowid
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
         return None
-    finally:
-        conn.close()
 
 def save_analysis_data(resume_id, analysis):
     """Save resume analysis data"""
@@ -131,28 +203,79 @@ def save_analysis_data(resume_id, analysis):
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
-        
+        _insert_analysis_data(cursor, resume_id, analysis)
         conn.commit()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
         conn.rollback()
-    finally:
-        conn.close()
+
+def save_resume_batch(records):
+    """Save many (resume_data, analysis_data) pairs in a single transaction"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        resume_ids = []
+        for data, analysis in records:
+            resume_id = _insert_resume_data(cursor, data)
+            _insert_analysis_data(cursor, resume_id, analysis)
+            resume_ids.append(resume_id)
+        conn.commit()
+        return resume_ids
+    except Exception as e:
+        print(f"Error saving resume batch: {str(e)}")
+        conn.rollback()
+        return []
+
+def backfill_resume_skills(batch_size=1000):
+    """Populate resume_skills for resumes saved before skills were normalized"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    backfilled = 0
+    last_id = 0
+    
+    try:
+        while True:
+            cursor.execute('''
+            SELECT id, skills FROM resume_data rd
+            WHERE skills IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM resume_skills rs WHERE rs.resume_id = rd.id)
+              AND id > ?
+            ORDER BY id
+            LIMIT ?
+            ''', (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            for resume_id, skills in rows:
+                _insert_resume_skills(cursor, resume_id, skills)
+            conn.commit()
+            backfilled += len(rows)
+            last_id = rows[-1][0]
+        return backfilled
+    except Exception as e:
+        print(f"Error backfilling resume skills: {str(e)}")
+        conn.rollback()
+        return backfilled
+
+def rebuild_metrics():
+    """Recompute the daily_metrics rollup from the raw tables"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        rebuild_daily_metrics(cursor)
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"Error rebuilding daily metrics: {str(e)}")
+        conn.rollback()
+        return False
+
+def check_metrics():
+    """Return rollup rows that disagree with the raw tables"""
+    conn = get_database_connection()
+    return check_daily_metrics(conn.cursor())
 
 def get_resume_stats():
     """Get statistics about resumes"""
@@ -185,8 +308,6 @@ def get_resume_stats():
     except Exception as e:
         print(f"Error getting resume stats: {str(e)}")
         return None
-    finally:
-        conn.close()
 
 def log_admin_action(admin_email, action):
     """Log admin login/logout actions"""
@@ -201,8 +322,7 @@ def log_admin_action(admin_email, action):
         conn.commit()
     except Exception as e:
         print(f"Error logging admin action: {str(e)}")
-    finally:
-        conn.close()
+        conn.rollback()
 
 def get_admin_logs():
     """Get all admin login/logout logs"""
@@ -219,8 +339,6 @@ def get_admin_logs():
     except Exception as e:
         print(f"Error getting admin logs: {str(e)}")
         return []
-    finally:
-        conn.close()
 
 def get_all_resume_data():
     """Get all resume data for admin dashboard"""
@@ -253,8 +371,6 @@ def get_all_resume_data():
     except Exception as e:
         print(f"Error getting resume data: {str(e)}")
         return []
-    finally:
-        conn.close()
 
 def verify_admin(email, password):
     """Verify admin credentials"""
@@ -268,8 +384,6 @@ def verify_admin(email, password):
     except Exception as e:
         print(f"Error verifying admin: {str(e)}")
         return False
-    finally:
-        conn.close()
 
 def add_admin(email, password):
     """Add a new admin"""
@@ -282,6 +396,5 @@ def add_admin(email, password):
         return True
     except Exception as e:
         print(f"Error adding admin: {str(e)}")
+        conn.rollback()
         return False
-    finally:
-        conn.close()
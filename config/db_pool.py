@@ -0,0 +1,111 @@
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+
+DEFAULT_DB_PATH = 'resume_data.db'
+
+# Applied once when a connection is opened
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",        # Readers no longer block the writer
+    "PRAGMA synchronous=NORMAL",      # Safe with WAL, far fewer fsyncs
+    "PRAGMA cache_size=-16000",       # 16 MB page cache per connection
+    "PRAGMA mmap_size=268435456",     # Memory-map up to 256 MB of the file
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+class _ConnectionHolder:
+    """Owns one thread's connection; dropped with the thread's locals on exit"""
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+
+
+class ConnectionPool:
+    """Hand out one long-lived SQLite connection per thread.
+
+    Connections are opened lazily, tuned once with PRAGMAS and then reused,
+    so their compiled-statement cache survives between calls. sqlite3
+    connections must not be shared across threads, which is why the pool
+    keys them on the calling thread instead of sharing a single connection.
+
+    A connection is closed as soon as its thread exits: the thread-local
+    holder is released by the exiting thread itself, and a finalizer on it
+    closes the connection there. Streamlit runs every rerun on a new thread,
+    so only connections of live threads stay open.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, timeout=30.0, cached_statements=256):
+        self.db_path = db_path
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = set()  # Open connections of live threads
+
+    def connect(self):
+        """Return the calling thread's connection, opening it on first use"""
+        holder = getattr(self.local, 'holder', None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.timeout,  # Wait on a busy database instead of failing
+                cached_statements=self.cached_statements
+            )
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            holder = _ConnectionHolder(conn)
+            # Connections are in reference cycles, so without this they would
+            # stay open until the next garbage collection
+            weakref.finalize(holder, self._release, conn).atexit = False
+            with self.lock:
+                self.connections.add(conn)
+            self.local.holder = holder
+        return holder.conn
+
+    def _release(self, conn):
+        """Close a connection whose thread has exited"""
+        with self.lock:
+            self.connections.discard(conn)
+        try:
+            conn.close()
+        except sqlite3.ProgrammingError:
+            pass
+
+    @contextmanager
+    def transaction(self):
+        """Yield the thread's connection, committing on success and rolling back on error"""
+        conn = self.connect()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def close_all(self):
+        """Close every connection handed out by this pool"""
+        with self.lock:
+            connections, self.connections = self.connections, set()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Connections owned by other threads can only be closed there
+                pass
+        self.local = threading.local()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path=DEFAULT_DB_PATH):
+    """Return the process-wide pool for a database file"""
+    with _pools_lock:
+        if db_path not in _pools:
+            _pools[db_path] = ConnectionPool(db_path)
+        return _pools[db_path]
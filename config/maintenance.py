@@ -0,0 +1,83 @@
+"""
+Database maintenance commands.
+
+Usage:
+    python -m config.maintenance migrate
+    python -m config.maintenance backfill-skills
+    python -m config.maintenance rebuild-metrics
+    python -m config.maintenance check-metrics
+    python -m config.maintenance purge-cache [--max-age-days 30] [--max-rows 20000]
+"""
+import argparse
+import sys
+
+from config.database import init_database, backfill_resume_skills, rebuild_metrics, check_metrics
+
+
+def migrate_command(args):
+    init_database()
+    print("Database schema is up to date")
+    return 0
+
+
+def backfill_skills_command(args):
+    init_database()
+    count = backfill_resume_skills(batch_size=args.batch_size)
+    print(f"Backfilled skills for {count} resumes")
+    return 0
+
+
+def rebuild_metrics_command(args):
+    init_database()
+    if not rebuild_metrics():
+        return 1
+    print("Rebuilt daily_metrics from resume_data and resume_analysis")
+    return 0
+
+
+def check_metrics_command(args):
+    init_database()
+    mismatches = check_metrics()
+    for mismatch in mismatches:
+        print(f"{mismatch['day']} {mismatch['category']}: "
+              f"expected {mismatch['expected']}, found {mismatch['actual']}")
+    if mismatches:
+        print(f"{len(mismatches)} rollup rows are inconsistent; run rebuild-metrics to repair")
+        return 1
+    print("daily_metrics is consistent with the raw tables")
+    return 0
+
+
+def purge_cache_command(args):
+    from utils.analysis_cache import get_analysis_cache
+    init_database()
+    count = get_analysis_cache().purge(args.max_age_days, args.max_rows)
+    print(f"Deleted {count} cached analyses")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resume database maintenance")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('migrate', help="Create tables and apply pending migrations").set_defaults(func=migrate_command)
+
+    backfill = subparsers.add_parser('backfill-skills', help="Populate resume_skills for existing resumes")
+    backfill.add_argument('--batch-size', type=int, default=1000, help="Resumes per transaction")
+    backfill.set_defaults(func=backfill_skills_command)
+
+    subparsers.add_parser('rebuild-metrics', help="Recompute the daily_metrics rollup").set_defaults(func=rebuild_metrics_command)
+    subparsers.add_parser('check-metrics', help="Verify daily_metrics against the raw tables").set_defaults(func=check_metrics_command)
+
+    from utils.analysis_cache import MAX_AGE_DAYS, MAX_ROWS
+    purge = subparsers.add_parser('purge-cache', help="Delete old analysis cache entries")
+    purge.add_argument('--max-age-days', type=int, default=MAX_AGE_DAYS, help="Drop entries older than this")
+    purge.add_argument('--max-rows', type=int, default=MAX_ROWS, help="Keep at most this many newest entries")
+    purge.set_defaults(func=purge_cache_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Pre-aggregated daily_metrics rollup for the admin dashboard.
+
+One row per (day, category) holds the resume and analysis counts, score
+sums and the number of high-scoring analyses. Resumes count whether or not
+they were analyzed, so builder-saved ones are included. The resume and
+analysis saves keep the rollup up to date in the same transaction, so the
+dashboard reads O(days) rows instead of re-aggregating every resume on each
+render.
+"""
+
+# ATS score at or above which a resume counts as high scoring
+HIGH_SCORE_THRESHOLD = 70
+
+# Aggregate of the raw tables, shared by rebuild and the consistency check
+RAW_DAILY_METRICS_QUERY = f'''
+    SELECT
+        DATE(rd.created_at) as day,
+        COALESCE(rd.target_category, 'Other') as category,
+        COUNT(ra.id) as analysis_count,
+        COALESCE(SUM(ra.ats_score), 0) as ats_score_sum,
+        COALESCE(SUM(ra.keyword_match_score), 0) as keyword_score_sum,
+        SUM(CASE WHEN ra.ats_score >= {HIGH_SCORE_THRESHOLD} THEN 1 ELSE 0 END) as high_score_count,
+        COUNT(DISTINCT rd.id) as resume_count
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON ra.resume_id = rd.id
+    GROUP BY day, category
+'''
+
+
+def create_daily_metrics_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS daily_metrics (
+        day TEXT NOT NULL,
+        category TEXT NOT NULL,
+        analysis_count INTEGER NOT NULL DEFAULT 0,
+        ats_score_sum REAL NOT NULL DEFAULT 0,
+        keyword_score_sum REAL NOT NULL DEFAULT 0,
+        high_score_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, category)
+    )
+    ''')
+
+
+def record_resume(cursor, resume_id):
+    """Add one saved resume to its (day, category) rollup row"""
+    cursor.execute('''
+    INSERT INTO daily_metrics (day, category, resume_count)
+    SELECT DATE(created_at), COALESCE(target_category, 'Other'), 1
+    FROM resume_data
+    WHERE id = ?
+    ON CONFLICT (day, category) DO UPDATE SET
+        resume_count = resume_count + excluded.resume_count
+    ''', (resume_id,))
+
+
+def record_analysis(cursor, resume_id, ats_score, keyword_score):
+    """Add one analysis to its resume's (day, category) rollup row"""
+    cursor.execute('''
+    INSERT INTO daily_metrics (
+        day, category, analysis_count, ats_score_sum,
+        keyword_score_sum, high_score_count
+    )
+    SELECT DATE(created_at), COALESCE(target_category, 'Other'), 1, ?, ?, ?
+    FROM resume_data
+    WHERE id = ?
+    ON CONFLICT (day, category) DO UPDATE SET
+        analysis_count = analysis_count + excluded.analysis_count,
+        ats_score_sum = ats_score_sum + excluded.ats_score_sum,
+        keyword_score_sum = keyword_score_sum + excluded.keyword_score_sum,
+        high_score_count = high_score_count + excluded.high_score_count
+    ''', (ats_score, keyword_score, 1 if ats_score >= HIGH_SCORE_THRESHOLD else 0, resume_id))
+
+
+def rebuild_daily_metrics(cursor):
+    """Recompute the whole rollup from resume_data and resume_analysis"""
+    cursor.execute('DELETE FROM daily_metrics')
+    cursor.execute(f'''
+    INSERT INTO daily_metrics (
+        day, category, analysis_count, ats_score_sum,
+        keyword_score_sum, high_score_count, resume_count
+    )
+    {RAW_DAILY_METRICS_QUERY}
+    ''')
+
+
+def check_daily_metrics(cursor, tolerance=1e-6):
+    """Compare the rollup with the raw tables and return a list of mismatches"""
+    cursor.execute(RAW_DAILY_METRICS_QUERY)
+    expected = {(row[0], row[1]): row[2:] for row in cursor.fetchall()}
+    cursor.execute('''
+    SELECT day, category, analysis_count, ats_score_sum,
+           keyword_score_sum, high_score_count, resume_count
+    FROM daily_metrics
+    ''')
+    actual = {(row[0], row[1]): row[2:] for row in cursor.fetchall()}
+
+    mismatches = []
+    for key in sorted(set(expected) | set(actual), key=lambda k: (k[0] or '', k[1])):
+        want = expected.get(key, (0, 0, 0, 0, 0))
+        got = actual.get(key, (0, 0, 0, 0, 0))
+        if any(abs((w or 0) - (g or 0)) > tolerance for w, g in zip(want, got)):
+            mismatches.append({'day': key[0], 'category': key[1], 'expected': want, 'actual': got})
+    return mismatches
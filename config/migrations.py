@@ -0,0 +1,214 @@
+"""
+Versioned schema migrations for resume_data.db.
+
+init_database() creates the baseline tables; everything after that is an
+ordered migration recorded in the schema_version table, so existing
+databases are upgraded in place exactly once.
+"""
+from config.metrics import HIGH_SCORE_THRESHOLD, create_daily_metrics_table, rebuild_daily_metrics
+from utils.skill_registry import get_skill_registry
+
+
+def _add_dashboard_indexes(cursor):
+    """Index the columns the admin dashboard filters, joins and sorts on"""
+    # Date-range filters and ORDER BY created_at DESC listings
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)')
+    # Per-category grouping
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_category ON resume_data (target_category)')
+    # Join on resume_id, covering the scores the dashboard aggregates
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume
+    ON resume_analysis (resume_id, ats_score, keyword_match_score)
+    ''')
+    # Week-over-week comparisons on analysis time
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_analysis_created_at
+    ON resume_analysis (created_at, ats_score)
+    ''')
+    # High-scoring counts (ats_score >= 70)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_analysis_ats ON resume_analysis (ats_score)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_admin_logs_timestamp ON admin_logs (timestamp)')
+
+
+def _add_skill_indexes(cursor):
+    """Index resume_skills for the skill analytics GROUP BY queries"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_resume ON resume_skills (resume_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_name ON resume_skills (skill_name)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_category ON resume_skills (skill_category)')
+
+
+def _add_daily_metrics(cursor):
+    """Create the dashboard rollup table and fill it from existing analyses"""
+    create_daily_metrics_table(cursor)
+    # The rollup as it was at this version; migration 10 adds resume_count
+    cursor.execute(f'''
+    INSERT INTO daily_metrics (
+        day, category, analysis_count, ats_score_sum,
+        keyword_score_sum, high_score_count
+    )
+    SELECT
+        DATE(rd.created_at),
+        COALESCE(rd.target_category, 'Other'),
+        COUNT(*),
+        COALESCE(SUM(ra.ats_score), 0),
+        COALESCE(SUM(ra.keyword_match_score), 0),
+        SUM(CASE WHEN ra.ats_score >= {HIGH_SCORE_THRESHOLD} THEN 1 ELSE 0 END)
+    FROM resume_analysis ra
+    JOIN resume_data rd ON rd.id = ra.resume_id
+    GROUP BY 1, 2
+    ''')
+
+
+def _canonicalize_resume_skills(cursor):
+    """Rewrite stored skill names to registry keys and merge the duplicates"""
+    registry = get_skill_registry()
+    cursor.execute('SELECT DISTINCT skill_name FROM resume_skills')
+    updates = []
+    for (name,) in cursor.fetchall():
+        updates.append((registry.normalize(name), registry.category(name), name))
+    cursor.executemany(
+        'UPDATE resume_skills SET skill_name = ?, skill_category = ? WHERE skill_name = ?',
+        updates
+    )
+    # Aliases of one skill on the same resume collapse into a single row
+    cursor.execute('''
+    DELETE FROM resume_skills
+    WHERE id NOT IN (
+        SELECT MIN(id) FROM resume_skills GROUP BY resume_id, skill_name
+    )
+    ''')
+
+
+def _binary_analysis_cache(cursor):
+    """Keep resume ids beside the binary AnalysisResult cache payloads"""
+    cursor.execute('ALTER TABLE analysis_cache ADD COLUMN resume_id INTEGER')
+    # Old JSON payloads belong to an older analyzer version and can't be decoded
+    cursor.execute('DELETE FROM analysis_cache')
+
+
+def _add_analysis_timings(cursor):
+    """Create the per-analysis stage timing table read by the dashboard"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS analysis_timings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_type TEXT,
+        document_type TEXT,
+        size_bytes INTEGER,
+        page_count INTEGER,
+        text_chars INTEGER,
+        total_ms REAL NOT NULL,
+        stages TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_analysis_timings_created_at ON analysis_timings (created_at)')
+
+
+def _add_analysis_jobs(cursor):
+    """Create the durable analysis job queue (times are Unix timestamps)"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS analysis_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        cache_key TEXT NOT NULL,
+        status TEXT NOT NULL,
+        document BLOB,
+        file_type TEXT NOT NULL,
+        params TEXT NOT NULL,
+        state BLOB,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL,
+        worker_id TEXT,
+        lease_until REAL,
+        available_at REAL NOT NULL,
+        error TEXT,
+        resume_id INTEGER,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    ''')
+    # Leasing scans pending jobs in id order
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status ON analysis_jobs (status, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_analysis_jobs_cache_key ON analysis_jobs (cache_key)')
+
+
+def _index_analysis_cache_age(cursor):
+    """Index analysis_cache by age for the size and age bound"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_analysis_cache_created_at ON analysis_cache (created_at)')
+
+
+def _json_job_state(cursor):
+    """Drop job states stored as pickles; they are JSON from now on"""
+    cursor.execute("UPDATE analysis_jobs SET state = NULL WHERE typeof(state) = 'blob'")
+
+
+def _add_resume_counts(cursor):
+    """Count every saved resume in daily_metrics, analyzed or not"""
+    cursor.execute('ALTER TABLE daily_metrics ADD COLUMN resume_count INTEGER NOT NULL DEFAULT 0')
+    rebuild_daily_metrics(cursor)
+
+
+def _index_daily_metrics_category(cursor):
+    """Cover the dashboard's per-category and all-time rollup sums"""
+    # Leaving out keyword_score_sum keeps the index narrower than the table,
+    # so the all-time totals read it instead of the table
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_daily_metrics_category
+    ON daily_metrics (category, day, resume_count, analysis_count, ats_score_sum, high_score_count)
+    ''')
+
+
+# (version, description, function) in the order they must be applied
+MIGRATIONS = [
+    (1, "Add dashboard indexes", _add_dashboard_indexes),
+    (2, "Add resume_skills indexes", _add_skill_indexes),
+    (3, "Add daily_metrics rollup", _add_daily_metrics),
+    (4, "Canonicalize resume_skills names", _canonicalize_resume_skills),
+    (5, "Store analysis cache payloads in binary form", _binary_analysis_cache),
+    (6, "Add analysis_timings table", _add_analysis_timings),
+    (7, "Add analysis_jobs queue", _add_analysis_jobs),
+    (8, "Index analysis_cache by age", _index_analysis_cache_age),
+    (9, "Store analysis job state as JSON", _json_job_state),
+    (10, "Add resume counts to daily_metrics", _add_resume_counts),
+    (11, "Index daily_metrics by category", _index_daily_metrics_category),
+]
+
+
+def get_schema_version(conn):
+    """Return the highest applied migration version (0 for a fresh database)"""
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    row = conn.execute('SELECT MAX(version) FROM schema_version').fetchone()
+    return row[0] or 0
+
+
+def run_migrations(conn):
+    """Apply every pending migration, each in its own transaction"""
+    current = get_schema_version(conn)
+    applied = []
+
+    for version, description, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # Another process may have migrated while we waited for the lock
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            migrate(conn.cursor())
+            conn.execute(
+                'INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                (version, description)
+            )
+            conn.commit()
+            applied.append(version)
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Migration {version} ({description}) failed: {str(e)}")
+
+    return applied
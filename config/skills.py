@@ -0,0 +1,225 @@
+"""
+Canonical skill registry.
+
+Every skill has one canonical spelling, a category and the aliases it is
+written as in resumes and job postings. Aliases are matched as whole words,
+case-insensitively; the canonical name is always an alias of itself, so
+avoid canonical names that are also common English words (e.g. "Go"), and
+keep generic words ("api", "cloud") out of the aliases.
+
+A skill whose established name is an ordinary word ("R", "Swift") sets
+'common_word': its name still normalises a skill listed on its own, but
+in free text only its qualified aliases ("r programming", "swiftui") count.
+"""
+
+SKILLS = {
+    # Programming languages
+    'Python': {'category': 'Programming', 'aliases': ['python3', 'python 3']},
+    'Java': {'category': 'Programming', 'aliases': ['java se', 'java ee', 'j2ee']},
+    'JavaScript': {'category': 'Programming', 'aliases': ['js', 'javascript es6', 'es6', 'ecmascript', 'vanilla js']},
+    'TypeScript': {'category': 'Programming', 'aliases': []},
+    'C++': {'category': 'Programming', 'aliases': ['cpp', 'c plus plus']},
+    'C#': {'category': 'Programming', 'aliases': ['c sharp', 'csharp']},
+    'Golang': {'category': 'Programming', 'aliases': ['go lang', 'go programming']},
+    'Rust': {'category': 'Programming', 'aliases': []},
+    'Kotlin': {'category': 'Programming', 'aliases': []},
+    'Swift': {'category': 'Programming', 'aliases': ['swiftui', 'swift programming', 'swift language'], 'common_word': True},
+    'PHP': {'category': 'Programming', 'aliases': []},
+    'Ruby': {'category': 'Programming', 'aliases': []},
+    'R': {'category': 'Programming', 'aliases': ['r programming', 'r language', 'rstudio', 'tidyverse', 'ggplot2'], 'common_word': True},
+    'Scala': {'category': 'Programming', 'aliases': []},
+    'MATLAB': {'category': 'Programming', 'aliases': []},
+    'Bash': {'category': 'Programming', 'aliases': ['shell scripting', 'shell script']},
+
+    # Web
+    'HTML': {'category': 'Web', 'aliases': ['html5']},
+    'CSS': {'category': 'Web', 'aliases': ['css3', 'scss', 'sass']},
+    'React': {'category': 'Web', 'aliases': ['react.js', 'reactjs', 'react js']},
+    'Angular': {'category': 'Web', 'aliases': ['angular.js', 'angularjs']},
+    'Vue.js': {'category': 'Web', 'aliases': ['vue', 'vuejs', 'vue js', 'vue 3']},
+    'Node.js': {'category': 'Web', 'aliases': ['nodejs', 'node js']},
+    'Express': {'category': 'Web', 'aliases': ['express.js', 'expressjs'], 'common_word': True},
+    'Django': {'category': 'Web', 'aliases': []},
+    'Flask': {'category': 'Web', 'aliases': []},
+    'FastAPI': {'category': 'Web', 'aliases': []},
+    'Spring Boot': {'category': 'Web', 'aliases': ['springboot', 'spring framework', 'spring mvc']},
+    'ASP.NET': {'category': 'Web', 'aliases': ['.net', 'dotnet', 'asp.net core', '.net core']},
+    'REST APIs': {'category': 'Web', 'aliases': ['restful', 'restful apis', 'rest api']},
+    'GraphQL': {'category': 'Web', 'aliases': []},
+    'Responsive Design': {'category': 'Web', 'aliases': ['responsive web design']},
+
+    # Mobile
+    'React Native': {'category': 'Mobile', 'aliases': []},
+    'Flutter': {'category': 'Mobile', 'aliases': []},
+    'Android': {'category': 'Mobile', 'aliases': ['android development']},
+    'iOS': {'category': 'Mobile', 'aliases': ['ios development']},
+
+    # Databases
+    'SQL': {'category': 'Database', 'aliases': ['structured query language', 't-sql', 'pl/sql']},
+    'MySQL': {'category': 'Database', 'aliases': []},
+    'PostgreSQL': {'category': 'Database', 'aliases': ['postgres', 'postgresql', 'psql']},
+    'MongoDB': {'category': 'Database', 'aliases': ['mongo']},
+    'Redis': {'category': 'Database', 'aliases': []},
+    'SQLite': {'category': 'Database', 'aliases': []},
+    'Oracle': {'category': 'Database', 'aliases': ['oracle db', 'oracle database']},
+    'Database Design': {'category': 'Database', 'aliases': ['data modeling', 'schema design']},
+
+    # Cloud and DevOps
+    'AWS': {'category': 'Cloud', 'aliases': ['amazon web services', 'ec2', 's3', 'aws lambda']},
+    'Azure': {'category': 'Cloud', 'aliases': ['microsoft azure']},
+    'GCP': {'category': 'Cloud', 'aliases': ['google cloud', 'google cloud platform']},
+    'Docker': {'category': 'DevOps', 'aliases': ['containerization']},
+    'Kubernetes': {'category': 'DevOps', 'aliases': ['k8s']},
+    'Terraform': {'category': 'DevOps', 'aliases': ['infrastructure as code', 'iac']},
+    'CI/CD': {'category': 'DevOps', 'aliases': ['ci cd', 'continuous integration', 'continuous delivery', 'continuous deployment']},
+    'Jenkins': {'category': 'DevOps', 'aliases': []},
+    'Git': {'category': 'DevOps', 'aliases': []},
+    'Linux': {'category': 'DevOps', 'aliases': ['unix', 'ubuntu']},
+    'Microservices': {'category': 'DevOps', 'aliases': ['microservice architecture']},
+    'Monitoring': {'category': 'DevOps', 'aliases': ['prometheus', 'grafana', 'observability']},
+
+    # Data and machine learning
+    'Machine Learning': {'category': 'Data', 'aliases': ['ml']},
+    'Deep Learning': {'category': 'Data', 'aliases': ['neural networks']},
+    'Data Science': {'category': 'Data', 'aliases': []},
+    'Artificial Intelligence': {'category': 'Data', 'aliases': ['ai']},
+    'TensorFlow': {'category': 'Data', 'aliases': ['keras']},
+    'PyTorch': {'category': 'Data', 'aliases': []},
+    'scikit-learn': {'category': 'Data', 'aliases': ['sklearn', 'scikit learn']},
+    'Pandas': {'category': 'Data', 'aliases': []},
+    'NumPy': {'category': 'Data', 'aliases': []},
+    'Statistics': {'category': 'Data', 'aliases': ['statistical analysis', 'statistical modeling']},
+    'Data Visualization': {'category': 'Data', 'aliases': ['data viz', 'matplotlib', 'seaborn']},
+    'Tableau': {'category': 'Data', 'aliases': []},
+    'Power BI': {'category': 'Data', 'aliases': ['powerbi']},
+    'Excel': {'category': 'Data', 'aliases': ['ms excel', 'microsoft excel']},
+    'Big Data': {'category': 'Data', 'aliases': ['hadoop']},
+    'Spark': {'category': 'Data', 'aliases': ['apache spark', 'pyspark']},
+    'MLOps': {'category': 'Data', 'aliases': []},
+    'Analytics': {'category': 'Data', 'aliases': ['data analysis', 'data analytics']},
+
+    # Security
+    'Network Security': {'category': 'Security', 'aliases': []},
+    'Penetration Testing': {'category': 'Security', 'aliases': ['pen testing', 'pentesting', 'ethical hacking']},
+    'Vulnerability Assessment': {'category': 'Security', 'aliases': []},
+    'Incident Response': {'category': 'Security', 'aliases': ['incident management']},
+
+    # Design
+    'UI/UX': {'category': 'Design', 'aliases': ['ui ux', 'ui/ux design', 'ux design', 'ui design', 'user experience', 'user interface design']},
+    'Figma': {'category': 'Design', 'aliases': []},
+    'Adobe XD': {'category': 'Design', 'aliases': []},
+    'Wireframing': {'category': 'Design', 'aliases': ['wireframes']},
+    'Prototyping': {'category': 'Design', 'aliases': ['prototypes']},
+    'User Research': {'category': 'Design', 'aliases': ['ux research']},
+    'Unity': {'category': 'Design', 'aliases': ['unity3d', 'unity 3d', 'unity engine'], 'common_word': True},
+    'Unreal Engine': {'category': 'Design', 'aliases': ['unreal', 'ue4', 'ue5']},
+
+    # Management
+    'Agile': {'category': 'Management', 'aliases': ['agile methodologies', 'agile methodology']},
+    'Scrum': {'category': 'Management', 'aliases': []},
+    'Jira': {'category': 'Management', 'aliases': []},
+    'Project Management': {'category': 'Management', 'aliases': ['project planning']},
+    'Stakeholder Management': {'category': 'Management', 'aliases': []},
+    'Risk Management': {'category': 'Management', 'aliases': []},
+    'Product Strategy': {'category': 'Management', 'aliases': []},
+    'Roadmapping': {'category': 'Management', 'aliases': ['product roadmap', 'roadmaps']},
+
+    # Umbrella skills that job roles ask for and resumes rarely spell out
+    'Frontend Tech': {'category': 'Web', 'aliases': ['frontend', 'front-end', 'front end', 'frontend development']},
+    'Backend Tech': {'category': 'Web', 'aliases': ['backend', 'back-end', 'back end', 'backend development', 'server-side']},
+    'Databases': {'category': 'Database', 'aliases': ['database', 'dbms', 'rdbms']},
+    'Cloud Platforms': {'category': 'Cloud', 'aliases': ['cloud computing']},
+    'DevOps': {'category': 'DevOps', 'aliases': []},
+    'Security': {'category': 'Security', 'aliases': ['cybersecurity', 'cyber security', 'information security']},
+    'Design Tools': {'category': 'Design', 'aliases': []},
+    'Game Engines': {'category': 'Design', 'aliases': ['game engine']},
+    'Cross-platform frameworks': {'category': 'Mobile', 'aliases': ['cross-platform', 'cross platform']},
+    'Project Management Tools': {'category': 'Management', 'aliases': []},
+}
+
+# Skill hierarchy: each skill's direct parents. Knowing a skill implies some
+# knowledge of all of its ancestors (React -> JavaScript -> Frontend Tech),
+# which earns partial credit when a role asks for the ancestor.
+SKILL_PARENTS = {
+    'HTML': ['Frontend Tech'],
+    'CSS': ['Frontend Tech'],
+    'JavaScript': ['Frontend Tech'],
+    'TypeScript': ['JavaScript'],
+    'React': ['JavaScript'],
+    'Angular': ['TypeScript'],
+    'Vue.js': ['JavaScript'],
+    'Responsive Design': ['Frontend Tech'],
+
+    'Node.js': ['JavaScript', 'Backend Tech'],
+    'Express': ['Node.js'],
+    'Django': ['Python', 'Backend Tech'],
+    'Flask': ['Python', 'Backend Tech'],
+    'FastAPI': ['Python', 'Backend Tech'],
+    'Spring Boot': ['Java', 'Backend Tech'],
+    'ASP.NET': ['C#', 'Backend Tech'],
+    'REST APIs': ['Backend Tech'],
+    'GraphQL': ['Backend Tech'],
+    'Microservices': ['Backend Tech'],
+
+    'React Native': ['React', 'Cross-platform frameworks'],
+    'Flutter': ['Cross-platform frameworks'],
+    'Kotlin': ['Android'],
+    'Swift': ['iOS'],
+
+    'MySQL': ['SQL'],
+    'PostgreSQL': ['SQL'],
+    'SQLite': ['SQL'],
+    'Oracle': ['SQL'],
+    'SQL': ['Databases'],
+    'MongoDB': ['Databases'],
+    'Redis': ['Databases'],
+    'Database Design': ['Databases'],
+
+    'AWS': ['Cloud Platforms'],
+    'Azure': ['Cloud Platforms'],
+    'GCP': ['Cloud Platforms'],
+    'Docker': ['DevOps'],
+    'Kubernetes': ['Docker'],
+    'Terraform': ['DevOps'],
+    'Jenkins': ['CI/CD'],
+    'CI/CD': ['DevOps'],
+    'Monitoring': ['DevOps'],
+
+    'TensorFlow': ['Deep Learning'],
+    'PyTorch': ['Deep Learning'],
+    'Deep Learning': ['Machine Learning'],
+    'scikit-learn': ['Machine Learning'],
+    'MLOps': ['Machine Learning'],
+    'Machine Learning': ['Artificial Intelligence'],
+    'Pandas': ['Python', 'Analytics'],
+    'NumPy': ['Python'],
+    'Spark': ['Big Data'],
+    'Tableau': ['Data Visualization'],
+    'Power BI': ['Data Visualization'],
+
+    'Network Security': ['Security'],
+    'Penetration Testing': ['Security'],
+    'Vulnerability Assessment': ['Security'],
+    'Incident Response': ['Security'],
+
+    'Figma': ['Design Tools'],
+    'Adobe XD': ['Design Tools'],
+    'Unity': ['Game Engines'],
+    'Unreal Engine': ['Game Engines'],
+
+    'Scrum': ['Agile'],
+    'Jira': ['Project Management Tools'],
+}
+
+# Fallback categorisation for skills that are not in the registry:
+# the first category with a keyword contained in the skill name wins
+CATEGORY_HINTS = [
+    ('Programming', ['programming', 'language', 'coding']),
+    ('Database', ['sql', 'database', 'db']),
+    ('Cloud', ['cloud']),
+    ('DevOps', ['devops', 'deploy', 'infrastructure']),
+    ('Data', ['data', 'learning', 'analytics']),
+    ('Security', ['security', 'threat']),
+    ('Design', ['design', 'ux', 'ui']),
+    ('Management', ['agile', 'scrum', 'management', 'planning']),
+]
@@ -4,6 +4,9 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from config.database import get_database_connection
+from utils.analysis_cache import get_analysis_cache
+from utils.skill_registry import get_skill_registry
+from utils.timing import get_timing_summary, SUMMARY_DAYS
 import io
 import uuid
 from plotly.subplots import make_subplots
@@ -11,7 +14,6 @@ from io import BytesIO
 
 class DashboardManager:
     def __init__(self):
-        self.conn = get_database_connection()
         self.colors = {
             'primary': '#4CAF50',
             'secondary': '#2196F3',
@@ -26,6 +28,11 @@ class DashboardManager:
             'subtext': '#B0B0B0'
         }
         
+    @property
+    def conn(self):
+        """Pooled connection for the calling thread, safe across Streamlit sessions"""
+        return get_database_connection()
+
     def apply_dashboard_style(self):
         """Apply custom styling for dashboard"""
         st.markdown("""
@@ -110,49 +117,45 @@ class DashboardManager:
         """, unsafe_allow_html=True)
 
     def get_resume_metrics(self):
-        """Get resume-related metrics from database"""
+        """Get resume-related metrics from the daily_metrics rollup"""
         cursor = self.conn.cursor()
         
         # Get current date
         now = datetime.now()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_month = now.replace(day=1)
+        start_of_day = now.strftime('%Y-%m-%d')
+        start_of_week = (now - timedelta(days=now.weekday())).strftime('%Y-%m-%d')
+        start_of_month = now.replace(day=1).strftime('%Y-%m-%d')
+        
+        # One row per day, summed into each period below
+        cursor.execute("""
+            SELECT day, SUM(resume_count), SUM(analysis_count), SUM(ats_score_sum),
+                   SUM(keyword_score_sum), SUM(high_score_count)
+            FROM daily_metrics
+            GROUP BY day
+        """)
+        days = cursor.fetchall()
         
-        # Fetch metrics for different time periods
         metrics = {}
         for period, start_date in [
             ('Today', start_of_day),
             ('This Week', start_of_week),
             ('This Month', start_of_month),
-            ('All Time', datetime(2000, 1, 1))
+            ('All Time', '2000-01-01')
         ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
-            
-            row = cursor.fetchone()
-            if row:
-                metrics[period] = {
-                    'total': row[0] or 0,
-                    'ats_score': row[1] or 0,
-                    'keyword_score': row[2] or 0,
-                    'high_scoring': row[3] or 0
-                }
-            else:
-                metrics[period] = {
-                    'total': 0,
-                    'ats_score': 0,
-                    'keyword_score': 0,
-                    'high_scoring': 0
-                }
+            total = analyses = ats_sum = keyword_sum = high_scoring = 0
+            for day, resumes, count, day_ats, day_keyword, day_high in days:
+                if day and day >= start_date:
+                    total += resumes
+                    analyses += count
+                    ats_sum += day_ats
+                    keyword_sum += day_keyword
+                    high_scoring += day_high
+            metrics[period] = {
+                'total': total,
+                'ats_score': round(ats_sum / analyses, 1) if analyses else 0,
+                'keyword_score': round(keyword_sum / analyses, 1) if analyses else 0,
+                'high_scoring': high_scoring
+            }
         
         return metrics
 
@@ -160,37 +163,9 @@ class DashboardManager:
         """Get skill distribution data"""
         cursor = self.conn.cursor()
         cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category,
-                    COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
-                GROUP BY category
-            )
-            SELECT category, count
-            FROM SkillCategories
+            SELECT skill_category, COUNT(*) as count
+            FROM resume_skills
+            GROUP BY skill_category
             ORDER BY count DESC
         """)
         
@@ -207,14 +182,14 @@ class DashboardManager:
         now = datetime.now()
         dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
         
-        submissions = []
-        for date in dates:
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM resume_data 
-                WHERE DATE(created_at) = DATE(?)
-            """, (date,))
-            submissions.append(cursor.fetchone()[0])
+        cursor.execute("""
+            SELECT day, SUM(resume_count)
+            FROM daily_metrics
+            WHERE day >= ?
+            GROUP BY day
+        """, (dates[0],))
+        counts = dict(cursor.fetchall())
+        submissions = [counts.get(date, 0) for date in dates]
             
         return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
 
@@ -223,11 +198,10 @@ class DashboardManager:
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT 
-                COALESCE(target_category, 'Other') as category,
-                COUNT(*) as count,
-                ROUND(AVG(CASE WHEN ra.ats_score >= 70 THEN 1 ELSE 0 END) * 100, 1) as success_rate
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+                category,
+                SUM(resume_count) as count,
+                ROUND(SUM(high_score_count) * 100.0 / SUM(resume_count), 1) as success_rate
+            FROM daily_metrics
             GROUP BY category
             ORDER BY count DESC
             LIMIT 5
@@ -296,6 +270,16 @@ class DashboardManager:
             - Storage Used: {stats['storage_size']}
         """)
 
+        # Analysis Cache Stats
+        st.sidebar.markdown("### ⚡ Analysis Cache")
+        cache_stats = get_analysis_cache().stats()
+        st.sidebar.markdown(f"""
+            - Hits: {cache_stats['hits']} (memory {cache_stats['memory_hits']}, disk {cache_stats['disk_hits']})
+            - Misses: {cache_stats['misses']}
+            - Hit Rate: {cache_stats['hit_rate']}%
+            - Cached in Memory: {cache_stats['entries']}
+        """)
+
     def get_resume_data(self):
         """Get all resume data"""
         cursor = self.conn.cursor()
@@ -424,11 +408,42 @@ class DashboardManager:
         else:
             st.info("No resume submissions available")
 
+    def render_performance_section(self):
+        """Render analysis stage latencies (p50/p95/p99) from analysis_timings"""
+        st.markdown("<h2 class='section-title'>Analysis Performance</h2>", unsafe_allow_html=True)
+        
+        summary = get_timing_summary()
+        if not summary['count']:
+            st.info("No analysis timings recorded yet")
+            return
+        
+        st.caption(f"Latest {summary['count']} analyses from the last {SUMMARY_DAYS} days, in milliseconds")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**By Stage**")
+            stages = pd.DataFrame([
+                {'Stage': stage, 'Runs': values['count'], 'p50': values['p50'], 'p95': values['p95'], 'p99': values['p99']}
+                for stage, values in summary['stages'].items()
+            ]).sort_values('p95', ascending=False)
+            st.dataframe(stages, use_container_width=True, hide_index=True)
+        
+        with col2:
+            st.markdown("**By Document Class**")
+            classes = pd.DataFrame([
+                {'Document': label, 'Analyses': values['count'], 'p50': values['p50'], 'p95': values['p95'], 'p99': values['p99']}
+                for label, values in summary['classes'].items()
+            ])
+            st.dataframe(classes, use_container_width=True, hide_index=True)
+
     def render_admin_section(self):
         """Render admin section with logs and Excel download"""
         # Render resume data section
         self.render_resume_data_section()
         
+        # Render stage timings of recent analyses
+        self.render_performance_section()
+        
         # Render admin logs section
         st.markdown("<h2 class='section-title'>Admin Activity Logs</h2>", unsafe_allow_html=True)
         
@@ -577,7 +592,7 @@ class DashboardManager:
         cursor.execute("""
             SELECT COUNT(*) 
             FROM resume_data 
-            WHERE DATE(created_at) = DATE('now')
+            WHERE created_at >= DATE('now')
         """)
         stats['today_submissions'] = cursor.fetchone()[0]
         
@@ -847,52 +862,46 @@ class DashboardManager:
         cursor = self.conn.cursor()
         indicators = {}
         
-        # Compare with last week's data
+        # Compare all-time totals with the totals as of a week ago
+        cursor.execute("""
+            SELECT
+                SUM(resume_count), SUM(analysis_count), SUM(ats_score_sum), SUM(high_score_count),
+                SUM(CASE WHEN day < date('now', '-7 days') THEN resume_count END),
+                SUM(CASE WHEN day < date('now', '-7 days') THEN analysis_count END),
+                SUM(CASE WHEN day < date('now', '-7 days') THEN ats_score_sum END),
+                SUM(CASE WHEN day < date('now', '-7 days') THEN high_score_count END)
+            FROM daily_metrics
+        """)
+        (resumes, count, ats_sum, high,
+         old_resumes, old_count, old_ats_sum, old_high) = [value or 0 for value in cursor.fetchone()]
+        
+        current = {
+            'resumes': resumes,
+            'ats': ats_sum / count if count else 0,
+            'high_performing': high,
+            'success_rate': high / resumes if resumes else 0
+        }
+        previous = {
+            'resumes': old_resumes,
+            'ats': old_ats_sum / old_count if old_count else 0,
+            'high_performing': old_high,
+            'success_rate': old_high / old_resumes if old_resumes else 0
+        }
+        
         for metric in ['resumes', 'ats', 'high_performing', 'success_rate']:
-            try:
-                if metric == 'resumes':
-                    cursor.execute("""
-                        SELECT 
-                            (COUNT(*) - (
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_data
-                    """)
-                elif metric == 'ats':
-                    cursor.execute("""
-                        SELECT 
-                            (AVG(ats_score) - (
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_analysis
-                    """)
-                
-                change = cursor.fetchone()[0] or 0
-                indicators[metric] = {
-                    'value': abs(round(change, 1)),
-                    'icon': '↑' if change >= 0 else '↓',
-                    'class': 'trend-up' if change >= 0 else 'trend-down'
-                }
-            except Exception:
+            if not previous[metric]:
                 indicators[metric] = {
                     'value': 0,
                     'icon': '→',
                     'class': 'trend-neutral'
                 }
+                continue
+            change = (current[metric] - previous[metric]) * 100.0 / previous[metric]
+            indicators[metric] = {
+                'value': abs(round(change, 1)),
+                'icon': '↑' if change >= 0 else '↓',
+                'class': 'trend-up' if change >= 0 else 'trend-down'
+            }
         
         return indicators
 
@@ -903,11 +912,10 @@ class DashboardManager:
         
         # Most Successful Job Category
         cursor.execute("""
-            SELECT target_category, AVG(ats_score) as avg_score,
-                   COUNT(*) as submission_count
-            FROM resume_data rd
-            JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY target_category
+            SELECT category, SUM(ats_score_sum) / SUM(analysis_count) as avg_score,
+                   SUM(analysis_count) as submission_count
+            FROM daily_metrics
+            GROUP BY category
             ORDER BY avg_score DESC
             LIMIT 1
         """)
@@ -925,10 +933,11 @@ class DashboardManager:
         # Recent Improvement
         cursor.execute("""
             SELECT 
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at >= date('now', '-7 days')) as recent_score,
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at < date('now', '-7 days')) as old_score
+                SUM(CASE WHEN day >= date('now', '-7 days') THEN ats_score_sum END) /
+                SUM(CASE WHEN day >= date('now', '-7 days') THEN analysis_count END) as recent_score,
+                SUM(CASE WHEN day < date('now', '-7 days') THEN ats_score_sum END) /
+                SUM(CASE WHEN day < date('now', '-7 days') THEN analysis_count END) as old_score
+            FROM daily_metrics
         """)
         scores = cursor.fetchone()
         if scores and scores[0] and scores[1]:
@@ -944,32 +953,16 @@ class DashboardManager:
         
         # Most Common Skills
         cursor.execute("""
-            WITH RECURSIVE
-            split(skill, rest) AS (
-                SELECT '', skills || ',' 
-                FROM resume_data 
-                WHERE skills IS NOT NULL
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split 
-                WHERE rest <> ''
-            ),
-            cleaned_skills AS (
-                SELECT TRIM(REPLACE(REPLACE(skill, '[', ''), ']', '')) as skill
-                FROM split 
-                WHERE skill <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM cleaned_skills
-            GROUP BY skill
+            SELECT skill_name, COUNT(*) as count
+            FROM resume_skills
+            GROUP BY skill_name
             ORDER BY count DESC
             LIMIT 3
         """)
         top_skills = cursor.fetchall()
         if top_skills:
-            skills_text = f"Most in-demand skills: Python ({top_skills[0][1]} resumes), Java ({top_skills[1][1]} resumes), Express ({top_skills[2][1]} resumes)"
+            registry = get_skill_registry()
+            skills_text = ", ".join(f"{registry.display_name(skill)} ({count} resumes)" for skill, count in top_skills)
             insights.append({
                 'title': 'Top Skills',
                 'icon': '💡',
@@ -985,17 +978,15 @@ class DashboardManager:
         """Get quick statistics for the dashboard"""
         cursor = self.conn.cursor()
         
-        # Total Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_data")
-        total_resumes = cursor.fetchone()[0]
+        # Totals from the daily rollup
+        cursor.execute("""
+            SELECT SUM(resume_count), SUM(analysis_count), SUM(ats_score_sum), SUM(high_score_count)
+            FROM daily_metrics
+        """)
+        total_resumes, analyses, ats_sum, high_performing = [value or 0 for value in cursor.fetchone()]
         
         # Average ATS Score
-        cursor.execute("SELECT AVG(ats_score) FROM resume_analysis")
-        avg_ats = cursor.fetchone()[0] or 0
-        
-        # High Performing Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_analysis WHERE ats_score >= 70")
-        high_performing = cursor.fetchone()[0]
+        avg_ats = ats_sum / analyses if analyses else 0
         
         # Success Rate
         success_rate = (high_performing / total_resumes * 100) if total_resumes > 0 else 0
@@ -1,15 +1,34 @@
-import spacy
 from collections import Counter
 from datetime import datetime
+from utils.experience_dates import experience_years as total_experience_years
+from utils.section_segmenter import get_resume_segmenter, employment_text
+from .nlp import get_nlp, get_skill_matcher, build_skill_matcher, BATCH_SIZE, N_PROCESS
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, nlp=None):
+        # Match ids are strings of the pipeline's own vocab
+        if nlp is None:
+            self.nlp, self.skill_matcher = get_nlp(), get_skill_matcher()
+        else:
+            self.nlp, self.skill_matcher = nlp, build_skill_matcher(nlp)
+        self.segmenter = get_resume_segmenter()
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
+        return self._analyze_doc(resume_text, self.nlp(resume_text))
+    
+    def analyze_many(self, texts, batch_size=BATCH_SIZE, n_process=N_PROCESS):
+        """Analyze many resume texts at once; returns one result per text, in order.
         
+        The texts go through nlp.pipe in batches of batch_size, split over
+        n_process worker processes when n_process > 1.
+        """
+        texts = list(texts)
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._analyze_doc(text, doc) for text, doc in zip(texts, docs)]
+    
+    def _analyze_doc(self, resume_text, doc):
+        """Compute the metrics of one processed resume"""
         # Basic metrics
         word_count = len(resume_text.split())
         sentence_count = len(list(doc.sents))
@@ -42,29 +61,23 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        # One pass of the compiled matcher over the token ids finds every
+        # registry skill and alias, including multi-word ones such as
+        # "natural language processing"
+        strings = doc.vocab.strings
+        return {strings[match_id] for match_id, _, _ in self.skill_matcher(doc)}
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
-        # Simple heuristic - look for number + "years"
-        experience_years = 0
+        # Employment date ranges give the real tenure, with overlapping
+        # jobs counted once; ranges in the education section are not jobs
+        unsectioned = []
+        sections = self.segmenter.segment(doc.text, unsectioned=unsectioned)
+        experience_years = total_experience_years(employment_text(sections['experience'], unsectioned))
+        if experience_years:
+            return experience_years
+        
+        # Otherwise fall back to the largest "N years" mention
         for token in doc:
             if token.like_num and token.i < len(doc) - 1:
                 next_token = doc[token.i + 1]
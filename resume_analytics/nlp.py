@@ -0,0 +1,70 @@
+"""
+Process-wide spaCy pipeline for resume analytics.
+
+Loading en_core_web_sm takes about a second and holds its weights in
+memory, so every ResumeAnalyzer in the process shares one copy. The
+tagger, attribute ruler and lemmatizer are never loaded: nothing reads
+their annotations, and the parser and NER don't depend on them, so
+sentences and entities are exactly those of the full pipeline. The skill
+vocabulary is compiled once into a PhraseMatcher over the same vocab.
+"""
+import threading
+
+import spacy
+from spacy.matcher import PhraseMatcher
+
+from utils.skill_registry import get_skill_registry
+
+MODEL_NAME = "en_core_web_sm"
+# Components whose annotations nothing reads and no other component uses
+EXCLUDED_COMPONENTS = ("tagger", "attribute_ruler", "lemmatizer")
+
+# Texts per nlp.pipe batch and worker processes used by analyze_many
+BATCH_SIZE = 32
+N_PROCESS = 1
+
+_nlp = None
+_skill_matcher = None
+_nlp_lock = threading.Lock()
+
+
+def load_nlp(model_name=MODEL_NAME):
+    """Load model_name without the components in EXCLUDED_COMPONENTS"""
+    return spacy.load(model_name, exclude=EXCLUDED_COMPONENTS)
+
+
+def get_nlp():
+    """Return the shared pipeline, loading it on first use"""
+    global _nlp
+    with _nlp_lock:
+        if _nlp is None:
+            _nlp = load_nlp()
+        return _nlp
+
+
+def build_skill_matcher(nlp, registry=None):
+    """Compile every free-text registry alias into a case-insensitive PhraseMatcher.
+
+    Each alias is tokenized once with nlp's tokenizer and matched on the
+    LOWER attribute, so a single pass over a Doc's token ids finds skills
+    of any length ("natural language processing") without building
+    strings. The match id of every alias is its canonical skill name.
+    """
+    registry = registry or get_skill_registry()
+    by_skill = {}
+    for alias, canonical in registry.text_aliases.items():
+        by_skill.setdefault(canonical, []).append(alias)
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    for canonical, aliases in by_skill.items():
+        matcher.add(canonical, list(nlp.tokenizer.pipe(aliases)))
+    return matcher
+
+
+def get_skill_matcher():
+    """Return the skill PhraseMatcher for the shared pipeline's vocab"""
+    global _skill_matcher
+    nlp = get_nlp()
+    with _nlp_lock:
+        if _skill_matcher is None:
+            _skill_matcher = build_skill_matcher(nlp)
+        return _skill_matcher
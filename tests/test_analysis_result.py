@@ -0,0 +1,74 @@
+"""
+AnalysisResult's dict view and its compressed binary encoding.
+"""
+import pytest
+
+from utils.analysis_result import AnalysisResult, FIELDS, FORMAT_VERSION, MAGIC
+
+
+def sample():
+    return AnalysisResult(
+        'resume', ats_score=72,
+        keyword_match={'score': 80, 'found_skills': ['Python'], 'inferred_skills': ['SQL'], 'missing_skills': ['Go']},
+        section_score=60, format_score=90,
+        personal_info={'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': None},
+        education=['BSc, State University'], experience=['Engineer, Acme – Zürich'],
+        skills=['Python', 'SQL'], summary='Backend engineer',
+        section_suggestions={'skills': ['Add more skills'], 'format': []},
+        section_scores={'skills': 12}, experience_years=5.0
+    )
+
+
+def test_round_trip():
+    result = sample()
+    decoded = AnalysisResult.from_bytes(result.to_bytes())
+    assert [getattr(decoded, field) for field in FIELDS] == [getattr(result, field) for field in FIELDS]
+    assert decoded.to_dict() == result.to_dict()
+
+
+def test_round_trip_from_memoryview():
+    data = sample().to_bytes()
+    assert AnalysisResult.from_bytes(memoryview(data)).to_dict() == sample().to_dict()
+
+
+def test_version_header():
+    data = sample().to_bytes()
+    assert data[:len(MAGIC)] == MAGIC
+    assert data[len(MAGIC)] == FORMAT_VERSION
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    MAGIC,
+    b'{"ats_score": 72}',
+])
+def test_rejects_other_formats(data):
+    with pytest.raises(ValueError, match='Not an encoded'):
+        AnalysisResult.from_bytes(data)
+
+
+def test_rejects_other_versions():
+    data = sample().to_bytes()
+    stale = MAGIC + bytes([FORMAT_VERSION - 1]) + data[len(MAGIC) + 1:]
+    with pytest.raises(ValueError, match='version'):
+        AnalysisResult.from_bytes(stale)
+
+
+def test_reads_like_the_old_dict():
+    result = sample()
+    assert result['name'] == 'Jane Doe'
+    assert result['ats_score'] == 72
+    assert result['skills_suggestions'] == ['Add more skills']
+    assert result['suggestions'] == ['Add more skills']
+    assert 'phone' not in result
+    assert 'jd_match' not in result
+    assert result.get('role_matches') is None
+
+
+@pytest.mark.parametrize('key', [0, None, ('ats_score',), b'ats_score'])
+def test_non_string_keys_are_missing(key):
+    result = sample()
+    with pytest.raises(KeyError):
+        result[key]
+    assert key not in result
+    assert result.get(key) is None
@@ -0,0 +1,93 @@
+"""
+Streaming DOCX extraction, including the tables python-docx used to skip.
+"""
+import io
+import zipfile
+
+import pytest
+
+from utils.docx_extractor import extract_docx_text
+from utils.pdf_extractor import ExtractionLimitError
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+
+def paragraph(*runs):
+    return '<w:p>' + ''.join(f'<w:r><w:t xml:space="preserve">{run}</w:t></w:r>' for run in runs) + '</w:p>'
+
+
+def table(rows):
+    return '<w:tbl>' + ''.join(
+        '<w:tr>' + ''.join(f'<w:tc>{paragraph(cell)}</w:tc>' for cell in row) + '</w:tr>'
+        for row in rows
+    ) + '</w:tbl>'
+
+
+def docx(body, parts=None):
+    """Build a minimal DOCX holding body and any extra word/ parts"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('word/document.xml', f'<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>')
+        for name, content in (parts or {}).items():
+            archive.writestr(name, f'<w:hdr {NAMESPACES}>{content}</w:hdr>')
+    return buffer.getvalue()
+
+
+def test_paragraphs_and_tables():
+    body = (
+        paragraph('Jane Doe') +
+        paragraph('TECHNICAL ', 'SKILLS') +
+        table([['Python', 'SQL'], ['Docker', 'Kubernetes']]) +
+        paragraph('EXPERIENCE')
+    )
+    assert extract_docx_text(docx(body)).split('\n') == [
+        'Jane Doe', 'TECHNICAL SKILLS', 'Python', 'SQL', 'Docker', 'Kubernetes', 'EXPERIENCE'
+    ]
+
+
+def test_nested_table():
+    body = '<w:tbl><w:tr><w:tc>' + paragraph('Outer') + table([['Inner']]) + '</w:tc></w:tr></w:tbl>'
+    assert extract_docx_text(docx(body)).split('\n') == ['Outer', 'Inner']
+
+
+def test_headers_and_footers_surround_the_body():
+    data = docx(paragraph('Body'), {
+        'word/footer1.xml': paragraph('Footer'),
+        'word/header2.xml': paragraph('Second header'),
+        'word/header1.xml': paragraph('Header'),
+    })
+    assert extract_docx_text(data).split('\n') == ['Header', 'Second header', 'Body', 'Footer']
+
+
+def test_fallback_content_is_not_repeated():
+    body = (
+        '<w:p><mc:AlternateContent>'
+        f'<mc:Choice>{paragraph("Text box")}</mc:Choice>'
+        f'<mc:Fallback>{paragraph("Text box")}</mc:Fallback>'
+        '</mc:AlternateContent></w:p>'
+    )
+    assert extract_docx_text(docx(body)).split('\n').count('Text box') == 1
+
+
+def test_tabs_and_breaks():
+    body = '<w:p><w:r><w:t>A</w:t><w:tab/><w:t>B</w:t><w:br/><w:t>C</w:t></w:r></w:p>'
+    assert extract_docx_text(docx(body)) == 'A\tB\nC'
+
+
+def test_rejects_non_documents():
+    with pytest.raises(ValueError, match='not a zip'):
+        extract_docx_text(b'plain text')
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('other.xml', '<x/>')
+    with pytest.raises(ValueError, match='document.xml'):
+        extract_docx_text(buffer.getvalue())
+
+
+def test_xml_size_limit():
+    data = docx(paragraph('x' * 10000))
+    with pytest.raises(ExtractionLimitError):
+        extract_docx_text(data, max_xml_bytes=1000)
@@ -0,0 +1,73 @@
+"""
+Total work experience from the date ranges in a resume.
+"""
+import pytest
+
+from utils.experience_dates import experience_months, find_date_ranges, merge_ranges
+from utils.resume_analyzer import ResumeAnalyzer
+
+RESUME = """Jane Doe
+jane@example.com
+
+EXPERIENCE
+Research Assistant, State University
+Jan 2018 - Dec 2020
+
+Software Engineer, Acme
+Jan 2021 - Dec 2022
+
+EDUCATION
+BSc Computer Science, State University
+Sep 2010 - Jun 2014
+
+SKILLS
+Python, SQL
+"""
+
+# Months since year 0 of December 2024
+NOW = 2024 * 12 + 11
+
+
+@pytest.mark.parametrize('ranges, merged', [
+    ([], []),
+    ([(0, 12)], [(0, 12)]),
+    ([(24, 36), (0, 12)], [(0, 12), (24, 36)]),
+    ([(0, 12), (6, 18)], [(0, 18)]),
+    ([(0, 12), (12, 24)], [(0, 24)]),
+    ([(0, 24), (6, 12)], [(0, 24)]),
+    ([(10, 20), (0, 5), (4, 11), (30, 31)], [(0, 20), (30, 31)]),
+])
+def test_merge_ranges(ranges, merged):
+    assert merge_ranges(ranges) == merged
+
+
+@pytest.mark.parametrize('text, months', [
+    ("Jan 2019 - Dec 2019", 12),
+    ("03/2017 to 11/2018", 21),
+    ("2016 - 2018", 24),
+    ("June 2023 - Present", 19),
+    ("Jan 2020 - Dec 2021\nJan 2021 - Dec 2022", 36),
+    ("Jan 2020 - Dec 2020\nJan 2021 - Dec 2021", 24),
+    ("Dec 2020 - Jan 2020", 0),
+    ("Jan 2026 - Present", 0),
+    ("Phone 555-2019 - 2020", 0),
+])
+def test_experience_months(text, months):
+    assert experience_months(text, NOW) == months
+
+
+def test_find_date_ranges_ends_at_now():
+    assert find_date_ranges("Jan 2024 - Dec 2030", NOW) == [(2024 * 12, NOW + 1)]
+
+
+def test_education_ranges_are_not_experience():
+    analysis = ResumeAnalyzer().analyze_resume({'raw_text': RESUME}, {'required_skills': ['Python']})
+    assert analysis['experience_years'] == 5.0
+
+
+def test_analytics_education_ranges_are_not_experience():
+    spacy = pytest.importorskip('spacy')
+    from resume_analytics.analyzer import ResumeAnalyzer as AnalyticsAnalyzer
+    nlp = spacy.blank('en')
+    analyzer = AnalyticsAnalyzer(nlp)
+    assert analyzer._analyze_experience(nlp(RESUME)) == 5.0
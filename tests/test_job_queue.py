@@ -0,0 +1,128 @@
+"""
+Leasing, acknowledging and failing jobs in the durable analysis queue.
+"""
+import time
+
+import pytest
+
+from config.database import init_database, get_database_connection
+from config.db_pool import get_pool
+from utils import job_queue
+from utils.incremental_analysis import AnalysisState
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    # resume_data.db is opened relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    init_database()
+    yield
+    get_pool().close_all()
+
+
+def submit(cache_key='key', **kwargs):
+    return job_queue.enqueue(cache_key, b'%PDF-1.4 document', 'pdf', {'role': 'Engineer'}, **kwargs)
+
+
+def expire_lease(job_id):
+    conn = get_database_connection()
+    conn.execute('UPDATE analysis_jobs SET lease_until = ? WHERE id = ?', (time.time() - 1, job_id))
+    conn.commit()
+
+
+def make_available(job_id):
+    conn = get_database_connection()
+    conn.execute('UPDATE analysis_jobs SET available_at = ? WHERE id = ?', (time.time() - 1, job_id))
+    conn.commit()
+
+
+def test_pending_job_is_reused_for_the_same_key():
+    assert submit() == submit()
+    assert submit('other') != submit()
+
+
+def test_lease_hands_out_each_job_once():
+    first, second = submit('a'), submit('b')
+    job = job_queue.lease('w1')
+    assert job['id'] == first
+    assert job['status'] == 'running'
+    assert job['attempts'] == 1
+    assert job['document'] == b'%PDF-1.4 document'
+    assert job['params'] == {'role': 'Engineer'}
+    assert job_queue.lease('w2')['id'] == second
+    assert job_queue.lease('w3') is None
+
+
+def test_ack_marks_the_job_done():
+    job_id = submit(state=AnalysisState())
+    job = job_queue.lease('w1')
+    assert isinstance(job['state'], AnalysisState)
+    assert job_queue.ack(job_id, 'w1', resume_id=7, state=AnalysisState())
+    done = job_queue.get_job(job_id)
+    assert done['status'] == 'done'
+    assert done['resume_id'] == 7
+    assert isinstance(done['state'], AnalysisState)
+    # Finished jobs are not reused or leased again
+    assert submit() != job_id
+    assert job_queue.lease('w2')['id'] != job_id
+
+
+def test_ack_from_another_worker_is_rejected():
+    job_id = submit()
+    job_queue.lease('w1')
+    assert not job_queue.ack(job_id, 'w2')
+    assert job_queue.get_job(job_id)['status'] == 'running'
+
+
+def test_fail_requeues_with_backoff():
+    job_id = submit()
+    job_queue.lease('w1')
+    assert job_queue.fail(job_id, 'w1', 'boom')
+    job = job_queue.get_job(job_id)
+    assert job['status'] == 'queued'
+    assert job['error'] == 'boom'
+    # The retry waits out its backoff delay
+    assert job_queue.lease('w1') is None
+    make_available(job_id)
+    assert job_queue.lease('w1')['attempts'] == 2
+
+
+def test_fail_gives_up_after_max_attempts():
+    job_id = submit(max_attempts=2)
+    for attempt in range(2):
+        make_available(job_id)
+        assert job_queue.lease('w1')['attempts'] == attempt + 1
+        job_queue.fail(job_id, 'w1', 'boom')
+    assert job_queue.get_job(job_id)['status'] == 'failed'
+    make_available(job_id)
+    assert job_queue.lease('w1') is None
+
+
+def test_fail_without_retry_is_final():
+    job_id = submit()
+    job_queue.lease('w1')
+    job_queue.fail(job_id, 'w1', 'bad document', retry=False)
+    assert job_queue.get_job(job_id)['status'] == 'failed'
+
+
+def test_expired_lease_is_released():
+    job_id = submit()
+    job_queue.lease('w1')
+    assert job_queue.lease('w2') is None
+    expire_lease(job_id)
+    job = job_queue.lease('w2')
+    assert job['id'] == job_id
+    assert job['attempts'] == 2
+    # The first worker lost its lease and can no longer settle the job
+    assert not job_queue.ack(job_id, 'w1')
+    assert job_queue.ack(job_id, 'w2')
+
+
+def test_expired_lease_without_attempts_left_fails():
+    job_id = submit(max_attempts=1)
+    job_queue.lease('w1')
+    expire_lease(job_id)
+    assert job_queue.lease('w2') is None
+    job = job_queue.get_job(job_id)
+    assert job['status'] == 'failed'
+    assert job['error'] == 'Worker stopped responding'
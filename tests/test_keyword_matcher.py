@@ -0,0 +1,47 @@
+"""
+Whole-word keyword matching with the compiled trie matcher.
+"""
+import pytest
+
+from utils.keyword_matcher import KeywordMatcher
+
+
+@pytest.mark.parametrize('keywords, text, expected', [
+    (['java'], "Java and JavaScript", {'java'}),
+    (['java'], "JavaScript only", set()),
+    (['js'], "Built with Vue.js", set()),
+    (['vue.js', 'vue'], "Built with Vue.js", {'vue.js'}),
+    (['r'], "Led R&D projects", set()),
+    (['r&d'], "Led R&D projects", {'r&d'}),
+    (['c'], "Fluent in C++ and C#", set()),
+    (['c++', 'c#'], "Fluent in C++ and C#", {'c++', 'c#'}),
+    (['c'], "Languages: C, Go", {'c'}),
+    (['python'], "I write Python.", {'python'}),
+    (['node.js'], "Services on Node.js.", {'node.js'}),
+    (['sql'], "PostgreSQL and MySQL", set()),
+])
+def test_whole_words(keywords, text, expected):
+    assert KeywordMatcher(keywords, whole_words=True).find(text) == expected
+
+
+def test_substring_mode_matches_inside_words():
+    assert KeywordMatcher(['java', 'js']).find("JavaScript on Vue.js") == {'java', 'js'}
+
+
+def test_prefix_keywords_are_implied_at_word_boundaries():
+    matcher = KeywordMatcher(['machine', 'machine learning', 'mach'], whole_words=True)
+    assert matcher.find("Machine learning engineer") == {'machine', 'machine learning'}
+
+
+def test_overlapping_keywords_are_all_found():
+    matcher = KeywordMatcher(['data', 'data science', 'science'], whole_words=True)
+    assert matcher.find("data science") == {'data', 'data science', 'science'}
+
+
+def test_original_spellings_are_returned():
+    matcher = KeywordMatcher(['PostgreSQL', 'postgresql'], whole_words=True)
+    assert matcher.find("POSTGRESQL") == {'PostgreSQL', 'postgresql'}
+
+
+def test_empty_keyword_set():
+    assert KeywordMatcher([], whole_words=True).find("anything") == set()
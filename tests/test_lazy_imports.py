@@ -0,0 +1,29 @@
+"""
+The utils package resolves its exports lazily.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    """Run code in a fresh interpreter, where nothing has been imported yet"""
+    return subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_unknown_attribute_imports_nothing():
+    assert _run(
+        "import sys, utils\n"
+        "print(hasattr(utils, 'nonexistent'), 'sqlalchemy' in sys.modules, 'utils.database' in sys.modules)"
+    ) == 'False False False'
+
+
+def test_exports_resolve_on_first_use():
+    assert _run(
+        "import sys, utils\n"
+        "print('utils.resume_analyzer' in sys.modules, utils.ResumeAnalyzer.__module__)"
+    ) == 'False utils.resume_analyzer'
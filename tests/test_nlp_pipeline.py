@@ -0,0 +1,47 @@
+"""
+The trimmed analytics pipeline against the full en_core_web_sm pipeline.
+
+Skipped unless spaCy and the model are installed.
+"""
+import pytest
+
+spacy = pytest.importorskip('spacy')
+
+from benchmarks.corpus import generate_corpus, resume_text
+from resume_analytics.analyzer import ResumeAnalyzer
+from resume_analytics.nlp import MODEL_NAME, load_nlp
+
+pytestmark = pytest.mark.skipif(not spacy.util.is_package(MODEL_NAME), reason=f"{MODEL_NAME} is not installed")
+
+
+@pytest.fixture(scope='module')
+def texts():
+    return [resume_text(data) for data in generate_corpus(5, 0, 3)]
+
+
+@pytest.fixture(scope='module')
+def slim():
+    return load_nlp()
+
+
+def _annotations(doc):
+    return [sent.text for sent in doc.sents], [(ent.text, ent.start_char, ent.label_) for ent in doc.ents]
+
+
+def test_slim_pipeline_matches_full_pipeline(texts, slim):
+    full = spacy.load(MODEL_NAME)
+    for text in texts:
+        assert _annotations(slim(text)) == _annotations(full(text))
+
+
+def test_pipe_matches_single_documents(texts, slim):
+    for text, doc in zip(texts, slim.pipe(texts, batch_size=2)):
+        assert _annotations(doc) == _annotations(slim(text))
+
+
+def test_analyze_many_matches_analyze_resume(texts, slim):
+    analyzer = ResumeAnalyzer(slim)
+    for text, result in zip(texts, analyzer.analyze_many(texts, batch_size=2)):
+        single = analyzer.analyze_resume(text)
+        assert result['metrics'] == single['metrics']
+        assert sorted(result['skills']) == sorted(single['skills'])
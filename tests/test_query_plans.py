@@ -0,0 +1,62 @@
+"""
+Query plans of the admin dashboard on a freshly migrated database.
+
+Run from the repository root with: python -m pytest tests
+"""
+import re
+
+import pytest
+
+from config.database import init_database, get_database_connection
+from config.db_pool import get_pool
+from config.migrations import MIGRATIONS, get_schema_version
+from dashboard.dashboard import DashboardManager
+
+# Dashboard methods that query the database; the exports dump every row on purpose
+QUERY_METHODS = [
+    'get_resume_metrics',
+    'get_skill_distribution',
+    'get_weekly_trends',
+    'get_job_category_stats',
+    'get_resume_data',
+    'get_database_stats',
+    'get_admin_logs',
+    'get_trend_indicators',
+    'get_detailed_insights',
+    'get_quick_stats'
+]
+
+INDEXED_STEP = re.compile(r'USING (COVERING )?INDEX|USING INTEGER PRIMARY KEY')
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    # resume_data.db is opened relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    init_database()
+    yield get_database_connection()
+    get_pool().close_all()
+
+
+def test_schema_is_current(conn):
+    assert get_schema_version(conn) == MIGRATIONS[-1][0]
+
+
+def test_dashboard_queries_use_indexes(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        dashboard = DashboardManager()
+        for method in QUERY_METHODS:
+            getattr(dashboard, method)()
+    finally:
+        conn.set_trace_callback(None)
+
+    queries = [sql for sql in statements if sql.lstrip().upper().startswith('SELECT')]
+    assert queries
+    for sql in queries:
+        plan = [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql)]
+        steps = [step for step in plan if step.startswith(('SCAN', 'SEARCH'))]
+        assert steps, sql
+        for step in steps:
+            assert INDEXED_STEP.search(step), f"{step} in:\n{sql}"
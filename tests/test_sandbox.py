@@ -0,0 +1,41 @@
+"""
+A real analysis, job description included, inside the sandbox's limits.
+"""
+import pytest
+
+from benchmarks.corpus import generate_corpus, resume_pdf, resume_text
+from config.job_roles import JOB_ROLES
+from utils.analysis_result import AnalysisResult
+from utils.incremental_analysis import AnalysisState
+from utils.sandbox import MEMORY_LIMIT_MB, SandboxPool, address_space_peak_mb, analyze_document
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer to build REST APIs in Python and Django, "
+    "run PostgreSQL and Redis on AWS, ship with Docker and Kubernetes, and "
+    "mentor junior developers in an agile team. "
+) * 20
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = SandboxPool(processes=1)
+    yield pool
+    pool.close()
+
+
+def test_job_description_analysis_fits_memory_limit(pool):
+    role = next(iter(next(iter(JOB_ROLES.values())).values()))
+    requirements = dict(role, job_description=JOB_DESCRIPTION)
+    # Long enough to reach the 50-page extraction cap
+    pdf = resume_pdf(resume_text(generate_corpus(1, 0, 60)[0]))
+
+    reply = pool.run(analyze_document, pdf, requirements, AnalysisState())
+    analysis = AnalysisResult.from_bytes(reply['analysis'])
+    assert analysis.document_type == 'resume'
+    assert analysis.jd_match is not None
+    assert reply['info']['page_count'] >= 1
+
+    peak = pool.run(address_space_peak_mb)
+    if peak is not None:
+        # Keep a quarter of the cap spare for larger uploads
+        assert peak < MEMORY_LIMIT_MB * 0.75
@@ -0,0 +1,45 @@
+"""
+The single-pass section segmenter against the per-section scans it replaced.
+"""
+import pytest
+
+from benchmarks.segmenter_benchmark import PAGE, legacy_all_sections
+from utils.incremental_analysis import AnalysisState
+from utils.resume_analyzer import ResumeAnalyzer
+
+RESUMES = [
+    PAGE,
+    PAGE * 3,
+    "",
+    "Jane Doe\njane@example.com\nNo headers at all",
+    # Inline content after a header keyword, and a line naming two sections
+    "Summary: backend engineer\nPython developer\n\nEducation and Experience\nBSc, State University\n",
+    # A boundary keyword ends the section before it
+    "SKILLS\nPython, SQL\nAchievements\nWon a hackathon\n\nPROJECTS\nResume parser\n",
+    "career objective\nBuild things\n\n\nWORK HISTORY\nAcme 2019 - 2021\n   \nGlobex 2021 - Present\n",
+]
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ResumeAnalyzer()
+
+
+@pytest.mark.parametrize('text', RESUMES)
+def test_matches_legacy_extractors(analyzer, text):
+    assert analyzer.segment_sections(text) == legacy_all_sections(analyzer, text)
+
+
+@pytest.mark.parametrize('text', RESUMES)
+def test_memoised_classification_matches(analyzer, text):
+    state = AnalysisState()
+    assert analyzer.segment_sections(text, state) == analyzer.segment_sections(text)
+    # A second pass is served from the per-line memo
+    assert analyzer.segment_sections(text, state) == analyzer.segment_sections(text)
+
+
+def test_unsectioned_lines_are_collected(analyzer):
+    unsectioned = []
+    sections = analyzer.segment_sections("Jane Doe\nJan 2019 - Present\n\nSKILLS\nPython\n", unsectioned=unsectioned)
+    assert unsectioned == ['Jane Doe', 'Jan 2019 - Present']
+    assert sections['skills'] == ['Python']
@@ -0,0 +1,86 @@
+"""
+Skills found in free text by the compiled skill registry.
+"""
+import pytest
+
+from utils.skill_registry import INFERRED_CREDIT, get_skill_registry
+
+
+@pytest.fixture(scope='module')
+def registry():
+    return get_skill_registry()
+
+
+@pytest.mark.parametrize('text, skill', [
+    ("John R. Smith", 'R'),
+    ("Able to express ideas clearly", 'Express'),
+    ("Led a swift migration to the new office", 'Swift'),
+    ("Event orchestration for 200 guests", 'Kubernetes'),
+    ("Olympic torch bearer", 'PyTorch'),
+    ("Moved the team to the cloud", 'Cloud Platforms'),
+    ("Designed public APIs for partners", 'REST APIs'),
+    ("Kept documents under version control", 'Git'),
+    ("Profile on github", 'Git'),
+    ("Promoted unity across departments", 'Unity'),
+    ("Each node of the tree", 'Node.js'),
+])
+def test_common_words_are_not_skills(registry, text, skill):
+    assert skill not in registry.find(text)
+
+
+@pytest.mark.parametrize('text, skill', [
+    ("Statistics in R programming and RStudio", 'R'),
+    ("Built iOS apps with SwiftUI", 'Swift'),
+    ("REST services on Express.js", 'Express'),
+    ("Games in Unity3D", 'Unity'),
+    ("Deployed on Kubernetes (k8s)", 'Kubernetes'),
+    ("Trained models in PyTorch", 'PyTorch'),
+    ("Services on Node.js", 'Node.js'),
+])
+def test_qualified_forms_are_skills(registry, text, skill):
+    assert skill in registry.find(text)
+
+
+def test_common_word_skills_normalize_when_listed(registry):
+    assert registry.canonical('R') == 'R'
+    assert registry.category('Swift') == 'Programming'
+
+
+def test_phrase_matcher_skips_common_words(registry):
+    spacy = pytest.importorskip('spacy')
+    from resume_analytics.nlp import build_skill_matcher
+    nlp = spacy.blank('en')
+    matcher = build_skill_matcher(nlp, registry)
+    doc = nlp("John R. Smith can express ideas and led a swift migration to the cloud with Express.js")
+    assert {nlp.vocab.strings[match_id] for match_id, _, _ in matcher(doc)} == {'Express'}
+
+
+@pytest.mark.parametrize('name, canonical', [
+    ('postgres', 'PostgreSQL'),
+    (' Postgres ', 'PostgreSQL'),
+    ("['k8s']", 'Kubernetes'),
+    ('NodeJS', 'Node.js'),
+    ('Underwater basket weaving', None),
+])
+def test_aliases_resolve_to_canonical_names(registry, name, canonical):
+    assert registry.canonical(name) == canonical
+
+
+def test_normalize_keys_aliases_and_unknown_skills(registry):
+    assert registry.normalize('Postgres') == registry.normalize('PostgreSQL') == 'postgresql'
+    assert registry.normalize('  Underwater   Basket ') == 'underwater basket'
+
+
+def test_ancestors_earn_partial_credit(registry):
+    credits = registry.skill_credits("Built reports on Postgres", ['PostgreSQL', 'SQL', 'MySQL'])
+    assert credits == {'postgresql': 1.0, 'sql': INFERRED_CREDIT}
+
+
+def test_direct_mention_beats_inferred_credit(registry):
+    credits = registry.skill_credits("SQL on Postgres", ['SQL'])
+    assert credits == {'sql': 1.0}
+
+
+def test_unknown_skills_fall_back_to_substrings(registry):
+    credits = registry.skill_credits("Underwater basket weaving", ['Underwater basket', 'Origami'])
+    assert credits == {'underwater basket': 1.0}
@@ -0,0 +1,47 @@
+"""
+Picking the extraction backend from a document's leading bytes.
+"""
+import io
+
+import pytest
+
+from utils.text_extraction import OLE_MAGIC, UnsupportedFormatError, TextExtractor, sniff_format
+
+
+@pytest.mark.parametrize('data, file_format', [
+    (b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n', 'pdf'),
+    # Readers accept junk before the header within the first kilobyte
+    (b'\xef\xbb\xbf' + b' ' * 500 + b'%PDF-1.4', 'pdf'),
+    (b'PK\x03\x04\x14\x00\x06\x00', 'docx'),
+    (b'Jane Doe\nSoftware Engineer\n', 'text'),
+    ('Zoë Müller – Ingenieurin'.encode('utf-8'), 'text'),
+    (b'', 'text'),
+    (bytearray(b'%PDF-1.4'), 'pdf'),
+    (memoryview(b'PK\x03\x04'), 'docx'),
+])
+def test_sniff_format(data, file_format):
+    assert sniff_format(data) == file_format
+
+
+def test_pdf_header_past_the_window_is_not_a_pdf():
+    assert sniff_format(b' ' * 2000 + b'%PDF-1.4') == 'text'
+
+
+def test_legacy_doc_is_rejected():
+    with pytest.raises(UnsupportedFormatError, match='Legacy .doc'):
+        sniff_format(OLE_MAGIC + b'\x00' * 100)
+
+
+def test_binary_files_are_rejected():
+    with pytest.raises(UnsupportedFormatError, match='binary'):
+        sniff_format(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
+
+
+def test_unsupported_format_is_a_value_error():
+    assert issubclass(UnsupportedFormatError, ValueError)
+
+
+def test_plain_text_is_decoded():
+    extractor = TextExtractor()
+    assert extractor.extract_text(io.BytesIO('\ufeffJane Doe\nCafé'.encode('utf-8'))) == 'Jane Doe\nCafé'
+    assert extractor.extract_text(b'Caf\xe9') == 'Café'
@@ -1,9 +1,29 @@
 """
 Utils package for Smart Resume AI
+
+Exports are resolved lazily so that importing one submodule (for example
+utils.resume_analyzer) does not also load python-docx, pandas and
+SQLAlchemy through the builder, Excel manager and ORM modules.
 """
+import importlib
+
+_EXPORTS = {
+    'ResumeAnalyzer': '.resume_analyzer',
+    'ResumeBuilder': '.resume_builder',
+    'ResumeParser': '.resume_parser',
+    'ExcelManager': '.excel_manager',
+    # The SQLAlchemy models formerly re-exported with "from .database import *"
+    'Base': '.database',
+    'Resume': '.database',
+    'Analysis': '.database',
+    'DatabaseManager': '.database',
+}
+
 
-from .resume_analyzer import ResumeAnalyzer
-from .resume_builder import ResumeBuilder
-from .resume_parser import ResumeParser
-from .excel_manager import ExcelManager
-from .database import * 
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,156 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from config.database import get_database_connection
+from .analysis_result import AnalysisResult
+from .resume_analyzer import ANALYZER_VERSION
+
+# Bounds on the SQLite tier, enforced by purge()
+MAX_AGE_DAYS = 30
+MAX_ROWS = 20000
+# purge() also runs after this many stores by one process
+PURGE_EVERY = 500
+
+
+class AnalysisCache:
+    """Content-addressed cache of resume analyses.
+
+    Results are keyed on the uploaded bytes, the target category/role and the
+    analyzer version. A bounded in-memory LRU sits in front of an optional
+    SQLite table so results also survive server restarts. Both tiers hold
+    the compact AnalysisResult encoding, roughly a tenth of the size of
+    the live object, and decode it on a hit. The SQLite tier is bounded by
+    age and row count; purge() enforces both every PURGE_EVERY stores and
+    from `python -m config.maintenance purge-cache`.
+    """
+
+    def __init__(self, max_entries=256, persistent=True):
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        self.stores = 0
+
+    @staticmethod
+    def make_key(file_bytes, category, role, version=ANALYZER_VERSION, job_description=None):
+        """Build the cache key for an upload analyzed against a target role"""
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        key = f"{digest}:{category}:{role}:{version}"
+        if job_description:
+            key += ':' + hashlib.sha256(job_description.encode('utf-8')).hexdigest()[:16]
+        return key
+
+    def get(self, key):
+        """Return {'analysis': AnalysisResult, 'resume_id': id} for key, or None on a miss"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.counters['memory_hits'] += 1
+
+        if entry is None:
+            entry = self._load(key) if self.persistent else None
+            with self.lock:
+                if entry is None:
+                    self.counters['misses'] += 1
+                    return None
+                self.counters['disk_hits'] += 1
+                self._remember(key, entry)
+        payload, resume_id = entry
+        return {'analysis': AnalysisResult.from_bytes(payload), 'resume_id': resume_id}
+
+    def put(self, key, analysis, resume_id=None):
+        """Store an AnalysisResult, and the resume row it was saved as, under key"""
+        entry = (analysis.to_bytes(), resume_id)
+        with self.lock:
+            self._remember(key, entry)
+        if self.persistent:
+            self._store(key, entry)
+            with self.lock:
+                self.stores += 1
+                due = self.stores % PURGE_EVERY == 0
+            if due:
+                self.purge()
+
+    def purge(self, max_age_days=MAX_AGE_DAYS, max_rows=MAX_ROWS):
+        """Delete persisted entries older than max_age_days and all but the newest max_rows.
+
+        Returns the number of rows deleted.
+        """
+        conn = get_database_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM analysis_cache WHERE created_at < datetime('now', ?)",
+                (f'-{int(max_age_days)} days',)
+            )
+            deleted = cursor.rowcount
+            cursor.execute('''
+            DELETE FROM analysis_cache WHERE rowid IN (
+                SELECT rowid FROM analysis_cache
+                ORDER BY created_at DESC, rowid DESC
+                LIMIT -1 OFFSET ?
+            )
+            ''', (max_rows,))
+            deleted += cursor.rowcount
+            conn.commit()
+            return deleted
+        except Exception as e:
+            print(f"Error purging analysis cache: {str(e)}")
+            conn.rollback()
+            return 0
+
+    def stats(self):
+        """Return hit/miss counters for the admin dashboard"""
+        with self.lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self.entries)
+        stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups * 100, 1) if lookups else 0
+        return stats
+
+    def _remember(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _load(self, key):
+        conn = get_database_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('SELECT payload, resume_id FROM analysis_cache WHERE cache_key = ?', (key,))
+            row = cursor.fetchone()
+            return (bytes(row[0]), row[1]) if row else None
+        except Exception as e:
+            print(f"Error reading analysis cache: {str(e)}")
+            return None
+
+    def _store(self, key, entry):
+        conn = get_database_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+            INSERT OR REPLACE INTO analysis_cache (cache_key, payload, resume_id)
+            VALUES (?, ?, ?)
+            ''', (key, entry[0], entry[1]))
+            conn.commit()
+        except Exception as e:
+            print(f"Error writing analysis cache: {str(e)}")
+            conn.rollback()
+
+
+_analysis_cache = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """Return the process-wide analysis cache shared by all sessions"""
+    global _analysis_cache
+    with _analysis_cache_lock:
+        if _analysis_cache is None:
+            _analysis_cache = AnalysisCache()
+        return _analysis_cache
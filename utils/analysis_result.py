@@ -0,0 +1,128 @@
+import json
+import zlib
+from collections.abc import Mapping
+
+# Bump when FIELDS changes so stale encodings are rejected instead of misread
+FORMAT_VERSION = 2
+MAGIC = b'AR'
+
+# Stored fields, in constructor and encoding order
+FIELDS = (
+    'document_type', 'ats_score', 'keyword_match', 'section_score', 'format_score',
+    'personal_info', 'role_matches', 'jd_match', 'education', 'experience',
+    'projects', 'skills', 'summary', 'section_suggestions', 'section_scores', 'experience_years'
+)
+PERSONAL_FIELDS = ('name', 'email', 'phone', 'linkedin', 'github', 'portfolio')
+SUGGESTION_SECTIONS = ('contact', 'summary', 'skills', 'experience', 'education', 'format')
+
+# Keys of the dict analyze_resume used to return, in their old order
+LEGACY_KEYS = PERSONAL_FIELDS + (
+    'ats_score', 'document_type', 'keyword_match', 'role_matches', 'section_score',
+    'format_score', 'education', 'experience', 'projects', 'skills', 'summary', 'suggestions'
+) + tuple(f'{section}_suggestions' for section in SUGGESTION_SECTIONS) + ('section_scores', 'jd_match', 'experience_years')
+
+
+class AnalysisResult(Mapping):
+    """Result of ResumeAnalyzer.analyze_resume.
+
+    Fields live in __slots__ and every value is stored once: suggestions
+    are kept per section and the combined list is only built when asked
+    for, and personal details stay in one dict. For existing callers it
+    still reads like the old result dict (result['ats_score'],
+    result.get('name')); fields that do not apply are None and look
+    missing, as they were absent from the dict.
+
+    to_bytes() packs the fields positionally into zlib-compressed JSON
+    behind a version header; from_bytes() reverses it.
+    """
+
+    __slots__ = FIELDS + ('_suggestions',)
+
+    def __init__(self, document_type, ats_score=0, keyword_match=None, section_score=0,
+                 format_score=0, personal_info=None, role_matches=None, jd_match=None,
+                 education=None, experience=None, projects=None, skills=None, summary=None,
+                 section_suggestions=None, section_scores=None, experience_years=None):
+        self.document_type = document_type
+        self.ats_score = ats_score
+        self.keyword_match = keyword_match or {
+            'score': 0, 'found_skills': [], 'inferred_skills': [], 'missing_skills': []
+        }
+        self.section_score = section_score
+        self.format_score = format_score
+        self.personal_info = personal_info
+        self.role_matches = role_matches
+        self.jd_match = jd_match
+        self.education = education
+        self.experience = experience
+        self.projects = projects
+        self.skills = skills
+        self.summary = summary
+        self.section_suggestions = section_suggestions
+        self.section_scores = section_scores
+        self.experience_years = experience_years
+        self._suggestions = None
+
+    @property
+    def suggestions(self):
+        """All suggestions in section order, built on first access"""
+        if self._suggestions is None:
+            if self.document_type != 'resume':
+                self._suggestions = [
+                    f"This appears to be a {self.document_type} document. Please upload a resume for ATS analysis."
+                ]
+            else:
+                suggestions = [
+                    suggestion
+                    for section in SUGGESTION_SECTIONS
+                    for suggestion in (self.section_suggestions or {}).get(section, [])
+                ]
+                self._suggestions = suggestions or ["Your resume is well-optimized for ATS systems"]
+        return self._suggestions
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        if key == 'suggestions':
+            return self.suggestions
+        value = None
+        if key in PERSONAL_FIELDS:
+            value = self.personal_info.get(key) if self.personal_info is not None else None
+        elif key.endswith('_suggestions') and key[:-len('_suggestions')] in SUGGESTION_SECTIONS:
+            if self.section_suggestions is not None:
+                value = self.section_suggestions.get(key[:-len('_suggestions')])
+        elif key in FIELDS:
+            value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key in LEGACY_KEYS:
+            if key in self:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"AnalysisResult(document_type={self.document_type!r}, ats_score={self.ats_score!r})"
+
+    def to_dict(self):
+        """Return the result as a plain dict with the old keys"""
+        return dict(self)
+
+    def to_bytes(self):
+        """Encode the result into its compact versioned binary form"""
+        payload = json.dumps([getattr(self, field) for field in FIELDS], separators=(',', ':'), ensure_ascii=False)
+        return MAGIC + bytes([FORMAT_VERSION]) + zlib.compress(payload.encode('utf-8'))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decode a result written by to_bytes, rejecting other formats"""
+        data = bytes(data)
+        if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not an encoded AnalysisResult")
+        version = data[len(MAGIC)]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported AnalysisResult format version: {version}")
+        return cls(*json.loads(zlib.decompress(data[len(MAGIC) + 1:])))
@@ -0,0 +1,145 @@
+"""
+Background workers draining the analysis job queue.
+
+Each worker leases a job, extracts and analyzes the document in the
+sandbox, saves the resume and its analysis, stores the result in the
+analysis cache for the UI to pick up and acks the job. The app runs
+EMBEDDED_WORKERS worker threads itself; more can be added on the same host
+by starting this module any number of times.
+
+Usage: python -m utils.analysis_worker [--concurrency 2] [--poll-interval 0.5]
+"""
+import argparse
+import os
+import signal
+import socket
+import sys
+import threading
+
+from config.database import init_database, save_resume_batch
+from .analysis_cache import get_analysis_cache
+from .job_queue import lease, ack, fail, purge_jobs, VISIBILITY_TIMEOUT
+from .sandbox import analyze_in_sandbox, SandboxError
+from .timing import record_timings, save_timings, note
+
+# Worker threads started inside the Streamlit server process
+EMBEDDED_WORKERS = 1
+POLL_INTERVAL = 0.5
+
+
+def save_analysis(analysis, category, role):
+    """Save an analyzed resume and its scores in one transaction; returns the resume id"""
+    resume_data = {
+        'personal_info': {
+            'full_name': analysis.get('name', ''),
+            'email': analysis.get('email', ''),
+            'phone': analysis.get('phone', ''),
+            'linkedin': analysis.get('linkedin', ''),
+            'github': analysis.get('github', ''),
+            'portfolio': analysis.get('portfolio', '')
+        },
+        'summary': analysis.get('summary', ''),
+        'target_role': role,
+        'target_category': category,
+        'education': analysis.get('education', []),
+        'experience': analysis.get('experience', []),
+        'projects': analysis.get('projects', []),
+        'skills': analysis.get('skills', []),
+        'template': ''
+    }
+    resume_ids = save_resume_batch([(resume_data, {
+        'ats_score': analysis['ats_score'],
+        'keyword_match_score': analysis['keyword_match']['score'],
+        'format_score': analysis['format_score'],
+        'section_score': analysis['section_score'],
+        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+        'recommendations': ','.join(analysis['suggestions'])
+    })])
+    if not resume_ids:
+        # Raising sends the job through fail(), which retries it
+        raise RuntimeError("Could not save the analyzed resume")
+    return resume_ids[0]
+
+
+class AnalysisWorker:
+    """Lease, process and ack jobs until stopped"""
+
+    def __init__(self, worker_id=None, poll_interval=POLL_INTERVAL, visibility_timeout=VISIBILITY_TIMEOUT):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+
+    def process(self, job):
+        """Analyze and save one job; returns (resume_id, state)"""
+        params = job['params']
+        with record_timings() as timings:
+            note(file_type=job['file_type'], size_bytes=len(job['document']))
+            analysis, state = analyze_in_sandbox(job['document'], params['job_requirements'], job['state'])
+        save_timings(timings)
+        resume_id = save_analysis(analysis, params['category'], params['role'])
+        get_analysis_cache().put(job['cache_key'], analysis, resume_id)
+        return resume_id, state
+
+    def run_once(self):
+        """Process one job if one is available; returns False when the queue was empty"""
+        job = lease(self.worker_id, self.visibility_timeout)
+        if job is None:
+            return False
+        try:
+            resume_id, state = self.process(job)
+        except SandboxError as e:
+            # The document itself is the problem; retrying would fail the same way
+            fail(job['id'], self.worker_id, e, retry=False)
+        except Exception as e:
+            print(f"Error processing analysis job {job['id']}: {str(e)}")
+            fail(job['id'], self.worker_id, e)
+        else:
+            ack(job['id'], self.worker_id, resume_id, state)
+        return True
+
+    def run(self, stop_event):
+        """Drain the queue until stop_event is set"""
+        while not stop_event.is_set():
+            if not self.run_once():
+                stop_event.wait(self.poll_interval)
+
+
+def start_background_workers(count=EMBEDDED_WORKERS, poll_interval=POLL_INTERVAL):
+    """Start count daemon worker threads; returns the event that stops them"""
+    stop_event = threading.Event()
+    for index in range(count):
+        worker = AnalysisWorker(f"{socket.gethostname()}:{os.getpid()}:{index}", poll_interval)
+        threading.Thread(
+            target=worker.run, args=(stop_event,), name=f"analysis-worker-{index}", daemon=True
+        ).start()
+    return stop_event
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Process queued resume analyses")
+    parser.add_argument('--concurrency', type=int, default=2, help="Jobs processed at once by this process")
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL,
+                        help="Seconds to wait when the queue is empty")
+    args = parser.parse_args(argv)
+
+    init_database()
+    purge_jobs()
+    stop_event = start_background_workers(args.concurrency, args.poll_interval)
+
+    def stop(signum, frame):
+        print("Stopping after the current jobs...")
+        stop_event.set()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    print(f"Analysis worker {os.getpid()} running {args.concurrency} job(s) at a time")
+    while not stop_event.is_set():
+        stop_event.wait(1)
+    for thread in threading.enumerate():
+        if thread.name.startswith('analysis-worker-'):
+            thread.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Headless batch analysis of a directory of resumes.
+
+Usage:
+    python -m utils.batch_analyze resumes/ --role "Data Scientist" --workers 8 --output results.jsonl
+    python -m utils.batch_analyze resumes/ --role "Data Scientist" --job-description postings/*.txt
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from config.database import init_database, save_resume_batch
+from config.job_roles import JOB_ROLES
+from .resume_analyzer import ResumeAnalyzer
+from .text_extraction import get_text_extractor
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+CSV_COLUMNS = [
+    'file', 'status', 'error', 'document_type', 'name', 'email', 'phone',
+    'ats_score', 'keyword_match_score', 'format_score', 'section_score',
+    'missing_skills', 'jd_match_score', 'jd_best_match', 'best_role', 'best_role_score'
+]
+
+# One analyzer per worker process, built on first use
+_analyzer = None
+
+
+def find_role(role_name, category=None):
+    """Look up a role in JOB_ROLES, returning (category, role, role_info)"""
+    for category_name, roles in JOB_ROLES.items():
+        if category and category_name.lower() != category.lower():
+            continue
+        for name, info in roles.items():
+            if name.lower() == role_name.lower():
+                return category_name, name, info
+    raise ValueError(f"Unknown job role: {role_name}")
+
+
+def iter_resume_files(directory, recursive=False):
+    """Yield resume files in directory in a stable order"""
+    pattern = '**/*' if recursive else '*'
+    for path in sorted(Path(directory).glob(pattern)):
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS:
+            yield str(path)
+
+
+def analyze_file(path, category, role, role_info):
+    """Extract and analyze a single resume; runs inside a worker process"""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = ResumeAnalyzer()
+
+    result = {'file': path, 'status': 'ok', 'error': ''}
+    try:
+        text = get_text_extractor().extract_text(path)
+        analysis = _analyzer.analyze_resume({'raw_text': text}, role_info)
+    except Exception as e:
+        result.update(status='error', error=str(e))
+        return result
+
+    result.update({
+        'document_type': analysis.get('document_type'),
+        'name': analysis.get('name', ''),
+        'email': analysis.get('email', ''),
+        'phone': analysis.get('phone', ''),
+        'ats_score': analysis['ats_score'],
+        'keyword_match_score': analysis['keyword_match']['score'],
+        'format_score': analysis['format_score'],
+        'section_score': analysis['section_score'],
+        'missing_skills': analysis['keyword_match']['missing_skills'],
+        'jd_match_score': analysis.get('jd_match', {}).get('score', ''),
+        'jd_best_match': (analysis.get('jd_match', {}).get('matches') or [{}])[0].get('title', ''),
+        'best_role': (analysis.get('role_matches') or [{}])[0].get('role', ''),
+        'best_role_score': (analysis.get('role_matches') or [{}])[0].get('score', ''),
+        'resume_data': {
+            'personal_info': {
+                'full_name': analysis.get('name', ''),
+                'email': analysis.get('email', ''),
+                'phone': analysis.get('phone', ''),
+                'linkedin': analysis.get('linkedin', ''),
+                'github': analysis.get('github', ''),
+                'portfolio': analysis.get('portfolio', '')
+            },
+            'summary': analysis.get('summary', ''),
+            'target_role': role,
+            'target_category': category,
+            'education': analysis.get('education', []),
+            'experience': analysis.get('experience', []),
+            'projects': analysis.get('projects', []),
+            'skills': analysis.get('skills', []),
+            'template': ''
+        },
+        'analysis_data': {
+            'ats_score': analysis['ats_score'],
+            'keyword_match_score': analysis['keyword_match']['score'],
+            'format_score': analysis['format_score'],
+            'section_score': analysis['section_score'],
+            'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+            'recommendations': ','.join(analysis['suggestions'])
+        }
+    })
+    return result
+
+
+class ResultWriter:
+    """Stream results to a JSONL or CSV file as they arrive"""
+
+    def __init__(self, output, output_format):
+        self.output_format = output_format
+        self.file = sys.stdout if output == '-' else open(output, 'w', newline='', encoding='utf-8')
+        self.csv_writer = None
+        if output_format == 'csv':
+            self.csv_writer = csv.DictWriter(self.file, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+            self.csv_writer.writeheader()
+
+    def write(self, result):
+        row = {key: value for key, value in result.items() if key not in ('resume_data', 'analysis_data')}
+        if self.csv_writer:
+            row['missing_skills'] = ','.join(row.get('missing_skills', []))
+            self.csv_writer.writerow(row)
+        else:
+            self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def run_batch(directory, role_name, category=None, workers=None, output='-',
+              output_format='jsonl', save_to_db=True, db_batch_size=200, recursive=False,
+              job_description_files=None):
+    """Analyze every resume in directory across a process pool"""
+    category, role, role_info = find_role(role_name, category)
+    if job_description_files:
+        job_descriptions = []
+        for path in job_description_files:
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                job_descriptions.append(f.read())
+        role_info = dict(
+            role_info,
+            job_descriptions=job_descriptions,
+            job_titles=[os.path.basename(path) for path in job_description_files]
+        )
+    files = list(iter_resume_files(directory, recursive))
+    workers = workers or os.cpu_count() or 1
+
+    if save_to_db:
+        init_database()
+
+    writer = ResultWriter(output, output_format)
+    pending = []
+    counts = {'ok': 0, 'error': 0, 'saved': 0}
+    start = time.perf_counter()
+
+    def flush():
+        if pending:
+            counts['saved'] += len(save_resume_batch(pending))
+            pending.clear()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, min(32, len(files) // (workers * 4) or 1))
+            results = executor.map(
+                analyze_file, files,
+                [category] * len(files), [role] * len(files), [role_info] * len(files),
+                chunksize=chunksize
+            )
+            for result in results:
+                counts[result['status']] += 1
+                writer.write(result)
+                if save_to_db and result['status'] == 'ok' and result['document_type'] == 'resume':
+                    pending.append((result['resume_data'], result['analysis_data']))
+                    if len(pending) >= db_batch_size:
+                        flush()
+        if save_to_db:
+            flush()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    counts['files'] = len(files)
+    counts['seconds'] = round(elapsed, 2)
+    counts['files_per_second'] = round(len(files) / elapsed, 1) if elapsed else 0
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze a directory of resumes against a job role")
+    parser.add_argument('directory', help="Directory containing PDF/DOCX resumes")
+    parser.add_argument('--role', required=True, help="Target role name from JOB_ROLES")
+    parser.add_argument('--category', help="Job category, if the role name is ambiguous")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--output', default='-', help="Output file (default: stdout)")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl', help="Output format")
+    parser.add_argument('--recursive', action='store_true', help="Include subdirectories")
+    parser.add_argument('--no-db', action='store_true', help="Do not insert results into resume_data.db")
+    parser.add_argument('--db-batch-size', type=int, default=200, help="Rows per database transaction")
+    parser.add_argument('--job-description', nargs='+', metavar='FILE',
+                        help="Text files with job descriptions to score every resume against")
+    args = parser.parse_args(argv)
+
+    try:
+        counts = run_batch(
+            args.directory, args.role, category=args.category, workers=args.workers,
+            output=args.output, output_format=args.format, save_to_db=not args.no_db,
+            db_batch_size=args.db_batch_size, recursive=args.recursive,
+            job_description_files=args.job_description
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(
+        f"Analyzed {counts['files']} files ({counts['ok']} ok, {counts['error']} failed, "
+        f"{counts['saved']} saved) in {counts['seconds']}s - {counts['files_per_second']} files/s",
+        file=sys.stderr
+    )
+    return 0 if counts['error'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Streaming DOCX text extraction.
+
+Reads the WordprocessingML parts straight out of the zip with iterparse
+instead of building python-docx's object model, clearing every element as
+soon as its text has been taken. Memory stays flat however long the
+document is, and the text of tables, text boxes, headers and footers is
+included; python-docx's doc.paragraphs skips all of them.
+"""
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+from .pdf_extractor import ExtractionLimitError, MAX_BYTES, _open_source
+
+# Uncompressed XML read per document; guards against zip bombs
+MAX_XML_BYTES = 64 * 1024 * 1024
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+BODY = W + 'body'
+PARAGRAPH = W + 'p'
+TEXT = W + 't'
+# Run content that stands for a character
+CHARACTERS = {W + 'tab': '\t', W + 'br': '\n', W + 'cr': '\n', W + 'noBreakHyphen': '-'}
+
+DOCUMENT_PART = 'word/document.xml'
+HEADER_FOOTER_PART = re.compile(r'word/(header|footer)(\d*)\.xml$')
+
+
+def _text_parts(archive):
+    """Names of the parts to read: headers, the document body, then footers"""
+    names = archive.namelist()
+    if DOCUMENT_PART not in names:
+        raise ValueError("Not a Word document: word/document.xml is missing")
+    found = {'header': [], 'footer': []}
+    for name in names:
+        match = HEADER_FOOTER_PART.match(name)
+        if match:
+            found[match.group(1)].append((int(match.group(2) or 0), name))
+    return (
+        [name for _, name in sorted(found['header'])] + [DOCUMENT_PART] +
+        [name for _, name in sorted(found['footer'])]
+    )
+
+
+def _iter_part_paragraphs(stream):
+    """Yield the text of every paragraph in one part, in closing order.
+
+    A paragraph inside a table cell or text box is yielded as its own line
+    before the paragraph that hosts it. Text in mc:Fallback blocks, which
+    repeat the mc:Choice content for older readers, is skipped.
+    """
+    paragraphs = []  # Text pieces of each open paragraph, innermost last
+    open_elements = []
+    container = None  # The part's root element, then w:body
+    in_fallback = 0
+    for event, elem in iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            open_elements.append(elem)
+            if container is None or tag == BODY:
+                container = elem
+            elif tag == PARAGRAPH:
+                paragraphs.append([])
+            elif tag == MC_FALLBACK:
+                in_fallback += 1
+            continue
+
+        open_elements.pop()
+        if tag == PARAGRAPH:
+            pieces = paragraphs.pop()
+            if not in_fallback:
+                yield ''.join(pieces)
+        elif tag == MC_FALLBACK:
+            in_fallback -= 1
+        elif paragraphs and not in_fallback:
+            if tag == TEXT:
+                if elem.text:
+                    paragraphs[-1].append(elem.text)
+            elif tag in CHARACTERS:
+                paragraphs[-1].append(CHARACTERS[tag])
+
+        # Drop finished top-level blocks so the parsed tree never holds
+        # more than the block being read
+        if open_elements and open_elements[-1] is container:
+            container.clear()
+
+
+def iter_docx_paragraphs(source, max_bytes=MAX_BYTES, max_xml_bytes=MAX_XML_BYTES):
+    """Yield the text of every paragraph of a DOCX, including tables and headers.
+
+    source may be a file path, a bytes-like object or a seekable file object.
+    """
+    stream, size = _open_source(source)
+    if max_bytes is not None and size > max_bytes:
+        raise ExtractionLimitError(f"DOCX is {size:,} bytes, larger than the {max_bytes:,} byte limit")
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile:
+        raise ValueError("Not a Word document: the file is not a zip archive")
+
+    with archive:
+        parts = _text_parts(archive)
+        xml_bytes = sum(archive.getinfo(name).file_size for name in parts)
+        if max_xml_bytes is not None and xml_bytes > max_xml_bytes:
+            raise ExtractionLimitError(
+                f"DOCX text is {xml_bytes:,} bytes uncompressed, larger than the {max_xml_bytes:,} byte limit"
+            )
+        for name in parts:
+            with archive.open(name) as part:
+                yield from _iter_part_paragraphs(part)
+
+
+def extract_docx_text(source, max_bytes=MAX_BYTES, max_xml_bytes=MAX_XML_BYTES):
+    """Extract the text of a DOCX, one line per paragraph"""
+    return '\n'.join(iter_docx_paragraphs(source, max_bytes, max_xml_bytes))
@@ -0,0 +1,105 @@
+"""
+Total work experience from the employment date ranges in a resume.
+
+One precompiled regex pass finds ranges such as "Jan 2019 - Present",
+"03/2017 to 11/2018" or "2015 – 2018". Each range becomes a half-open
+interval of month numbers, and the intervals are merged with a sort and a
+sweep, so overlapping or back-to-back jobs are only counted once. The
+cost is O(n log n) in the number of ranges, and the result for each text
+is cached.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+MONTH_NAME = (
+    r'jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?'
+)
+YEAR = r'(?:19|20)\d{2}'
+
+
+def _date(prefix):
+    """Pattern for one date, with group names starting with prefix"""
+    return (
+        rf'(?:(?P<{prefix}name>{MONTH_NAME})\.?,?\s*(?P<{prefix}name_year>{YEAR})'
+        rf'|(?P<{prefix}month>0?[1-9]|1[0-2])\s*[/.]\s*(?P<{prefix}month_year>{YEAR})'
+        rf'|(?P<{prefix}year>{YEAR}))'
+    )
+
+
+DATE_RANGE = re.compile(
+    rf'(?<![\w/.-]){_date("start_")}'
+    r'\s*(?:-|–|—|to|until|till)\s*'
+    rf'(?:{_date("end_")}|(?P<present>present|current|now|today|date|ongoing))(?!\w|[/.-]\d)',
+    re.IGNORECASE
+)
+
+
+def _month_number(match, prefix):
+    """Months since year 0 of the date matched under prefix; a bare year means January"""
+    if match.group(f'{prefix}name'):
+        return int(match.group(f'{prefix}name_year')) * 12 + MONTHS[match.group(f'{prefix}name')[:3].lower()] - 1
+    if match.group(f'{prefix}month'):
+        return int(match.group(f'{prefix}month_year')) * 12 + int(match.group(f'{prefix}month')) - 1
+    return int(match.group(f'{prefix}year')) * 12
+
+
+def current_month():
+    """Months since year 0 of today's month"""
+    today = date.today()
+    return today.year * 12 + today.month - 1
+
+
+def find_date_ranges(text, now=None):
+    """Return every date range in text as a half-open (start, end) month interval.
+
+    An end month counts in full, but a bare end year stops at its January,
+    so "2016 - 2018" is two years rather than three. "Present" ends at now,
+    and ranges that end before they start or lie in the future are dropped.
+    """
+    now = current_month() if now is None else now
+    ranges = []
+    for match in DATE_RANGE.finditer(text):
+        start = _month_number(match, 'start_')
+        if match.group('present'):
+            end = now + 1
+        elif match.group('end_year'):
+            end = max(_month_number(match, 'end_'), start + 1)
+        else:
+            end = _month_number(match, 'end_') + 1
+        end = min(end, now + 1)
+        if start < end:
+            ranges.append((start, end))
+    return ranges
+
+
+def merge_ranges(ranges):
+    """Merge overlapping or touching intervals with one sort and one sweep"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+@lru_cache(maxsize=1024)
+def _experience_months(text, now):
+    return sum(end - start for start, end in merge_ranges(find_date_ranges(text, now)))
+
+
+def experience_months(text, now=None):
+    """Total months covered by the date ranges in text, overlaps counted once"""
+    return _experience_months(text, current_month() if now is None else now)
+
+
+def experience_years(text, now=None):
+    """Total experience in years, rounded to one decimal"""
+    return round(experience_months(text, now) / 12, 1)
@@ -0,0 +1,89 @@
+class AnalysisState:
+    """Work remembered from one user's previous analysis.
+
+    Passed to ResumeAnalyzer.analyze_resume so that re-uploading an edited
+    resume only pays for what changed:
+
+    * every keyword scan (section headers, document type, skills) is done
+      per line and memoised, so unchanged lines are never scanned again;
+    * the result of each per-section extractor is kept together with the
+      section entries it was computed from and reused while they match.
+
+    None of the keywords span a line break, so unioning per-line matches
+    gives exactly the whole-text result. Only lines of the latest resume
+    are kept, which bounds the memo to roughly one resume per user.
+    """
+
+    def __init__(self):
+        self.line_hits = {}
+        self.line_classes = {}
+        self.sections = {}
+        self.changed_sections = []
+        self.reused_sections = []
+        self.seen_lines = set()
+        self.counters = {'lines': 0, 'scanned_lines': 0}
+
+    def to_dict(self):
+        """Return the remembered work as JSON-serializable data"""
+        return {
+            'line_hits': [[name, line, sorted(found)] for (name, line), found in self.line_hits.items()],
+            'line_classes': [[line, sorted(found)] for line, found in self.line_classes.items()],
+            'sections': [[name, list(entries), result] for name, (entries, result) in self.sections.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a state saved with to_dict"""
+        state = cls()
+        state.line_hits = {(name, line): frozenset(found) for name, line, found in data['line_hits']}
+        state.line_classes = {line: set(found) for line, found in data['line_classes']}
+        state.sections = {name: (tuple(entries), result) for name, entries, result in data['sections']}
+        return state
+
+    def begin(self):
+        """Start a new analysis run"""
+        self.changed_sections = []
+        self.reused_sections = []
+        self.seen_lines = set()
+        self.counters = {'lines': 0, 'scanned_lines': 0}
+
+    def finish(self):
+        """Forget lines that are no longer part of the resume"""
+        seen = self.seen_lines
+        self.line_classes = {line: found for line, found in self.line_classes.items() if line in seen}
+        self.line_hits = {key: found for key, found in self.line_hits.items() if key[1] in seen}
+
+    def find(self, name, matcher, text_lower):
+        """Union of matcher.find_lower over the lines of text, memoised per line"""
+        found = set()
+        hits = self.line_hits
+        for line in set(text_lower.split('\n')):
+            key = (name, line)
+            line_found = hits.get(key)
+            if line_found is None:
+                line_found = hits[key] = frozenset(matcher.find_lower(line))
+                self.counters['scanned_lines'] += 1
+            self.counters['lines'] += 1
+            self.seen_lines.add(line)
+            found |= line_found
+        return found
+
+    def classify_line(self, segmenter, line_lower):
+        """Memoised SectionSegmenter.classify_line"""
+        found = self.line_classes.get(line_lower)
+        if found is None:
+            found = self.line_classes[line_lower] = segmenter.classify_line(line_lower)
+        self.seen_lines.add(line_lower)
+        return found
+
+    def section_result(self, name, entries, compute):
+        """Return compute(), reusing the last result while entries are unchanged"""
+        entries = tuple(entries)
+        previous = self.sections.get(name)
+        if previous is not None and previous[0] == entries:
+            self.reused_sections.append(name)
+            return previous[1]
+        result = compute()
+        self.sections[name] = (entries, result)
+        self.changed_sections.append(name)
+        return result
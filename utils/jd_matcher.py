@@ -0,0 +1,110 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from config.job_roles import JOB_ROLES
+
+# Fitted models kept per distinct set of job descriptions
+MAX_CACHED_MODELS = 32
+
+
+def _role_corpus():
+    """Role descriptions used as background documents for the IDF weights"""
+    return [
+        f"{role['description']} {' '.join(role['required_skills'])}"
+        for roles in JOB_ROLES.values()
+        for role in roles.values()
+    ]
+
+
+class JDMatcher:
+    """TF-IDF model over a fixed set of job descriptions.
+
+    The vectorizer is fitted once and the descriptions are kept as an
+    L2-normalised sparse matrix, so scoring a resume against every
+    description is a single sparse matrix product (cosine similarity).
+    The built-in role descriptions are mixed into the fit as background
+    documents so that a single pasted description still gets useful IDF
+    weights.
+    """
+
+    def __init__(self, job_descriptions, titles=None):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        import numpy as np
+
+        self.job_descriptions = list(job_descriptions)
+        self.titles = list(titles) if titles else [f"Job description {i + 1}" for i in range(len(self.job_descriptions))]
+        self.vectorizer = TfidfVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),
+            sublinear_tf=True,
+            # Keep tokens like C++, C# and Node.js intact
+            token_pattern=r'(?u)\b\w[\w+#]*(?:\.\w+)*',
+            dtype=np.float32
+        )
+        self.vectorizer.fit(self.job_descriptions + _role_corpus())
+        self.matrix = self.vectorizer.transform(self.job_descriptions).tocsr()
+        self.terms = self.vectorizer.get_feature_names_out()
+
+    def score_matrix(self, resume_texts):
+        """Return a (resumes x job descriptions) array of similarities in 0-100"""
+        vectors = self.vectorizer.transform(resume_texts)
+        return (vectors @ self.matrix.T).toarray() * 100
+
+    def score(self, resume_text):
+        """Return the similarity of one resume to every job description"""
+        return self.score_matrix([resume_text])[0]
+
+    def missing_terms(self, resume_text, index, limit=10):
+        """Highest-weighted terms of one job description that the resume lacks"""
+        present = set(self.vectorizer.transform([resume_text]).indices)
+        row = self.matrix.getrow(index)
+        ranked = sorted(zip(row.data, row.indices), reverse=True)
+        # Bigrams help the similarity score but make noisy suggestions
+        return [
+            self.terms[term] for _, term in ranked
+            if term not in present and ' ' not in self.terms[term]
+        ][:limit]
+
+    def match(self, resume_text, top_k=5, missing_limit=10):
+        """Score a resume and describe its best matching job descriptions"""
+        scores = self.score(resume_text)
+        best = scores.argsort()[::-1][:top_k]
+        matches = [
+            {'index': int(i), 'title': self.titles[i], 'score': round(float(scores[i]), 1)}
+            for i in best
+        ]
+        top = int(best[0]) if len(best) else None
+        return {
+            'score': matches[0]['score'] if matches else 0,
+            'matches': matches,
+            'missing_terms': self.missing_terms(resume_text, top, missing_limit) if top is not None else []
+        }
+
+
+_models = OrderedDict()
+_models_lock = threading.Lock()
+
+
+def _model_key(job_descriptions, titles):
+    digest = hashlib.sha256()
+    for text in list(job_descriptions) + list(titles or []):
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def get_jd_matcher(job_descriptions, titles=None):
+    """Return a fitted JDMatcher, reusing it for the same job descriptions"""
+    key = _model_key(job_descriptions, titles)
+    with _models_lock:
+        if key in _models:
+            _models.move_to_end(key)
+            return _models[key]
+
+    matcher = JDMatcher(job_descriptions, titles)
+    with _models_lock:
+        _models[key] = matcher
+        while len(_models) > MAX_CACHED_MODELS:
+            _models.popitem(last=False)
+    return matcher
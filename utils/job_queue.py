@@ -0,0 +1,211 @@
+"""
+Durable analysis job queue stored in the analysis_jobs table.
+
+Jobs move queued -> running -> done, or back to queued for a retry, and
+end up failed after max_attempts. A worker leases one job at a time with a
+single atomic UPDATE ... RETURNING, so any number of worker threads and
+processes on the host can drain the same queue. A lease that is not acked
+or failed within its visibility timeout (because the worker died) makes
+the job available again, and the queue lives in the database so it
+survives restarts.
+"""
+import json
+import time
+
+from config.database import get_database_connection
+from .incremental_analysis import AnalysisState
+
+VISIBILITY_TIMEOUT = 120
+MAX_ATTEMPTS = 3
+# Seconds before retry n is attempted: RETRY_DELAY * 2 ** (n - 1)
+RETRY_DELAY = 2
+
+JOB_COLUMNS = (
+    'id', 'cache_key', 'status', 'file_type', 'params', 'attempts',
+    'max_attempts', 'error', 'resume_id', 'created_at', 'updated_at'
+)
+
+
+def _job(row):
+    job = dict(zip(JOB_COLUMNS, row))
+    job['params'] = json.loads(job['params'])
+    return job
+
+
+def _dump_state(state):
+    return json.dumps(state.to_dict()) if state is not None else None
+
+
+def _load_state(value):
+    return AnalysisState.from_dict(json.loads(value)) if value is not None else None
+
+
+def enqueue(cache_key, document, file_type, params, state=None, max_attempts=MAX_ATTEMPTS):
+    """Queue a document for analysis and return the job id.
+
+    A job that is still pending for the same cache key is reused, so a
+    double-submitted upload is only analyzed once. params must be JSON
+    serializable; state is an optional AnalysisState to continue from.
+    """
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        # Take the write lock before looking, so two processes can't both
+        # miss the pending job and insert one each
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute('''
+        SELECT id FROM analysis_jobs
+        WHERE cache_key = ? AND status IN ('queued', 'running')
+        ORDER BY id LIMIT 1
+        ''', (cache_key,))
+        row = cursor.fetchone()
+        if row:
+            conn.commit()
+            return row[0]
+
+        now = time.time()
+        cursor.execute('''
+        INSERT INTO analysis_jobs (
+            cache_key, status, document, file_type, params, state,
+            max_attempts, available_at, created_at, updated_at
+        ) VALUES (?, 'queued', ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            cache_key, document, file_type, json.dumps(params),
+            _dump_state(state), max_attempts, now, now, now
+        ))
+        conn.commit()
+        return cursor.lastrowid
+    except Exception as e:
+        print(f"Error queueing analysis job: {str(e)}")
+        conn.rollback()
+        raise
+
+
+def lease(worker_id, visibility_timeout=VISIBILITY_TIMEOUT):
+    """Claim the oldest available job for worker_id, or return None.
+
+    The returned job includes its document bytes and state. It stays
+    invisible to other workers for visibility_timeout seconds.
+    """
+    conn = get_database_connection()
+    now = time.time()
+    try:
+        cursor = conn.cursor()
+        # Expired leases that used up their attempts will never be retried
+        cursor.execute('''
+        UPDATE analysis_jobs
+        SET status = 'failed', error = 'Worker stopped responding', document = NULL,
+            updated_at = ?
+        WHERE status = 'running' AND lease_until < ? AND attempts >= max_attempts
+        ''', (now, now))
+        cursor.execute(f'''
+        UPDATE analysis_jobs
+        SET status = 'running', attempts = attempts + 1, worker_id = ?,
+            lease_until = ?, updated_at = ?
+        WHERE id = (
+            SELECT id FROM analysis_jobs
+            WHERE (status = 'queued' AND available_at <= ?)
+               OR (status = 'running' AND lease_until < ?)
+            ORDER BY id
+            LIMIT 1
+        )
+        RETURNING {', '.join(JOB_COLUMNS)}, document, state
+        ''', (worker_id, now + visibility_timeout, now, now, now))
+        row = cursor.fetchone()
+        conn.commit()
+    except Exception as e:
+        print(f"Error leasing analysis job: {str(e)}")
+        conn.rollback()
+        return None
+
+    if row is None:
+        return None
+    job = _job(row[:len(JOB_COLUMNS)])
+    job['document'] = row[-2]
+    job['state'] = _load_state(row[-1])
+    return job
+
+
+def ack(job_id, worker_id, resume_id=None, state=None):
+    """Mark a leased job done; returns False if the lease was lost meanwhile"""
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        UPDATE analysis_jobs
+        SET status = 'done', resume_id = ?, state = ?, document = NULL,
+            error = NULL, lease_until = NULL, updated_at = ?
+        WHERE id = ? AND worker_id = ? AND status = 'running'
+        ''', (
+            resume_id, _dump_state(state), time.time(), job_id, worker_id
+        ))
+        conn.commit()
+        return cursor.rowcount == 1
+    except Exception as e:
+        print(f"Error acknowledging analysis job: {str(e)}")
+        conn.rollback()
+        return False
+
+
+def fail(job_id, worker_id, error, retry=True):
+    """Record a failed attempt, requeueing with backoff while attempts remain"""
+    conn = get_database_connection()
+    now = time.time()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        UPDATE analysis_jobs
+        SET status = CASE WHEN ? AND attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+            document = CASE WHEN ? AND attempts < max_attempts THEN document ELSE NULL END,
+            available_at = ? + ? * (1 << (attempts - 1)),
+            error = ?, lease_until = NULL, updated_at = ?
+        WHERE id = ? AND worker_id = ? AND status = 'running'
+        ''', (retry, retry, now, RETRY_DELAY, str(error), now, job_id, worker_id))
+        conn.commit()
+        return cursor.rowcount == 1
+    except Exception as e:
+        print(f"Error failing analysis job: {str(e)}")
+        conn.rollback()
+        return False
+
+
+def get_job(job_id):
+    """Return a job's status fields (without its document), or None"""
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT {", ".join(JOB_COLUMNS)}, state FROM analysis_jobs WHERE id = ?', (job_id,))
+        row = cursor.fetchone()
+    except Exception as e:
+        print(f"Error reading analysis job: {str(e)}")
+        return None
+    if row is None:
+        return None
+    job = _job(row[:-1])
+    job['state'] = _load_state(row[-1]) if job['status'] == 'done' else None
+    return job
+
+
+def queue_position(job_id):
+    """Number of queued jobs ahead of job_id"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM analysis_jobs WHERE status = 'queued' AND id < ?", (job_id,))
+    return cursor.fetchone()[0]
+
+
+def purge_jobs(max_age_days=7):
+    """Delete finished jobs older than max_age_days"""
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        DELETE FROM analysis_jobs
+        WHERE status IN ('done', 'failed') AND updated_at < ?
+        ''', (time.time() - max_age_days * 86400,))
+        conn.commit()
+        return cursor.rowcount
+    except Exception as e:
+        print(f"Error purging analysis jobs: {str(e)}")
+        conn.rollback()
+        return 0
@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+
+# Whole-word boundaries. "+" and "#" belong to the word (c++, c#), and so
+# does a "." or "&" between word characters (vue.js, r&d), but a trailing
+# full stop does not
+WORD_START = r'(?<![\w+#])(?<!\w[.&])'
+WORD_END = r'(?![\w+#]|[.&]\w)'
+
+
+def trie_regex(words):
+    """Build a regex that matches the longest of ``words`` at a position.
+
+    The alternation is factored into a trie so the engine inspects one
+    character per step instead of retrying every keyword from scratch.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: keep extending past a shorter keyword when possible
+        if terminal:
+            body = '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Find every occurrence of a fixed keyword set in one pass over the text.
+
+    Matching is case-insensitive substring matching, the same semantics as
+    ``keyword.lower() in text.lower()``, but all keywords are compiled into a
+    single trie-shaped automaton instead of scanning the text once per keyword.
+    With ``whole_words=True`` a keyword only matches where it is not part of a
+    longer word, so "java" is not found in "javascript" and "js" is not
+    found in "vue.js".
+    """
+
+    def __init__(self, keywords, whole_words=False):
+        self.keywords = list(keywords)
+        self.whole_words = whole_words
+
+        # Several spellings may lower-case to the same keyword
+        self.originals = {}
+        for keyword in self.keywords:
+            if keyword:
+                self.originals.setdefault(keyword.lower(), []).append(keyword)
+
+        # Only the longest keyword at each position is reported, so every
+        # shorter keyword that is a prefix of it is implied by the match
+        # (in whole-word mode, only prefixes that end at a word boundary).
+        self.implied = {
+            keyword: frozenset(
+                keyword[:end] for end in range(1, len(keyword) + 1)
+                if keyword[:end] in self.originals and (not whole_words or self._ends_word(keyword, end))
+            )
+            for keyword in self.originals
+        }
+
+        pattern = trie_regex(self.originals)
+        if whole_words:
+            # Backtracking falls back to a shorter keyword when the longest
+            # candidate would end in the middle of a word
+            pattern = WORD_START + '(?:' + pattern + ')' + WORD_END
+        self.pattern = re.compile(pattern) if self.originals else None
+
+    @staticmethod
+    def _ends_word(keyword, end):
+        """True if keyword[:end] is followed by a word boundary inside keyword"""
+        return re.match(WORD_END, keyword[end:]) is not None
+
+    def find_lower(self, text_lower):
+        """Return the set of lower-cased keywords present in already lower-cased text"""
+        found = set()
+        if self.pattern is None:
+            return found
+        # Restart one character after each match start so overlapping keywords
+        # are found; search() skips quickly to the next possible first character
+        search = self.pattern.search
+        match = search(text_lower)
+        while match:
+            found |= self.implied[match.group()]
+            match = search(text_lower, match.start() + 1)
+        return found
+
+    def find(self, text):
+        """Return the set of keywords (as originally spelled) present in the text"""
+        return {
+            original
+            for keyword in self.find_lower(text.lower())
+            for original in self.originals[keyword]
+        }
+
+
+@lru_cache(maxsize=256)
+def get_keyword_matcher(keywords, whole_words=False):
+    """Return a compiled matcher for a tuple of keywords, built once per keyword set"""
+    return KeywordMatcher(keywords, whole_words)
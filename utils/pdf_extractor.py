@@ -0,0 +1,165 @@
+import io
+import os
+
+from .timing import note
+
+# Default limits so a huge or scanned PDF can't stall a worker
+MAX_PAGES = 50
+MAX_BYTES = 20 * 1024 * 1024
+
+# Below this many pages process start-up costs more than it saves
+PARALLEL_MIN_PAGES = 16
+
+
+class ExtractionLimitError(Exception):
+    """Raised when a document exceeds the configured extraction limits"""
+
+
+class BufferReader(io.RawIOBase):
+    """Read-only, seekable file object over a bytes-like object.
+
+    Unlike io.BytesIO, which copies a bytearray or memoryview it is given,
+    this reads straight from the caller's buffer; only the chunks the
+    parser asks for are copied out.
+    """
+
+    def __init__(self, buffer):
+        self.view = memoryview(buffer).cast('B')
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self.view[self.position:self.position + len(b)]
+        b[:len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self.position = offset
+        return offset
+
+    def tell(self):
+        return self.position
+
+
+def _open_source(source):
+    """Return (stream_or_path, size_in_bytes) for a path, buffer or file object"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source), os.path.getsize(source)
+
+    if isinstance(source, bytes):
+        # CPython's BytesIO shares an immutable bytes object until written to
+        return io.BytesIO(source), len(source)
+    if isinstance(source, (bytearray, memoryview)):
+        # BytesIO would copy a mutable buffer, so read it in place instead
+        return BufferReader(source), memoryview(source).nbytes
+
+    # File-like object (e.g. a Streamlit UploadedFile): read it in place
+    if hasattr(source, 'getbuffer'):
+        size = source.getbuffer().nbytes
+    else:
+        source.seek(0, io.SEEK_END)
+        size = source.tell()
+    source.seek(0)
+    return source, size
+
+
+def _check_size(size, max_bytes):
+    if max_bytes is not None and size > max_bytes:
+        raise ExtractionLimitError(
+            f"PDF is {size:,} bytes, larger than the {max_bytes:,} byte limit"
+        )
+
+
+def _page_text(page):
+    return page.extract_text() or ''
+
+
+def count_pdf_pages(source):
+    """Return the number of pages in a PDF"""
+    import PyPDF2
+    stream, _ = _open_source(source)
+    return len(PyPDF2.PdfReader(stream).pages)
+
+
+def iter_pdf_pages(source, max_pages=MAX_PAGES, max_bytes=MAX_BYTES):
+    """Yield the text of each page, stopping after max_pages pages"""
+    import PyPDF2
+
+    stream, size = _open_source(source)
+    _check_size(size, max_bytes)
+
+    pdf_reader = PyPDF2.PdfReader(stream)
+    yield from _reader_pages(pdf_reader, _pages_to_read(pdf_reader, max_pages))
+
+
+def _pages_to_read(pdf_reader, max_pages):
+    """Record the document's page count and return how many pages to extract"""
+    page_count = len(pdf_reader.pages)
+    note(page_count=page_count)
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    return page_count
+
+
+def _reader_pages(pdf_reader, page_count):
+    for index in range(page_count):
+        yield _page_text(pdf_reader.pages[index])
+
+
+def _extract_page_range(source, start, stop):
+    """Extract pages [start, stop) in a worker process"""
+    import PyPDF2
+
+    stream, _ = _open_source(source)
+    pdf_reader = PyPDF2.PdfReader(stream)
+    return [_page_text(pdf_reader.pages[index]) for index in range(start, stop)]
+
+
+def extract_pdf_text(source, max_pages=MAX_PAGES, max_bytes=MAX_BYTES, workers=None,
+                     parallel_min_pages=PARALLEL_MIN_PAGES):
+    """Extract the text of a PDF, one line break after every page.
+
+    source may be a file path, a bytes-like object or a seekable file object.
+    With workers > 1, documents of at least parallel_min_pages pages are split
+    into page ranges that are extracted in separate processes.
+    """
+    if not workers or workers < 2:
+        return ''.join(page + '\n' for page in iter_pdf_pages(source, max_pages, max_bytes))
+
+    import PyPDF2
+
+    stream, size = _open_source(source)
+    _check_size(size, max_bytes)
+    pdf_reader = PyPDF2.PdfReader(stream)
+    page_count = _pages_to_read(pdf_reader, max_pages)
+
+    if page_count < parallel_min_pages:
+        # Short document: keep reading with the reader that is already open
+        return ''.join(page + '\n' for page in _reader_pages(pdf_reader, page_count))
+
+    # Workers re-open paths themselves; in-memory documents have to be shipped
+    if isinstance(stream, str):
+        payload = stream
+    else:
+        stream.seek(0)
+        payload = stream.read()
+
+    chunk = -(-page_count // workers)
+    starts = list(range(0, page_count, chunk))
+    stops = [min(start + chunk, page_count) for start in starts]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as executor:
+        chunks = executor.map(_extract_page_range, [payload] * len(starts), starts, stops)
+        return ''.join(page + '\n' for pages in chunks for page in pages)
@@ -1,13 +1,22 @@
 import re
+from .analysis_result import AnalysisResult
+from .docx_extractor import extract_docx_text
+from .experience_dates import experience_years
+from .section_segmenter import SECTION_KEYWORDS, RESUME_KEYWORDS, get_resume_segmenter, employment_text
+from .keyword_matcher import get_keyword_matcher
+from .pdf_extractor import extract_pdf_text, MAX_PAGES
+from .role_matcher import get_role_matcher
+from .skill_registry import get_skill_registry
+from .timing import note, span
+
+# Bump whenever scoring changes so cached analyses are recomputed
+ANALYZER_VERSION = '9'
 
 class ResumeAnalyzer:
     def __init__(self):
         # Document type indicators
         self.document_types = {
-            'resume': [
-                'experience', 'education', 'skills', 'work', 'project', 'objective',
-                'summary', 'employment', 'qualification', 'achievements'
-            ],
+            'resume': RESUME_KEYWORDS,
             'marksheet': [
                 'grade', 'marks', 'score', 'semester', 'cgpa', 'sgpa', 'examination',
                 'result', 'academic year', 'percentage'
@@ -21,16 +30,30 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Section headers are compiled once and shared by every extract_* method
+        self.segmenter = get_resume_segmenter()
+
+        # One matcher finds the keywords of every document type in a single pass
+        self.document_type_matcher = get_keyword_matcher(
+            tuple(keyword for keywords in self.document_types.values() for keyword in keywords)
+        )
+
+        # Role x skill matrix used to rank every job role in one pass
+        self.role_matcher = get_role_matcher()
         
-    def detect_document_type(self, text):
+    def detect_document_type(self, text, found=None):
         text = text.lower()
+        if found is None:
+            found = self.document_type_matcher.find_lower(text)
+        word_count = len(text.split())
         scores = {}
         
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if keyword in found)
             density = matches / len(keywords)
-            frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
+            frequency = matches / (word_count + 1)  # Add 1 to avoid division by zero
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
         
         # Get the highest scoring document type
@@ -39,30 +62,50 @@ class ResumeAnalyzer:
         # Only return a document type if the score is significant
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
-    def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
+    def calculate_keyword_match(self, resume_text, required_skills, found_aliases=None):
+        # Skills are resolved through the canonical registry, so "JS" in the
+        # resume satisfies a required "JavaScript"; all of them are located
+        # in one pass over the text. Umbrella skills such as "Databases" are
+        # partially credited when a more specific skill implies them.
+        registry = get_skill_registry()
+        credits = registry.skill_credits(resume_text, required_skills, found_aliases)
         found_skills = []
+        inferred_skills = []
         missing_skills = []
-        
+        earned = 0
         for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            credit = credits.get(registry.normalize(skill), 0)
+            earned += credit
+            if credit == 1:
                 found_skills.append(skill)
+            elif credit:
+                inferred_skills.append(skill)
             else:
                 missing_skills.append(skill)
                 
-        match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
+        match_score = (earned / len(required_skills)) * 100 if required_skills else 0
         
         return {
             'score': match_score,
             'found_skills': found_skills,
+            'inferred_skills': inferred_skills,
             'missing_skills': missing_skills
         }
-        
+
+    def calculate_jd_match(self, resume_text, job_requirements):
+        """Score a resume against job_requirements['job_description(s)'], or None"""
+        job_descriptions = job_requirements.get('job_descriptions')
+        if not job_descriptions and job_requirements.get('job_description'):
+            job_descriptions = [job_requirements['job_description']]
+        job_descriptions = [jd for jd in (job_descriptions or []) if jd and jd.strip()]
+        if not job_descriptions:
+            return None
+        
+        from .jd_matcher import get_jd_matcher
+        titles = job_requirements.get('job_titles')
+        matcher = get_jd_matcher(tuple(job_descriptions), tuple(titles) if titles else None)
+        return matcher.match(resume_text)
+
     def check_resume_sections(self, text):
         text = text.lower()
         essential_sections = {
@@ -117,32 +160,17 @@ class ResumeAnalyzer:
             
         return max(0, score), deductions
         
-    def extract_text_from_pdf(self, file):
+    def extract_text_from_pdf(self, file, max_pages=MAX_PAGES, workers=None):
+        """Extract text from a PDF path, buffer or file object without copying it"""
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            return extract_pdf_text(file, max_pages=max_pages, workers=workers)
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
     def extract_text_from_docx(self, docx_file):
-        """Extract text from a DOCX file"""
+        """Extract the text of a DOCX path, buffer or file object, tables and headers included"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            return extract_docx_text(docx_file)
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
@@ -173,211 +201,56 @@ class ResumeAnalyzer:
             'portfolio': ''  # Can be enhanced later
         }
 
-    def extract_education(self, text):
-        """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
+    def segment_sections(self, text, state=None, unsectioned=None):
+        """Split resume text into its sections in a single pass"""
+        if state is None:
+            return self.segmenter.segment(text, unsectioned=unsectioned)
+        return self.segmenter.segment(
+            text, lambda line_lower: state.classify_line(self.segmenter, line_lower), unsectioned
+        )
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+    def extract_education(self, text, sections=None):
+        """Extract education information from resume text"""
+        if sections is None:
+            sections = self.segment_sections(text)
+        return list(sections['education'])
 
-    def extract_experience(self, text):
+    def extract_experience(self, text, sections=None):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        if sections is None:
+            sections = self.segment_sections(text)
+        return list(sections['experience'])
 
-    def extract_projects(self, text):
+    def extract_projects(self, text, sections=None):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
+        if sections is None:
+            sections = self.segment_sections(text)
+        return list(sections['projects'])
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
-
-    def extract_skills(self, text):
+    def extract_skills(self, text, sections=None):
         """Extract skills from resume text"""
+        if sections is None:
+            sections = self.segment_sections(text)
         skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
 
         # Common skill separators
         separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
+        for text_to_process in sections['skills']:
+            # Split by common separators
             for separator in separators:
                 if separator in text_to_process:
                     skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
+
         return list(skills)
 
-    def extract_summary(self, text):
+    def extract_summary(self, text, sections=None):
         """Extract summary/objective from resume text"""
+        if sections is None:
+            sections = self.segment_sections(text)
         summary = []
         lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
+        summary_keywords = SECTION_KEYWORDS['summary']
 
         # Try to find summary at the beginning of the resume
         start_index = 0
@@ -401,99 +274,13 @@ class ResumeAnalyzer:
                 if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
                     summary.append(potential_summary)
 
-        # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
-        
+        # Add the explicitly marked summary section
+        summary.extend(sections['summary'])
+
         return ' '.join(summary) if summary else ''
 
-    def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
-        text = resume_data.get('raw_text', '')
-        
-        # Extract personal information
-        personal_info = self.extract_personal_info(text)
-        
-        # First detect document type
-        doc_type = self.detect_document_type(text)
-        if doc_type != 'resume':
-            return {
-                'ats_score': 0,
-                'document_type': doc_type,
-                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                'section_score': 0,
-                'format_score': 0,
-                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
-            }
-            
-        # Calculate keyword match
-        required_skills = job_requirements.get('required_skills', [])
-        keyword_match = self.calculate_keyword_match(text, required_skills)
-        
-        # Extract all resume sections
-        education = self.extract_education(text)
-        experience = self.extract_experience(text)
-        projects = self.extract_projects(text)
-        skills = list(self.extract_skills(text))  # Convert skills set to list
-        summary = self.extract_summary(text)
-        
-        # Check resume sections
-        section_score = self.check_resume_sections(text)
-        
-        # Check formatting
-        format_score, format_deductions = self.check_formatting(text)
-        
-        # Generate section-specific suggestions
-        contact_suggestions = []
-        if not personal_info.get('email'):
-            contact_suggestions.append("Add your email address")
-        if not personal_info.get('phone'):
-            contact_suggestions.append("Add your phone number")
-        if not personal_info.get('linkedin'):
-            contact_suggestions.append("Add your LinkedIn profile URL")
-        
-        summary_suggestions = []
-        if not summary:
-            summary_suggestions.append("Add a professional summary to highlight your key qualifications")
-        elif len(summary.split()) < 30:
-            summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
-        elif len(summary.split()) > 100:
-            summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
-        
-        skills_suggestions = []
-        if not skills:
-            skills_suggestions.append("Add a dedicated skills section")
-        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
-            skills_suggestions.append("List more relevant technical and soft skills")
-        if keyword_match['score'] < 70:
-            skills_suggestions.append("Add more skills that match the job requirements")
-        
+    def suggest_experience(self, experience):
+        """Return suggestions for the work experience entries"""
         experience_suggestions = []
         if not experience:
             experience_suggestions.append("Add your work experience section")
@@ -509,7 +296,10 @@ class ResumeAnalyzer:
                 experience_suggestions.append("Use bullet points to list your achievements and responsibilities")
             if not has_action_verbs:
                 experience_suggestions.append("Start bullet points with strong action verbs")
-        
+        return experience_suggestions
+
+    def suggest_education(self, education, require_gpa=False):
+        """Return suggestions for the education entries"""
         education_suggestions = []
         if not education:
             education_suggestions.append("Add your educational background")
@@ -524,67 +314,184 @@ class ResumeAnalyzer:
                 education_suggestions.append("Include graduation dates")
             if not has_degree:
                 education_suggestions.append("Specify your degree type")
-            if not has_gpa and job_requirements.get('require_gpa', False):
+            if not has_gpa and require_gpa:
                 education_suggestions.append("Include your GPA if it's above 3.0")
+        return education_suggestions
+
+    def analyze_resume(self, resume_data, job_requirements, state=None):
+        """Analyze resume and return an AnalysisResult of scores and recommendations.
+
+        Pass the AnalysisState from the user's previous analysis to only
+        rescan changed lines and recompute changed sections.
+        """
+        text = resume_data.get('raw_text', '')
+        note(text_chars=len(text))
+        if state is not None:
+            state.begin()
+            with span('keyword_scan'):
+                text_lower = text.lower()
+                document_hits = state.find('document_type', self.document_type_matcher, text_lower)
+                skill_aliases = state.find('skills', get_skill_registry().matcher, text_lower)
+        else:
+            document_hits = skill_aliases = None
         
-        format_suggestions = []
-        if format_score < 100:
-            format_suggestions.extend(format_deductions)
-        
-        # Calculate section-specific scores
-        contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
-        summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
-        skills_score = keyword_match['score']
-        experience_score = 100 - (len(experience_suggestions) * 25)
-        education_score = 100 - (len(education_suggestions) * 25)
-        
-        # Calculate overall ATS score with weighted components
-        ats_score = (
-            int(round(contact_score * 0.1)) +      # 10% weight for contact info
-            int(round(summary_score * 0.1)) +      # 10% weight for summary
-            int(round(skills_score * 0.3)) +       # 30% weight for skills match
-            int(round(experience_score * 0.2)) +   # 20% weight for experience
-            int(round(education_score * 0.1)) +    # 10% weight for education
-            int(round(format_score * 0.2))         # 20% weight for formatting
-        )
+        # Extract personal information
+        with span('personal_info'):
+            personal_info = self.extract_personal_info(text)
         
-        # Combine all suggestions into a single list
-        suggestions = []
-        suggestions.extend(contact_suggestions)
-        suggestions.extend(summary_suggestions)
-        suggestions.extend(skills_suggestions)
-        suggestions.extend(experience_suggestions)
-        suggestions.extend(education_suggestions)
-        suggestions.extend(format_suggestions)
+        # First detect document type
+        with span('document_type'):
+            doc_type = self.detect_document_type(text, document_hits)
+        note(document_type=doc_type)
+        if doc_type != 'resume':
+            if state is not None:
+                state.finish()
+            return AnalysisResult(doc_type)
+            
+        # Calculate keyword match
+        required_skills = job_requirements.get('required_skills', [])
+        with span('keyword_match'):
+            keyword_match = self.calculate_keyword_match(text, required_skills, skill_aliases)
+        
+        # Optional similarity against pasted job descriptions
+        with span('jd_match'):
+            jd_match = self.calculate_jd_match(text, job_requirements)
+        
+        # Best fitting roles across all of JOB_ROLES
+        with span('role_match'):
+            role_matches = self.role_matcher.top_roles(text, job_requirements.get('top_roles', 5), skill_aliases)
+        
+        # Extract all resume sections from a single segmentation pass
+        with span('segment_sections'):
+            unsectioned = []
+            sections = self.segment_sections(text, state, unsectioned)
+        with span('extract_education'):
+            education = self.extract_education(text, sections)
+        with span('extract_experience'):
+            experience = self.extract_experience(text, sections)
+        with span('experience_dates'):
+            # The experience section often ends early, at the first bullet
+            # that mentions another section's keyword, so the lines outside
+            # every section count too
+            total_experience = experience_years(employment_text(experience, unsectioned))
+        with span('extract_projects'):
+            projects = self.extract_projects(text, sections)
+        with span('extract_summary'):
+            summary = self.extract_summary(text, sections)
+        with span('extract_skills'):
+            if state is None:
+                skills = self.extract_skills(text, sections)
+            else:
+                skills = state.section_result(
+                    'skills', sections['skills'], lambda: self.extract_skills(text, sections)
+                )
         
-        if not suggestions:
-            suggestions.append("Your resume is well-optimized for ATS systems")
+        # Check resume sections
+        with span('check_sections'):
+            section_score = self.check_resume_sections(text)
         
-        return {
-            **personal_info,  # Include extracted personal info
-            'ats_score': ats_score,
-            'document_type': 'resume',
-            'keyword_match': keyword_match,
-            'section_score': section_score,
-            'format_score': format_score,
-            'education': education,
-            'experience': experience,
-            'projects': projects,
-            'skills': skills,
-            'summary': summary,
-            'suggestions': suggestions,
-            'contact_suggestions': contact_suggestions,
-            'summary_suggestions': summary_suggestions,
-            'skills_suggestions': skills_suggestions,
-            'experience_suggestions': experience_suggestions,
-            'education_suggestions': education_suggestions,
-            'format_suggestions': format_suggestions,
-            'section_scores': {
+        # Check formatting
+        with span('check_formatting'):
+            format_score, format_deductions = self.check_formatting(text)
+        
+        # Suggestions and the weighted ATS score
+        with span('scoring'):
+            # Generate section-specific suggestions
+            contact_suggestions = []
+            if not personal_info.get('email'):
+                contact_suggestions.append("Add your email address")
+            if not personal_info.get('phone'):
+                contact_suggestions.append("Add your phone number")
+            if not personal_info.get('linkedin'):
+                contact_suggestions.append("Add your LinkedIn profile URL")
+        
+            summary_suggestions = []
+            if not summary:
+                summary_suggestions.append("Add a professional summary to highlight your key qualifications")
+            elif len(summary.split()) < 30:
+                summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
+            elif len(summary.split()) > 100:
+                summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
+        
+            skills_suggestions = []
+            if not skills:
+                skills_suggestions.append("Add a dedicated skills section")
+            if isinstance(skills, (list, set)) and len(list(skills)) < 5:
+                skills_suggestions.append("List more relevant technical and soft skills")
+            if keyword_match['score'] < 70:
+                skills_suggestions.append("Add more skills that match the job requirements")
+            if jd_match and jd_match['score'] < 50 and jd_match['missing_terms']:
+                skills_suggestions.append(
+                    "Mirror the job description's wording, e.g. " + ', '.join(jd_match['missing_terms'][:5])
+                )
+        
+            require_gpa = job_requirements.get('require_gpa', False)
+            if state is None:
+                experience_suggestions = self.suggest_experience(experience)
+                education_suggestions = self.suggest_education(education, require_gpa)
+            else:
+                experience_suggestions = state.section_result(
+                    'experience', experience, lambda: self.suggest_experience(experience)
+                )
+                education_suggestions = state.section_result(
+                    f'education:{require_gpa}', education, lambda: self.suggest_education(education, require_gpa)
+                )
+        
+            format_suggestions = []
+            if format_score < 100:
+                format_suggestions.extend(format_deductions)
+        
+            # Calculate section-specific scores
+            contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
+            summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
+            skills_score = keyword_match['score']
+            experience_score = 100 - (len(experience_suggestions) * 25)
+            education_score = 100 - (len(education_suggestions) * 25)
+        
+            # Calculate overall ATS score with weighted components
+            ats_score = (
+                int(round(contact_score * 0.1)) +      # 10% weight for contact info
+                int(round(summary_score * 0.1)) +      # 10% weight for summary
+                int(round(skills_score * 0.3)) +       # 30% weight for skills match
+                int(round(experience_score * 0.2)) +   # 20% weight for experience
+                int(round(education_score * 0.1)) +    # 10% weight for education
+                int(round(format_score * 0.2))         # 20% weight for formatting
+            )
+        
+        # Suggestions are kept per section; result.suggestions combines them
+        result = AnalysisResult(
+            'resume',
+            ats_score=ats_score,
+            keyword_match=keyword_match,
+            section_score=section_score,
+            format_score=format_score,
+            personal_info=personal_info,
+            role_matches=role_matches,
+            jd_match=jd_match or None,
+            education=education,
+            experience=experience,
+            projects=projects,
+            skills=skills,
+            summary=summary,
+            section_suggestions={
+                'contact': contact_suggestions,
+                'summary': summary_suggestions,
+                'skills': skills_suggestions,
+                'experience': experience_suggestions,
+                'education': education_suggestions,
+                'format': format_suggestions
+            },
+            section_scores={
                 'contact': contact_score,
                 'summary': summary_score,
                 'skills': skills_score,
                 'experience': experience_score,
                 'education': education_score,
                 'format': format_score
-            }
-        }
+            },
+            experience_years=total_experience
+        )
+        
+        if state is not None:
+            state.finish()
+        return result
@@ -1,7 +1,8 @@
-import PyPDF2
-import docx
 import re
-from io import BytesIO
+from .docx_extractor import extract_docx_text
+from .pdf_extractor import extract_pdf_text
+from .text_extraction import get_text_extractor
+from .skill_registry import get_skill_registry
 
 class ResumeParser:
     def __init__(self):
@@ -9,55 +10,35 @@ class ResumeParser:
         
     def extract_text_from_pdf(self, pdf_file):
         try:
-            pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file.read()))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return extract_pdf_text(pdf_file).strip()
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
             
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return extract_docx_text(docx_file).strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
             
     def extract_text(self, file):
-        file_content = file.read()
-        file.seek(0)  # Reset file pointer
-        
-        if file.name.endswith('.pdf'):
-            return self.extract_text_from_pdf(file)
-        elif file.name.endswith('.docx'):
-            return self.extract_text_from_docx(file)
-        else:
+        # The format comes from the file's content, not its name
+        try:
+            return get_text_extractor().extract_text(file).strip()
+        except Exception as e:
+            print(f"Error extracting text: {e}")
             return ""
             
     def parse(self, file):
         text = self.extract_text(file)
         
         # Simple keyword-based parsing
-        skills = []
         experience = []
         education = []
         
-        # Common programming languages and tools
-        skill_keywords = ['python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular', 'vue', 
-                         'node', 'express', 'django', 'flask', 'spring', 'docker', 'kubernetes', 'aws', 
-                         'azure', 'git', 'jenkins', 'jira']
-                         
-        # Look for skills
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill in text_lower:
-                skills.append(skill)
+        # Look for skills from the canonical registry
+        skills = sorted(get_skill_registry().find(text))
                 
         return {
             "skills": skills,
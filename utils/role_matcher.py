@@ -0,0 +1,69 @@
+from functools import lru_cache
+
+import numpy as np
+
+from config.job_roles import JOB_ROLES
+from .skill_registry import get_skill_registry
+
+
+class RoleMatcher:
+    """Rank every role in JOB_ROLES against a resume in one pass.
+
+    The required skills of all roles are compiled into a role x skill
+    matrix once, with skills normalised through the skill registry. A
+    resume is reduced to a vector of per-skill credits with a single
+    keyword scan, and one matrix-vector product yields the keyword match
+    score of every role - the same score calculate_keyword_match gives for
+    a single role.
+    """
+
+    def __init__(self, job_roles=JOB_ROLES):
+        self.registry = get_skill_registry()
+        self.roles = []
+        skill_index = {}
+        rows = []
+        for category, roles in job_roles.items():
+            for role, info in roles.items():
+                self.roles.append((category, role))
+                rows.append([
+                    skill_index.setdefault(self.registry.normalize(skill), len(skill_index))
+                    for skill in info['required_skills']
+                ])
+
+        self.skills = list(skill_index)
+        self.matrix = np.zeros((len(self.roles), len(self.skills)), dtype=np.float32)
+        for row, columns in enumerate(rows):
+            # Two spellings of one skill in a role count twice, as they do
+            # in calculate_keyword_match
+            np.add.at(self.matrix[row], columns, 1)
+        # Every role's score is the share of its own required skills found
+        self.role_sizes = np.maximum(self.matrix.sum(axis=1), 1)
+
+    def skill_vector(self, resume_text, found_aliases=None):
+        """Return the credit (1, partial or 0) the resume earns for each skill"""
+        credits = self.registry.skill_credits(resume_text, self.skills, found_aliases)
+        return np.array([credits.get(skill, 0) for skill in self.skills], dtype=np.float32)
+
+    def scores(self, resume_text, found_aliases=None):
+        """Return the keyword match score (0-100) of every role, in self.roles order"""
+        return self.matrix @ self.skill_vector(resume_text, found_aliases) / self.role_sizes * 100
+
+    def top_roles(self, resume_text, k=5, found_aliases=None):
+        """Return the k best matching roles as dicts, best first"""
+        scores = self.scores(resume_text, found_aliases)
+        # Stable sort keeps JOB_ROLES order among equal scores
+        best = np.argsort(-scores, kind='stable')[:k]
+        return [
+            {
+                'category': self.roles[i][0],
+                'role': self.roles[i][1],
+                'score': round(float(scores[i]), 1)
+            }
+            for i in best
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_role_matcher():
+    """Return the role matcher for JOB_ROLES, built once per process"""
+    return RoleMatcher()
@@ -0,0 +1,279 @@
+"""
+Sandboxed worker processes for extracting and analyzing untrusted uploads.
+
+A malformed or huge document can spin in PyPDF2 or in a backtracking
+regex for minutes. Running each job in a separate, recyclable process keeps
+that off the Streamlit script thread:
+
+* every job has a wall-clock timeout; a worker that misses it is killed
+  and replaced without disturbing jobs running in the other workers;
+* each worker has an RLIMIT_AS address-space cap and a per-job RLIMIT_CPU
+  budget, so runaway allocations and loops fail inside the worker;
+* workers are replaced after max_tasks jobs to bound leaks;
+* every failure reaches the caller as a SandboxError with a readable
+  message instead of taking the server process down.
+
+Resource limits are only applied where the resource module exists (not on
+Windows); the timeout and recycling work everywhere.
+"""
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from .pdf_extractor import MAX_PAGES
+
+# Defaults for the shared sandbox used by the app
+SANDBOX_PROCESSES = 2
+MAX_TASKS_PER_WORKER = 50
+JOB_TIMEOUT = 30
+# A worker with numpy and scikit-learn preloaded maps about 490 MB, and a
+# 50-page resume scored against a job description peaks near 500 MB, which
+# leaves about half of the cap as headroom (tests/test_sandbox.py)
+MEMORY_LIMIT_MB = 1024
+CPU_LIMIT = 20
+
+# One analyzer per worker process, built on first use
+_analyzer = None
+
+
+class SandboxError(Exception):
+    """Raised when a sandboxed job fails, crashes or exceeds its limits"""
+
+
+class SandboxTimeout(SandboxError):
+    """Raised when a sandboxed job runs past its wall-clock timeout"""
+
+
+class _CPULimitExceeded(Exception):
+    pass
+
+
+def _on_cpu_limit(signum, frame):
+    raise _CPULimitExceeded()
+
+
+def _apply_limits(memory_mb):
+    """Cap the worker's address space and turn SIGXCPU into an exception"""
+    # Native thread pools reserve address space per thread; one is plenty here
+    for name in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ.setdefault(name, '1')
+    if resource is None:
+        return
+    if memory_mb:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = memory_mb * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    signal.signal(signal.SIGXCPU, _on_cpu_limit)
+
+
+def _set_cpu_budget(cpu_seconds):
+    """Allow the next job cpu_seconds of CPU time on top of what was used so far"""
+    if resource is None or not cpu_seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, memory_mb, cpu_seconds):
+    """Run (function, args) jobs from conn until it closes"""
+    _apply_limits(memory_mb)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        function, args = job
+        _set_cpu_budget(cpu_seconds)
+        try:
+            reply = ('ok', function(*args))
+        except MemoryError:
+            reply = ('error', f"Document needs more than the {memory_mb} MB memory limit")
+        except _CPULimitExceeded:
+            reply = ('error', f"Document needs more than the {cpu_seconds} s CPU time limit")
+        except Exception as e:
+            reply = ('error', str(e) or type(e).__name__)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send(('error', f"Result could not be returned: {str(e)}"))
+
+
+class _Worker:
+    def __init__(self, context, memory_mb, cpu_seconds):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, memory_mb, cpu_seconds), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def stop(self):
+        """Ask the worker to exit after its current job"""
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SandboxPool:
+    """A fixed number of recyclable worker processes running one job each.
+
+    run() blocks until a worker is free, so at most processes jobs run at
+    once. Workers are started on demand.
+    """
+
+    def __init__(self, processes=SANDBOX_PROCESSES, max_tasks=MAX_TASKS_PER_WORKER,
+                 timeout=JOB_TIMEOUT, memory_mb=MEMORY_LIMIT_MB, cpu_seconds=CPU_LIMIT):
+        self.max_tasks = max_tasks
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        # Never fork the multi-threaded server process itself. The fork
+        # server imports the analyzer and the job-description matcher's
+        # scikit-learn once, so recycled workers start warm
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            self.context = multiprocessing.get_context('forkserver')
+            self.context.set_forkserver_preload(['utils.resume_analyzer', 'sklearn.feature_extraction.text'])
+        else:
+            self.context = multiprocessing.get_context('spawn')
+        self.idle = queue.LifoQueue()
+        for _ in range(processes):
+            self.idle.put(None)
+        self.counters = {'jobs': 0, 'errors': 0, 'timeouts': 0, 'restarts': 0}
+
+    def run(self, function, *args):
+        """Run function(*args) in a worker and return its result.
+
+        function and args must be picklable. Raises SandboxTimeout when the
+        job runs past the timeout and SandboxError for any other failure.
+        """
+        worker = self.idle.get()
+        try:
+            if worker is not None and (worker.tasks >= self.max_tasks or not worker.process.is_alive()):
+                worker.stop()
+                worker = None
+            if worker is None:
+                worker = _Worker(self.context, self.memory_mb, self.cpu_seconds)
+                self.counters['restarts'] += 1
+            worker.tasks += 1
+            self.counters['jobs'] += 1
+
+            worker.conn.send((function, args))
+            if not worker.conn.poll(self.timeout):
+                worker.kill()
+                worker = None
+                self.counters['timeouts'] += 1
+                raise SandboxTimeout(f"Processing took longer than {self.timeout} s and was stopped")
+            try:
+                status, value = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.kill()
+                worker = None
+                self.counters['errors'] += 1
+                raise SandboxError("Worker process crashed while processing the document")
+        finally:
+            self.idle.put(worker)
+
+        if status != 'ok':
+            self.counters['errors'] += 1
+            raise SandboxError(value)
+        return value
+
+    def close(self):
+        """Stop all idle workers"""
+        while True:
+            try:
+                worker = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.stop()
+
+
+def address_space_peak_mb():
+    """Peak address space of the calling process in MB, or None without /proc"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmPeak:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def analyze_document(data, job_requirements, state=None, max_pages=MAX_PAGES):
+    """Extract and analyze one uploaded document; runs inside a worker.
+
+    Returns the encoded AnalysisResult together with the updated
+    AnalysisState and the stage timings recorded in the worker.
+    """
+    global _analyzer
+    from .resume_analyzer import ResumeAnalyzer
+    from .text_extraction import get_text_extractor
+    from .timing import record_timings, span
+    if _analyzer is None:
+        _analyzer = ResumeAnalyzer()
+
+    with record_timings() as timings:
+        with span('extract_text'):
+            text = get_text_extractor().extract_text(data, max_pages)
+        analysis = _analyzer.analyze_resume({'raw_text': text}, job_requirements, state)
+    return {
+        'analysis': analysis.to_bytes(),
+        'state': state,
+        'stages': timings.stages,
+        'info': timings.info
+    }
+
+
+def analyze_in_sandbox(data, job_requirements, state=None, max_pages=MAX_PAGES):
+    """Run analyze_document in the shared sandbox; returns (AnalysisResult, state)
+
+    Worker stage timings are merged into the caller's record_timings().
+    """
+    from .analysis_result import AnalysisResult
+    from .timing import current_timings
+
+    reply = get_sandbox().run(analyze_document, data, job_requirements, state, max_pages)
+    timings = current_timings()
+    if timings is not None:
+        for stage, ms in reply['stages'].items():
+            timings.add(stage, ms)
+        timings.info.update(reply['info'])
+    return AnalysisResult.from_bytes(reply['analysis']), reply['state']
+
+
+_sandbox = None
+_sandbox_lock = threading.Lock()
+
+
+def get_sandbox():
+    """Return the process-wide sandbox shared by all sessions"""
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            _sandbox = SandboxPool()
+        return _sandbox
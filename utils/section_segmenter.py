@@ -0,0 +1,173 @@
+import re
+from functools import lru_cache
+
+from .keyword_matcher import trie_regex
+
+# Header keywords for every section the analyzer extracts
+SECTION_KEYWORDS = {
+    'education': [
+        'education', 'academic', 'qualification', 'degree', 'university', 'college',
+        'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+        'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc', 'bca', 'mca', 'b.com',
+        'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+    ],
+    'experience': [
+        'experience', 'employment', 'work history', 'professional experience',
+        'work experience', 'career history', 'professional background',
+        'employment history', 'job history', 'positions held',
+        'job title', 'job responsibilities', 'job description', 'job summary'
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects',
+        'major projects', 'professional projects', 'project experience',
+        'relevant projects', 'featured projects', 'latest projects',
+        'top projects'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'competencies', 'expertise',
+        'core competencies', 'professional skills', 'key skills',
+        'technical expertise', 'proficiencies', 'qualifications',
+        'top skills', 'key skill', 'major skill', 'personal skill',
+        'soft skills', 'soft skill', 'soft skillset'
+    ],
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'objective',
+        'career objective', 'professional objective', 'about me', 'profile',
+        'professional profile', 'career profile', 'overview', 'skill summary'
+    ]
+}
+
+# Words that mark a document as a resume; each one also ends the section before it
+RESUME_KEYWORDS = [
+    'experience', 'education', 'skills', 'work', 'project', 'objective',
+    'summary', 'employment', 'qualification', 'achievements'
+]
+
+# Pseudo-section used for keywords that only mark a section boundary
+BOUNDARY = '_boundary'
+
+
+class SectionSegmenter:
+    """Split resume text into sections in a single pass over its lines.
+
+    All header keywords are compiled into one matcher, so each line is
+    classified exactly once no matter how many sections are tracked.
+    """
+
+    def __init__(self, section_keywords=None, boundary_keywords=()):
+        self.section_keywords = section_keywords or SECTION_KEYWORDS
+        self.sections = list(self.section_keywords)
+
+        # Map every keyword to the sections it belongs to
+        keyword_sections = {}
+        for section, keywords in self.section_keywords.items():
+            for keyword in keywords:
+                keyword_sections.setdefault(keyword.lower(), set()).add(section)
+        for keyword in boundary_keywords:
+            keyword_sections.setdefault(keyword.lower(), set()).add(BOUNDARY)
+
+        self.exact_headers = {
+            keyword: frozenset(sections - {BOUNDARY})
+            for keyword, sections in keyword_sections.items()
+        }
+
+        # The lookahead reports the longest keyword starting at each position,
+        # so shorter keywords that are prefixes of it are folded in here.
+        self.implied_sections = {}
+        for keyword in keyword_sections:
+            implied = set()
+            for other, sections in keyword_sections.items():
+                if keyword.startswith(other):
+                    implied |= sections
+            self.implied_sections[keyword] = frozenset(implied)
+
+        self.pattern = re.compile(trie_regex(keyword_sections))
+
+    def classify_line(self, line_lower):
+        """Return the set of sections (and BOUNDARY) whose keywords occur in the line"""
+        found = set()
+        search = self.pattern.search
+        match = search(line_lower)
+        while match:
+            found |= self.implied_sections[match.group()]
+            match = search(line_lower, match.start() + 1)
+        return found
+
+    def segment(self, text, classify=None, unsectioned=None):
+        """Return a map of section name to the list of entries found under it.
+
+        classify overrides classify_line, e.g. with a memoised version.
+        unsectioned, if given, is filled with the lines outside every section.
+        """
+        classify = classify or self.classify_line
+        result = {section: [] for section in self.sections}
+        current = {section: [] for section in self.sections}
+        active = []  # Sections we are currently inside, in declaration order
+
+        for line in text.split('\n'):
+            line = line.strip()
+            line_lower = line.lower()
+            found = classify(line_lower) if line else ()
+
+            if not found:
+                if line and not active and unsectioned is not None:
+                    unsectioned.append(line)
+                # Plain content line, only the open sections care about it
+                for section in active:
+                    entry = current[section]
+                    if line:
+                        entry.append(line)
+                    elif entry:  # Empty line and we have content
+                        result[section].append(' '.join(entry))
+                        current[section] = []
+                continue
+
+            exact = self.exact_headers.get(line_lower, frozenset())
+            closes = BOUNDARY in found
+            still_active = []
+            for section in self.sections:
+                entry = current[section]
+
+                # Check for section header
+                if section in found:
+                    if section not in exact:
+                        # This line contains section info, not just a header
+                        entry.append(line)
+                    still_active.append(section)
+                    continue
+
+                if section not in active:
+                    continue
+
+                # Any other resume keyword means we've hit another section
+                if closes:
+                    if entry:
+                        result[section].append(' '.join(entry))
+                        current[section] = []
+                    continue
+
+                entry.append(line)
+                still_active.append(section)
+            if not still_active and unsectioned is not None:
+                unsectioned.append(line)
+            active = still_active
+
+        for section, entry in current.items():
+            if entry:
+                result[section].append(' '.join(entry))
+
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_resume_segmenter():
+    """Return the segmenter for resumes, compiled once per process"""
+    return SectionSegmenter(SECTION_KEYWORDS, RESUME_KEYWORDS)
+
+
+def employment_text(experience, unsectioned):
+    """Text to read job date ranges from: experience entries and lines outside every section.
+
+    Date ranges elsewhere, such as the education section, are not jobs.
+    """
+    return '\n'.join(list(experience) + list(unsectioned))
@@ -0,0 +1,144 @@
+from functools import lru_cache
+
+from config.skills import SKILLS, SKILL_PARENTS, CATEGORY_HINTS
+from .keyword_matcher import get_keyword_matcher
+
+# Credit for a required skill that is only implied by a more specific one
+# (a role asks for SQL, the resume lists PostgreSQL)
+INFERRED_CREDIT = 0.8
+
+
+class SkillRegistry:
+    """Compiled lookup over the canonical skill registry.
+
+    Every alias is indexed in a dict for O(1) normalisation of a single
+    skill name, and the aliases that are safe in free text (text_aliases,
+    without the bare names of 'common_word' skills) are compiled into one
+    whole-word KeywordMatcher so that all skills mentioned in a text are
+    found in a single O(len(text)) pass.
+    Skill names are stored and compared as lower-cased canonical names
+    ("javascript"); display_name() turns them back into "JavaScript".
+
+    Each skill also owns one bit of an integer bitset, and the transitive
+    ancestors of every skill in the hierarchy are precomputed into a mask,
+    so expanding a resume's skills to everything they imply is one OR per
+    skill found, whatever the size of the taxonomy.
+    """
+
+    def __init__(self, skills=SKILLS, parents=SKILL_PARENTS, category_hints=CATEGORY_HINTS):
+        self.skills = skills
+        self.category_hints = category_hints
+        self.aliases = {}
+        self.text_aliases = {}
+        for canonical, info in skills.items():
+            for alias in [canonical] + info['aliases']:
+                self.aliases.setdefault(self.clean(alias), canonical)
+            for alias in ([] if info.get('common_word') else [canonical]) + info['aliases']:
+                self.text_aliases.setdefault(self.clean(alias), canonical)
+        self.known_keys = frozenset(canonical.lower() for canonical in skills)
+        self.normalized = {}  # Raw skill name -> key, filled on demand
+        self.matcher = get_keyword_matcher(tuple(self.text_aliases), whole_words=True)
+
+        self.bits = {canonical.lower(): 1 << index for index, canonical in enumerate(skills)}
+        self.closure = self._ancestor_closure(parents)
+
+    def _ancestor_closure(self, parents):
+        """Map every skill key to the bitmask of itself and all its ancestors"""
+        for child, direct_parents in parents.items():
+            for skill in [child] + direct_parents:
+                if skill not in self.skills:
+                    raise ValueError(f"Unknown skill in SKILL_PARENTS: {skill}")
+
+        closure = {}
+
+        def visit(skill, path):
+            if skill in closure:
+                return closure[skill]
+            if skill in path:
+                raise ValueError(f"Cycle in SKILL_PARENTS at {skill}")
+            mask = self.bits[skill.lower()]
+            for parent in parents.get(skill, []):
+                mask |= visit(parent, path | {skill})
+            closure[skill] = mask
+            return mask
+
+        for skill in self.skills:
+            visit(skill, frozenset())
+        return {skill.lower(): mask for skill, mask in closure.items()}
+
+    @staticmethod
+    def clean(name):
+        """Lower-case a raw skill string and strip list/quote debris around it"""
+        return ' '.join(str(name).strip(' \'"[]').lower().split())
+
+    def canonical(self, name):
+        """Return the canonical spelling of a skill, or None if it is unknown"""
+        return self.aliases.get(self.clean(name))
+
+    def normalize(self, name):
+        """Return the storage key for a skill: its lower-cased canonical name"""
+        key = self.normalized.get(name)
+        if key is None:
+            canonical = self.canonical(name)
+            key = canonical.lower() if canonical else self.clean(name)
+            if len(self.normalized) < 100000:
+                self.normalized[name] = key
+        return key
+
+    def display_name(self, name):
+        """Return the canonical spelling, or a title-cased name for unknown skills"""
+        return self.canonical(name) or str(name).strip().title()
+
+    def category(self, name):
+        """Return the registry category of a skill, guessing for unknown skills"""
+        canonical = self.canonical(name)
+        if canonical:
+            return self.skills[canonical]['category']
+        key = self.clean(name)
+        for category, hints in self.category_hints:
+            if any(hint in key for hint in hints):
+                return category
+        return 'Other'
+
+    def find(self, text):
+        """Return the canonical names of every registry skill mentioned in text"""
+        return {self.aliases[alias] for alias in self.matcher.find_lower(text.lower())}
+
+    def skill_credits(self, text, skills, found_aliases=None):
+        """Return {skill key: credit} for those skills that the text covers.
+
+        A skill mentioned directly (through any alias) earns 1.0; a skill
+        that is only an ancestor of one mentioned earns INFERRED_CREDIT.
+        Skills the registry does not know fall back to case-insensitive
+        substring matching, compiled once per distinct list.
+        found_aliases may pass in an already computed self.matcher scan.
+        """
+        text_lower = text.lower()
+        keys = {self.normalize(skill) for skill in skills}
+        if found_aliases is None:
+            found_aliases = self.matcher.find_lower(text_lower)
+
+        direct = expanded = 0
+        for alias in found_aliases:
+            key = self.aliases[alias].lower()
+            direct |= self.bits[key]
+            expanded |= self.closure[key]
+
+        credits = {}
+        unknown = tuple(sorted(keys - self.known_keys))
+        if unknown:
+            for key in get_keyword_matcher(unknown).find_lower(text_lower):
+                credits[key] = 1.0
+        for key in keys & self.known_keys:
+            bit = self.bits[key]
+            if direct & bit:
+                credits[key] = 1.0
+            elif expanded & bit:
+                credits[key] = INFERRED_CREDIT
+        return credits
+
+
+@lru_cache(maxsize=1)
+def get_skill_registry():
+    """Return the process-wide compiled skill registry"""
+    return SkillRegistry()
@@ -0,0 +1,115 @@
+import codecs
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from .docx_extractor import extract_docx_text
+from .pdf_extractor import extract_pdf_text, MAX_PAGES
+
+PDF_MAGIC = b'%PDF-'
+# PDF readers accept the header anywhere in the first kilobyte
+PDF_HEADER_WINDOW = 1024
+ZIP_MAGIC = b'PK\x03\x04'
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # Legacy .doc and other Office 97 files
+
+
+class UnsupportedFormatError(ValueError):
+    """Raised for uploads that are neither PDF, DOCX nor plain text"""
+
+
+def read_payload(source):
+    """Read a path or file object into bytes, once; bytes-like objects are used in place.
+
+    A bytearray or memoryview comes back as a read-only memoryview over the
+    caller's buffer, which the backends read without copying.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read()
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return memoryview(source).cast('B').toreadonly()
+    if hasattr(source, 'getvalue'):
+        # Streamlit's UploadedFile and BytesIO already hold the whole file
+        return source.getvalue()
+    source.seek(0)
+    return source.read()
+
+
+def sniff_format(data):
+    """Return 'pdf', 'docx' or 'text' from the leading bytes of a document"""
+    data = bytes(data[:PDF_HEADER_WINDOW])
+    if PDF_MAGIC in data:
+        return 'pdf'
+    if data.startswith(ZIP_MAGIC):
+        return 'docx'
+    if data.startswith(OLE_MAGIC):
+        raise UnsupportedFormatError("Legacy .doc files are not supported, please save the file as DOCX or PDF")
+    if b'\x00' in data:
+        raise UnsupportedFormatError("Unrecognized binary file, please upload a PDF or DOCX")
+    return 'text'
+
+
+def _decode_text(data, max_pages=None):
+    try:
+        return codecs.decode(data, 'utf-8-sig')
+    except UnicodeDecodeError:
+        return codecs.decode(data, 'cp1252', errors='replace')
+
+
+class TextExtractor:
+    """Single entry point for turning an uploaded document into text.
+
+    The format is sniffed from the document's magic bytes rather than
+    trusted from its file name or browser-reported MIME type, the payload
+    is read once and handed to the format's backend as a shared buffer,
+    and the extracted text is memoised in a bounded LRU keyed by the
+    SHA-256 of the bytes, so every caller that sees the same upload gets
+    the same text without parsing it again.
+    """
+
+    backends = {
+        'pdf': lambda data, max_pages: extract_pdf_text(data, max_pages=max_pages),
+        'docx': lambda data, max_pages: extract_docx_text(data),
+        'text': _decode_text
+    }
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0}
+
+    def extract_document(self, source, max_pages=MAX_PAGES):
+        """Return (file_type, text) for a path, bytes-like object or file object"""
+        data = read_payload(source)
+        key = (hashlib.sha256(data).digest(), max_pages)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return entry
+            self.counters['misses'] += 1
+
+        file_type = sniff_format(data)
+        entry = (file_type, self.backends[file_type](data, max_pages))
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+    def extract_text(self, source, max_pages=MAX_PAGES):
+        """Return the text of a path, bytes-like object or file object"""
+        return self.extract_document(source, max_pages)[1]
+
+
+@lru_cache(maxsize=1)
+def get_text_extractor():
+    """Return the process-wide text extractor"""
+    return TextExtractor()
@@ -0,0 +1,181 @@
+"""
+Per-stage timing of the analysis pipeline.
+
+Wrap one analysis in record_timings() and mark its stages with span():
+
+    with record_timings() as timings:
+        with span('extract_text'):
+            text = extract(...)
+    save_timings(timings)
+
+The active recorder is kept per thread, so instrumented code such as the
+PDF extractor needs no extra arguments. Outside record_timings() span()
+returns a shared no-op and note() does nothing, which keeps the
+instrumentation cheap enough to leave on.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Rows summarized by the admin dashboard panel
+SUMMARY_DAYS = 7
+SUMMARY_MAX_ROWS = 20000
+
+# (upper bound, label) used to group PDFs into document classes by length
+PAGE_BUCKETS = [(1, '1 page'), (3, '2-3 pages'), (10, '4-10 pages'), (None, '11+ pages')]
+
+_local = threading.local()
+
+
+class AnalysisTimings:
+    """Stage durations (ms) and document facts collected for one analysis"""
+
+    def __init__(self):
+        self.stages = {}
+        self.info = {}
+        self.started = time.perf_counter()
+        self.total_ms = None
+
+    def add(self, stage, ms):
+        """Add ms to a stage, so a repeated stage accumulates"""
+        self.stages[stage] = self.stages.get(stage, 0) + ms
+
+
+class _Span:
+    __slots__ = ('timings', 'stage', 'start')
+
+    def __init__(self, timings, stage):
+        self.timings = timings
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timings.add(self.stage, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def current_timings():
+    """Return the recorder of the analysis running in this thread, or None"""
+    return getattr(_local, 'timings', None)
+
+
+def span(stage):
+    """Context manager timing one stage of the current analysis"""
+    timings = getattr(_local, 'timings', None)
+    if timings is None:
+        return _NO_SPAN
+    return _Span(timings, stage)
+
+
+def note(**info):
+    """Attach document facts (size, page count...) to the current analysis"""
+    timings = getattr(_local, 'timings', None)
+    if timings is not None:
+        timings.info.update(info)
+
+
+@contextmanager
+def record_timings():
+    """Collect the spans of everything run in this thread inside the block"""
+    previous = current_timings()
+    timings = _local.timings = AnalysisTimings()
+    try:
+        yield timings
+    finally:
+        timings.total_ms = (time.perf_counter() - timings.started) * 1000
+        _local.timings = previous
+
+
+def save_timings(timings):
+    """Store one analysis' timings in the analysis_timings table"""
+    from config.database import get_database_connection
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        INSERT INTO analysis_timings (
+            file_type, document_type, size_bytes, page_count,
+            text_chars, total_ms, stages
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            timings.info.get('file_type'),
+            timings.info.get('document_type'),
+            timings.info.get('size_bytes'),
+            timings.info.get('page_count'),
+            timings.info.get('text_chars'),
+            timings.total_ms,
+            json.dumps({stage: round(ms, 3) for stage, ms in timings.stages.items()})
+        ))
+        conn.commit()
+    except Exception as e:
+        print(f"Error saving analysis timings: {str(e)}")
+        conn.rollback()
+
+
+def document_class(file_type, page_count):
+    """Label used to group analyses, e.g. 'pdf, 2-3 pages'"""
+    file_type = file_type or 'unknown'
+    if not page_count:
+        return file_type
+    for limit, label in PAGE_BUCKETS:
+        if limit is None or page_count <= limit:
+            return f"{file_type}, {label}"
+
+
+def _percentiles(values):
+    import numpy as np
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'count': len(values), 'p50': round(float(p50), 2), 'p95': round(float(p95), 2), 'p99': round(float(p99), 2)}
+
+
+def get_timing_summary(days=SUMMARY_DAYS, max_rows=SUMMARY_MAX_ROWS):
+    """Return p50/p95/p99 (ms) per stage and per document class.
+
+    Only the latest max_rows analyses of the last days days are read.
+    """
+    from config.database import get_database_connection
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        SELECT file_type, page_count, total_ms, stages
+        FROM analysis_timings
+        WHERE created_at >= DATETIME('now', ?)
+        ORDER BY created_at DESC
+        LIMIT ?
+        ''', (f'-{int(days)} days', max_rows))
+        rows = cursor.fetchall()
+    except Exception as e:
+        print(f"Error reading analysis timings: {str(e)}")
+        return {'count': 0, 'stages': {}, 'classes': {}}
+
+    stage_values = {'total': []}
+    class_values = {}
+    for file_type, page_count, total_ms, stages in rows:
+        stage_values['total'].append(total_ms)
+        for stage, ms in json.loads(stages).items():
+            stage_values.setdefault(stage, []).append(ms)
+        class_values.setdefault(document_class(file_type, page_count), []).append(total_ms)
+
+    return {
+        'count': len(rows),
+        'stages': {stage: _percentiles(values) for stage, values in stage_values.items() if values},
+        'classes': {label: _percentiles(values) for label, values in sorted(class_values.items())}
+    }